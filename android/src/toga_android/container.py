@@ -39,6 +39,9 @@ class Container(Scalable):
             if self.content:
                 self.content.interface.refresh()
 
+    def refreshing(self):
+        pass
+
     def refreshed(self):
         # We must use the correct LayoutParams class, but we don't know what that class
         # is, so reuse the existing object. Calling the constructor of type(lp) is also
@@ -12,7 +12,7 @@ class MultilineTextInput(TextInput):
         )
 
     def _on_change(self):
-        self.interface.on_change()
+        self.interface._value_changed()
 
     def _on_confirm(self):  # pragma: nocover
         pass  # The interface doesn't support this event.
@@ -31,6 +31,19 @@ class MultilineTextInput(TextInput):
         self.interface.intrinsic.width = at_least(self.interface._MIN_WIDTH)
         self.interface.intrinsic.height = at_least(self.interface._MIN_HEIGHT)
 
+    def append(self, value):
+        # Only follow the new text if the view is already scrolled to the bottom.
+        at_bottom = not self.native.canScrollVertically(1)
+        self.native.append(value)
+        if at_bottom:
+            self.scroll_to_bottom()
+
+    def remove_lines(self, count):
+        value = self.get_value()
+        removed = value[: len(value) - len(value.split("\n", count)[-1])]
+        # Offsets are measured in UTF-16 code units.
+        self.native.getText().delete(0, len(removed.encode("utf-16-le")) // 2)
+
     def scroll_to_bottom(self):
         self.native.setSelection(self.native.length())
 
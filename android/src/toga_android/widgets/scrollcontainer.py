@@ -26,7 +26,7 @@ class TogaOnScrollListener(dynamic_proxy(View.OnScrollChangeListener)):
         self.impl = impl
 
     def onScrollChange(self, view, new_x, new_y, old_x, old_y):
-        self.impl.interface.on_scroll()
+        self.impl.interface._scrolled()
 
 
 class ScrollContainer(Widget, Container):
@@ -63,6 +63,7 @@ class ScrollContainer(Widget, Container):
             self.scale_in(width, ROUND_DOWN),
             self.scale_in(height, ROUND_DOWN),
         )
+        self.interface._resized()
 
     def get_vertical(self):
         return self.vScrollListener.is_scrolling_enabled
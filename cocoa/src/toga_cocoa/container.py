@@ -107,6 +107,9 @@ class Container:
         if widget:
             widget.container = self
 
+    def refreshing(self):
+        pass
+
     def refreshed(self):
         self.on_refresh(self)
 
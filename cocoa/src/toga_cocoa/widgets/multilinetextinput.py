@@ -5,6 +5,7 @@ from toga.colors import TRANSPARENT
 from toga_cocoa.colors import native_color
 from toga_cocoa.libs import (
     NSBezelBorder,
+    NSRange,
     NSScrollView,
     NSTextAlignment,
     NSTextView,
@@ -21,7 +22,7 @@ class TogaTextView(NSTextView):
 
     @objc_method
     def textDidChange_(self, notification) -> None:
-        self.interface.on_change()
+        self.interface._value_changed()
 
 
 class MultilineTextInput(Widget):
@@ -80,6 +81,31 @@ class MultilineTextInput(Widget):
         self.native_text.string = value
         self.interface.on_change()
 
+    def append(self, value):
+        # Only follow the new text if the view is already scrolled to the bottom.
+        visible = self.native.documentVisibleRect
+        at_bottom = (
+            visible.origin.y + visible.size.height
+            >= self.native_text.bounds.size.height - 1
+        )
+
+        self.native_text.replaceCharactersInRange(
+            NSRange(self.native_text.textStorage.length, 0), withString=value
+        )
+        self.interface.on_change()
+
+        if at_bottom:
+            self.native_text.scrollToEndOfDocument(None)
+
+    def remove_lines(self, count):
+        value = self.get_value()
+        removed = value[: len(value) - len(value.split("\n", count)[-1])]
+        # Ranges are measured in UTF-16 code units.
+        self.native_text.replaceCharactersInRange(
+            NSRange(0, len(removed.encode("utf-16-le")) // 2), withString=""
+        )
+        self.interface.on_change()
+
     def set_color(self, value):
         self.native_text.textColor = native_color(value)
 
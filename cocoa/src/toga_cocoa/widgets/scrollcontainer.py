@@ -22,7 +22,7 @@ class TogaScrollView(NSScrollView):
 
     @objc_method
     def didScroll_(self, note) -> None:
-        self.interface.on_scroll()
+        self.interface._scrolled()
 
     @objc_method
     def refreshContent(self):
@@ -80,6 +80,7 @@ class ScrollContainer(Widget):
         self.native.performSelector(
             SEL("refreshContent"), withObject=None, afterDelay=0
         )
+        self.interface._resized()
 
     def content_refreshed(self, container):
         width = self.native.frame.size.width
@@ -109,7 +110,7 @@ class ScrollContainer(Widget):
 
         # Disabling scrolling implies a position reset; that's a scroll event.
         if not value:
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def get_horizontal(self):
         return self.native.hasHorizontalScroller
@@ -123,7 +124,7 @@ class ScrollContainer(Widget):
 
         # Disabling scrolling implies a position reset; that's a scroll event.
         if not value:
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def rehint(self):
         self.interface.intrinsic.width = at_least(self.interface._MIN_WIDTH)
@@ -161,4 +162,4 @@ class ScrollContainer(Widget):
         new_position = NSMakePoint(horizontal_position, vertical_position)
         self.native.contentView.scrollToPoint(new_position)
         self.native.reflectScrolledClipView(self.native.contentView)
-        self.interface.on_scroll()
+        self.interface._scrolled()
@@ -0,0 +1,73 @@
+"""Benchmark the imports performed by a minimal app.
+
+Run from the ``core`` directory, naming the backends to measure (by default, the
+dummy backend)::
+
+    $ python benchmarks/importtime.py toga_dummy toga_gtk
+
+For each backend, a minimal app (a window containing a button) is created in a
+fresh interpreter using ``python -X importtime``. This reports the total time
+spent importing modules, the number of modules imported, and the modules with the
+largest cumulative import time.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+# The number of times each app is started; the fastest run is reported.
+REPEAT = 5
+
+# The number of modules with the largest cumulative import time to report.
+LIMIT = 15
+
+APP = """
+import toga
+
+app = toga.App("Import benchmark", "org.beeware.toga.benchmark.importtime")
+window = toga.Window(content=toga.Box(children=[toga.Button("Hello")]))
+"""
+
+
+def importtime(backend: str) -> list[tuple[str, int, int]]:
+    """Start a minimal app with a backend, returning the modules that were imported,
+    as tuples of (module name, self time, cumulative time) in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", APP],
+        env={**os.environ, "TOGA_BACKEND": backend},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Unable to start an app with {backend}:\n{result.stderr}")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            self_time, cumulative, name = line[len("import time:") :].split("|")
+            if self_time.strip().isdigit():
+                modules.append((name.strip(), int(self_time), int(cumulative)))
+    return modules
+
+
+def benchmark(backend: str) -> None:
+    runs = [importtime(backend) for _ in range(REPEAT)]
+    modules = min(runs, key=lambda run: sum(self_time for _, self_time, _ in run))
+    total = sum(self_time for _, self_time, _ in modules)
+
+    print(f"{backend} ({len(modules)} modules)")
+    print(f"    {'total import time':<40} {total / 1000:10.3f} ms")
+    slowest = sorted(modules, key=lambda module: module[2], reverse=True)
+    for name, _, cumulative in slowest[:LIMIT]:
+        print(f"    {name:<40} {cumulative / 1000:10.3f} ms")
+
+
+def main() -> None:
+    for backend in sys.argv[1:] or ["toga_dummy"]:
+        benchmark(backend)
+
+
+if __name__ == "__main__":
+    main()
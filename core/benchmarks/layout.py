@@ -0,0 +1,118 @@
+"""Benchmark the layout of large widget trees.
+
+Run with the dummy backend from the ``core`` directory::
+
+    $ TOGA_BACKEND=toga_dummy python benchmarks/layout.py
+
+For deep and wide synthetic trees, this reports the time taken to lay out the
+tree from scratch, to lay it out again when nothing has changed, to lay it out
+after the intrinsic size of a single leaf has changed, and to lay it out as the
+viewport is resized. The deepest tree is deeper than Python's default recursion
+limit.
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+
+os.environ.setdefault("TOGA_BACKEND", "toga_dummy")
+
+from travertino.size import at_least  # noqa: E402
+
+import toga  # noqa: E402
+from toga.style.pack import COLUMN, ROW, Pack  # noqa: E402
+
+
+def deep_tree(depth: int) -> tuple[toga.Box, toga.Widget]:
+    """A chain of nested boxes, each containing a label and the next box."""
+    root = box = toga.Box(style=Pack(direction=COLUMN))
+    for level in range(depth):
+        child = toga.Box(style=Pack(direction=ROW if level % 2 else COLUMN, flex=1))
+        box.add(toga.Label(f"Level {level}"), child)
+        box = child
+    leaf = toga.Label("Leaf")
+    box.add(leaf)
+    return root, leaf
+
+
+def wide_tree(rows: int, columns: int) -> tuple[toga.Box, toga.Widget]:
+    """A column of rows, each containing a number of labels."""
+    root = toga.Box(style=Pack(direction=COLUMN))
+    for row in range(rows):
+        root.add(
+            toga.Box(
+                style=Pack(direction=ROW),
+                children=[
+                    toga.Label(f"{row},{column}", style=Pack(flex=1))
+                    for column in range(columns)
+                ],
+            )
+        )
+    return root, root.children[rows // 2].children[columns // 2]
+
+
+def layout(root: toga.Widget, viewport: object) -> None:
+    root.style.layout(root, viewport)
+
+
+def invalidate(root: toga.Widget) -> None:
+    """Mark every node in the tree as needing layout."""
+    for node in iterate(root):
+        node.layout._dirty = True
+
+
+def benchmark(name: str, root: toga.Widget, leaf: toga.Widget, number: int) -> None:
+    class Viewport:
+        width = 1024
+        height = 768
+
+    count = sum(1 for _ in iterate(root))
+
+    def full():
+        invalidate(root)
+        layout(root, Viewport)
+
+    def unchanged():
+        layout(root, Viewport)
+
+    def leaf_changed():
+        leaf.intrinsic.width = at_least(
+            20 if leaf.intrinsic.width == at_least(10) else 10
+        )
+        layout(root, Viewport)
+
+    def resized():
+        Viewport.width = 1030 if Viewport.width == 1024 else 1024
+        layout(root, Viewport)
+
+    print(f"{name} ({count} widgets)")
+    for label, func in [
+        ("full layout", full),
+        ("unchanged", unchanged),
+        ("one leaf changed", leaf_changed),
+        ("viewport resized", resized),
+    ]:
+        elapsed = min(timeit.repeat(func, number=number, repeat=3)) / number
+        print(f"    {label:<20} {elapsed * 1000:10.3f} ms")
+
+
+def iterate(node: toga.Widget):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+
+def main() -> None:
+    toga.App("Layout benchmark", "org.beeware.toga.benchmark.layout")
+
+    benchmark("Deep tree", *deep_tree(200), number=20)
+    # Deeper than the default recursion limit.
+    benchmark("Very deep tree", *deep_tree(2000), number=5)
+    benchmark("Wide tree", *wide_tree(100, 40), number=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the snapshot of the style properties used by the layout algorithm.
+
+Run with the dummy backend from the ``core`` directory::
+
+    $ TOGA_BACKEND=toga_dummy python benchmarks/resolved_style.py
+
+The layout algorithm reads the properties it uses from a snapshot of each style
+(``Pack._resolved``), rather than from the style declaration. The snapshot has the
+same attribute names as the declaration, so the effect of the snapshot can be
+isolated by pointing each style's snapshot back at the declaration itself. For each
+tree, this reports the time taken to read every snapshot property of every node,
+and to lay out the tree from scratch, with and without the snapshot.
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+
+os.environ.setdefault("TOGA_BACKEND", "toga_dummy")
+
+from layout import deep_tree, invalidate, iterate, layout, wide_tree  # noqa: E402
+
+import toga  # noqa: E402
+from toga.style.pack import _ResolvedStyle  # noqa: E402
+
+
+class Viewport:
+    width = 1024
+    height = 768
+
+
+def use_snapshot(root: toga.Widget, enabled: bool) -> None:
+    """Make the layout read properties from the snapshot, or from the declaration."""
+    for node in iterate(root):
+        node.style._resolved = _ResolvedStyle(node.style) if enabled else node.style
+
+
+def benchmark(name: str, root: toga.Widget, number: int) -> None:
+    nodes = list(iterate(root))
+    properties = _ResolvedStyle.__slots__
+
+    def read():
+        for node in nodes:
+            resolved = node.style._resolved
+            for prop in properties:
+                getattr(resolved, prop)
+
+    def full():
+        invalidate(root)
+        layout(root, Viewport)
+
+    print(f"{name} ({len(nodes)} widgets)")
+    results = {}
+    for enabled in [False, True]:
+        use_snapshot(root, enabled)
+        for label, func in [
+            ("read properties", read),
+            ("full layout", full),
+        ]:
+            elapsed = min(timeit.repeat(func, number=number, repeat=3)) / number
+            results.setdefault(label, []).append(elapsed)
+
+    print(f"    {'':<20} {'declaration':>14} {'snapshot':>14}")
+    for label, (before, after) in results.items():
+        print(
+            f"    {label:<20} {before * 1000:11.3f} ms {after * 1000:11.3f} ms"
+            f" ({before / after:.1f}x)"
+        )
+
+
+def main() -> None:
+    toga.App("Style snapshot benchmark", "org.beeware.toga.benchmark.resolved")
+
+    benchmark("Deep tree", deep_tree(200)[0], number=20)
+    benchmark("Wide tree", wide_tree(100, 40)[0], number=5)
+
+
+if __name__ == "__main__":
+    main()
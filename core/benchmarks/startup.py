@@ -0,0 +1,82 @@
+"""Benchmark the startup of a minimal app on the dummy backend.
+
+Run from the ``core`` directory::
+
+    $ python benchmarks/startup.py
+
+Each run starts a fresh interpreter, and reports the time taken to import toga,
+to import the backend, and to create an app. If a maximum time (in milliseconds)
+is provided, the benchmark fails if starting the app takes longer than that::
+
+    $ python benchmarks/startup.py --max 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# The number of times the app is started; the fastest time for each step is
+# reported.
+REPEAT = 10
+
+APP = """
+import json
+from time import perf_counter
+
+start = perf_counter()
+import toga
+imported = perf_counter()
+import toga_dummy
+backend = perf_counter()
+toga.App("Startup benchmark", "org.beeware.toga.benchmark.startup")
+created = perf_counter()
+
+print(json.dumps({
+    "import toga": imported - start,
+    "import backend": backend - imported,
+    "create app": created - backend,
+    "total": created - start,
+}))
+"""
+
+
+def startup() -> dict[str, float]:
+    """Start the app in a fresh interpreter, returning the time taken by each step,
+    in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-c", APP],
+        env={**os.environ, "TOGA_BACKEND": "toga_dummy"},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Unable to start the app:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--max",
+        type=float,
+        help="The maximum time, in milliseconds, that starting the app may take.",
+    )
+    args = parser.parse_args()
+
+    runs = [startup() for _ in range(REPEAT)]
+    fastest = {step: min(run[step] for run in runs) for step in runs[0]}
+
+    print(f"Startup ({REPEAT} runs)")
+    for step, elapsed in fastest.items():
+        print(f"    {step:<20} {elapsed * 1000:10.3f} ms")
+
+    if args.max is not None and fastest["total"] * 1000 > args.max:
+        sys.exit(f"Starting the app took longer than {args.max} ms")
+
+
+if __name__ == "__main__":
+    main()
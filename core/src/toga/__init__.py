@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import sys
 import warnings
 from pathlib import Path
 
@@ -55,6 +56,7 @@ toga_core_imports = {
     "Divider": "toga.widgets.divider",
     "ImageView": "toga.widgets.imageview",
     "Label": "toga.widgets.label",
+    "ListView": "toga.widgets.listview",
     "MapPin": "toga.widgets.mapview",
     "MapView": "toga.widgets.mapview",
     "MultilineTextInput": "toga.widgets.multilinetextinput",
@@ -83,6 +85,9 @@ __all__ = list(toga_core_imports.keys())
 
 
 def __getattr__(name):
+    if name == "__version__":
+        return _version(__file__, __name__)
+
     try:
         module_name = toga_core_imports[name]
     except KeyError:
@@ -128,4 +133,9 @@ def _package_version(file: Path | str | None, name: str) -> str:
         return importlib.metadata.version(package)
 
 
-__version__ = _package_version(__file__, __name__)
+def _version(file: Path | str | None, name: str) -> str:
+    # Determining the version of a package can be slow, so it is only done when
+    # ``__version__`` is first accessed; the value is then stored on the module.
+    version = _package_version(file, name)
+    setattr(sys.modules[name], "__version__", version)
+    return version
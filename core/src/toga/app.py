@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import importlib.metadata
+import os
 import signal
 import sys
 import warnings
@@ -22,6 +23,7 @@ from toga.paths import Paths
 from toga.platform import get_platform_factory
 from toga.screens import Screen
 from toga.statusicons import StatusIconSet
+from toga.style import stats as layout_stats
 from toga.widgets.base import Widget
 from toga.window import MainWindow, Window, WindowSet
 
@@ -119,8 +121,14 @@ class WidgetRegistry:
 
     # Private methods for internal use
     def _update(self, widgets: list[Widget]) -> None:
+        # Verify all the IDs before adding any widgets, so that the registry isn't
+        # modified if any of the IDs aren't unique.
+        ids = set()
         for widget in widgets:
-            self._add(widget)
+            if widget.id in self._registry or widget.id in ids:
+                raise KeyError(f"There is already a widget with the id {widget.id!r}")
+            ids.add(widget.id)
+        self._registry.update((widget.id, widget) for widget in widgets)
 
     def _add(self, widget: Widget) -> None:
         if widget.id in self._registry:
@@ -131,6 +139,10 @@ class WidgetRegistry:
     def _remove(self, id: str) -> None:
         del self._registry[id]
 
+    def _remove_all(self, widgets: list[Widget]) -> None:
+        for widget in widgets:
+            del self._registry[widget.id]
+
 
 class App:
     #: The currently running :class:`~toga.App`. Since there can only be one running
@@ -309,6 +321,10 @@ class App:
         # Get a platform factory.
         self.factory = get_platform_factory()
 
+        # Collect layout statistics, if requested.
+        if os.environ.get("TOGA_LAYOUT_STATS") == "1":
+            layout_stats.enable(dump_interval=layout_stats.DUMP_INTERVAL)
+
         # Instantiate the paths instance for this app.
         self._paths = Paths()
 
@@ -26,6 +26,25 @@ class FillRule(Enum):
     NONZERO = 1
 
 
+##########################################################################
+# Window
+##########################################################################
+
+
+class ResizePolicy(Enum):
+    """How the content of a window is laid out while the window is being resized."""
+
+    #: The content is laid out for every change in size.
+    IMMEDIATE = 0
+
+    #: While the size is changing rapidly (e.g., while the user is resizing the window,
+    #: or dragging the divider of a SplitContainer), the content is laid out for
+    #: intermediate sizes at a limited rate; it is laid out for the final size once
+    #: the size stops changing. Backends that can't throttle layouts treat this as
+    #: ``IMMEDIATE``.
+    THROTTLED = 1
+
+
 ##########################################################################
 # Camera
 ##########################################################################
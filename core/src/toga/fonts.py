@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from weakref import WeakValueDictionary
 
 # Use the Travertino font definitions as-is
 from travertino import constants
@@ -31,8 +32,33 @@ FONT_VARIANTS = {NORMAL, SMALL_CAPS}
 
 _REGISTERED_FONT_CACHE: dict[tuple[str, str, str, str], str] = {}
 
+# Fonts are interned, so that all the references to a font share a single instance
+# (and a single backend implementation) for as long as any of them are in use.
+_FONT_INSTANCES: WeakValueDictionary[tuple, Font] = WeakValueDictionary()
+
 
 class Font(BaseFont):
+    def __new__(
+        cls,
+        family: str,
+        size: int | str,
+        *,
+        weight: str = NORMAL,
+        style: str = NORMAL,
+        variant: str = NORMAL,
+    ) -> Font:
+        # Fonts are interned using the normalized properties of the font, so that
+        # equal fonts share an instance, however they were described.
+        font = BaseFont(family, size, weight=weight, style=style, variant=variant)
+        try:
+            return _FONT_INSTANCES[cls._intern_key(font)]
+        except KeyError:
+            return super().__new__(cls)
+
+    @classmethod
+    def _intern_key(cls, font: BaseFont) -> tuple:
+        return (cls, font.family, font.size, font.weight, font.style, font.variant)
+
     def __init__(
         self,
         family: str,
@@ -54,10 +80,16 @@ class Font(BaseFont):
         :param style: The :ref:`font style <pack-font-style>`.
         :param variant: The :ref:`font variant <pack-font-variant>`.
         """
+        if hasattr(self, "_impl"):
+            # This is an existing instance of the font.
+            return
+
         super().__init__(family, size, weight=weight, style=style, variant=variant)
         self.factory = get_platform_factory()
         self._impl = self.factory.Font(self)
 
+        _FONT_INSTANCES[self._intern_key(self)] = self
+
     def __str__(self) -> str:
         size = (
             "default size"
@@ -92,6 +124,17 @@ class Font(BaseFont):
         font_key = Font._registered_font_key(family, weight, style, variant)
         _REGISTERED_FONT_CACHE[font_key] = str(toga.App.app.paths.app / path)
 
+        # The implementation of a font that is already in use may have been created
+        # without the registered file; any new reference to the font should use it.
+        for key, font in list(_FONT_INSTANCES.items()):
+            if (
+                Font._registered_font_key(
+                    font.family, font.weight, font.style, font.variant
+                )
+                == font_key
+            ):
+                del _FONT_INSTANCES[key]
+
     @staticmethod
     def _registered_font_key(
         family: str,
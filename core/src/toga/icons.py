@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 import warnings
 from collections.abc import Callable, Iterable
@@ -42,6 +43,72 @@ class cachedicon:
 _APP_ICON = "<app icon>"
 
 
+class _ResourceDirectory:
+    def __init__(self, path: Path, mtime: int | None):
+        """An index of the files in a directory that is searched for icons.
+
+        :param path: The directory to index.
+        :param mtime: The modification time of the directory, or :any:`None` if the
+            directory doesn't exist.
+        """
+        self.path = path
+        self.mtime = mtime
+        try:
+            names = os.listdir(path)
+        except OSError:
+            # The directory doesn't exist, or can't be read.
+            names = []
+        # os.path.normcase only folds case on Windows, but the filesystem may also be
+        # case-insensitive elsewhere (e.g., on macOS); in that case, the index is
+        # case-folded, so that it can answer every lookup without asking the
+        # filesystem.
+        self.case_insensitive = bool(names) and self._is_case_insensitive(names)
+        self.names = {self._key(name) for name in names}
+        # The icon paths that have been resolved in this directory, keyed by the
+        # details of the request.
+        self.icons: dict[tuple[object, ...], dict[int, Path] | Path | None] = {}
+
+    def _is_case_insensitive(self, names: list[str]) -> bool:
+        """Determine whether the directory is on a case-insensitive filesystem, by
+        looking for one of its entries with the case of the name swapped.
+
+        :param names: The names of the entries in the directory.
+        """
+        for name in names:
+            swapped = name.swapcase()
+            if swapped != name:
+                return swapped not in names and (self.path / swapped).exists()
+
+        # None of the entries have a case; use the name of the directory instead.
+        swapped = self.path.name.swapcase()
+        return swapped != self.path.name and self.path.with_name(swapped).exists()
+
+    def _key(self, name: str) -> str:
+        if self.case_insensitive:
+            return name.casefold()
+        return os.path.normcase(name)
+
+    def __contains__(self, name: str) -> bool:
+        return self._key(name) in self.names
+
+
+# The directories that have been searched for icons. A directory is re-indexed if it
+# has been modified since it was indexed.
+_resource_directories: dict[Path, _ResourceDirectory] = {}
+
+
+def _resource_directory(path: Path) -> _ResourceDirectory:
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    directory = _resource_directories.get(path)
+    if directory is None or directory.mtime != mtime:
+        directory = _resource_directories[path] = _ResourceDirectory(path, mtime)
+    return directory
+
+
 class Icon:
     @cachedicon
     def TOGA_ICON(cls) -> Icon:
@@ -109,26 +176,7 @@ class Icon:
             else:
                 resource_path = toga.App.app.paths.app
 
-            full_path: dict[str, Path] | Path
-            if self.factory.Icon.SIZES:
-                full_path = {}
-                for size in self.factory.Icon.SIZES:
-                    try:
-                        full_path[size] = self._full_path(
-                            size=size,
-                            extensions=self.factory.Icon.EXTENSIONS,
-                            resource_path=resource_path,
-                        )
-                    except FileNotFoundError:
-                        # This size variant wasn't found; we can skip it
-                        pass
-            else:
-                full_path = self._full_path(
-                    size=None,
-                    extensions=self.factory.Icon.EXTENSIONS,
-                    resource_path=resource_path,
-                )
-
+            full_path = self._resolve(resource_path)
             self._impl = self.factory.Icon(interface=self, path=full_path)
         except FileNotFoundError:
             # Icon path couldn't be found. If the path is the sentinel for the app
@@ -153,10 +201,56 @@ class Icon:
                 )
                 self._impl = self.DEFAULT_ICON._impl
 
+    def _resolve(self, resource_path: Path) -> dict[int, Path] | Path:
+        directory = _resource_directory(resource_path / self.path.parent)
+        sizes = self.factory.Icon.SIZES
+        extensions = self.factory.Icon.EXTENSIONS
+        key = (
+            self.path.stem,
+            tuple(sizes) if sizes else None,
+            tuple(extensions),
+            toga.platform.current_platform,
+        )
+        try:
+            full_path = directory.icons[key]
+        except KeyError:
+            if sizes:
+                full_path = {}
+                for size in sizes:
+                    try:
+                        full_path[size] = self._full_path(
+                            size=size,
+                            extensions=extensions,
+                            directory=directory,
+                            resource_path=resource_path,
+                        )
+                    except FileNotFoundError:
+                        # This size variant wasn't found; we can skip it
+                        pass
+            else:
+                try:
+                    full_path = self._full_path(
+                        size=None,
+                        extensions=extensions,
+                        directory=directory,
+                        resource_path=resource_path,
+                    )
+                except FileNotFoundError:
+                    full_path = None
+            directory.icons[key] = full_path
+
+        if full_path is None:
+            raise FileNotFoundError(f"Can't find icon {self.path}")
+        elif isinstance(full_path, dict):
+            # The backend is given its own copy of the size variants.
+            return dict(full_path)
+        return full_path
+
     def _full_path(
         self,
         size: str | None,
         extensions: Iterable[str],
+        directory: _ResourceDirectory,
         resource_path: Path,
     ) -> Path:
         platform = toga.platform.current_platform
@@ -166,9 +260,8 @@ class Icon:
                     f"{self.path.stem}-{platform}-{size}{extension}",
                     f"{self.path.stem}-{size}{extension}",
                 ]:
-                    icon_path = resource_path / self.path.parent / filename
-                    if icon_path.exists():
-                        return icon_path
+                    if filename in directory:
+                        return resource_path / self.path.parent / filename
 
         # Look for size-less alternatives
         for extension in extensions:
@@ -176,9 +269,8 @@ class Icon:
                 f"{self.path.stem}-{platform}{extension}",
                 f"{self.path.stem}{extension}",
             ]:
-                icon_path = resource_path / self.path.parent / filename
-                if icon_path.exists():
-                    return icon_path
+                if filename in directory:
+                    return resource_path / self.path.parent / filename
 
         raise FileNotFoundError(f"Can't find icon {self.path}")
 
@@ -17,15 +17,19 @@ class TogaApplicator:
         self.widget.refresh()
 
     def set_bounds(self) -> None:
-        # print("  APPLY LAYOUT", self.widget, self.widget.layout)
-        self.widget._impl.set_bounds(
-            self.widget.layout.absolute_content_left,
-            self.widget.layout.absolute_content_top,
-            self.widget.layout.content_width,
-            self.widget.layout.content_height,
-        )
-        for child in self.widget.children:
-            child.applicator.set_bounds()
+        # Apply the bounds to the widget and all its descendants, without recursing
+        # for each level of the tree.
+        stack = [self.widget]
+        while stack:
+            widget = stack.pop()
+            # print("  APPLY LAYOUT", widget, widget.layout)
+            widget._impl.set_bounds(
+                widget.layout.absolute_content_left,
+                widget.layout.absolute_content_top,
+                widget.layout.content_width,
+                widget.layout.content_height,
+            )
+            stack.extend(reversed(widget.children))
 
     def set_text_alignment(self, alignment: str) -> None:
         self.widget._impl.set_alignment(alignment)
@@ -49,8 +53,14 @@ class TogaApplicator:
     def set_font(self, font: object) -> None:
         # Changing the font of a widget can make the widget change size,
         # which in turn means we need to do a re-layout
-        self.widget._impl.set_font(font)
-        self.widget.refresh()
+        batch = self.widget._current_batch()
+        if batch is None:
+            self.widget._impl.set_font(font)
+            self.widget.refresh()
+        else:
+            # Only the last font set during a batch update needs to be applied.
+            batch.fonts[self.widget] = font
+            batch.refreshes[self.widget] = None
 
     def set_color(self, color: object) -> None:
         self.widget._impl.set_color(color)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from travertino.constants import (  # noqa: F401
@@ -76,15 +79,154 @@ FONT_WEIGHT_CHOICES = Choices(*FONT_WEIGHTS)
 FONT_SIZE_CHOICES = Choices(integer=True)
 
 
+class _ResolvedStyle:
+    """The values of the properties of a Pack style that are used by the layout
+    algorithm. Reading a value from a style declaration is comparatively expensive,
+    so the layout algorithm reads them from here instead."""
+
+    __slots__ = (
+        "width",
+        "height",
+        "flex",
+        "direction",
+        "alignment",
+        "visibility",
+        "text_direction",
+        "padding_top",
+        "padding_right",
+        "padding_bottom",
+        "padding_left",
+    )
+
+    def __init__(self, style: Pack):
+        for name in self.__slots__:
+            setattr(self, name, getattr(style, name))
+
+
+_RESOLVED_PROPERTIES = frozenset(_ResolvedStyle.__slots__)
+
+
 class Pack(BaseStyle):
     class Box(BaseBox):
-        pass
+        def __init__(self, node: Node):
+            super().__init__(node)
+            # Has anything that affects the layout of the node changed since the
+            # layout was last computed?
+            self._dirty = True
+            # The layout inputs (available width and height, and whether all the
+            # available width and height must be used) that were used when the
+            # layout was last computed.
+            self._key: tuple[float, float, bool, bool] | None = None
+            # For a leaf node, the sizes (min_width, width, min_height, height) that
+            # have been computed for previous inputs.
+            self._sizes: dict[
+                tuple[float, float, bool, bool], tuple[int, int, int, int]
+            ] = {}
+
+            # Ensure changes in the intrinsic size of the node mark the layout dirty.
+            node.intrinsic._layout = self
+
+        def dirty(self, **kwargs: Any) -> None:
+            """Mark the layout of the node, and all its ancestors, as needing to be
+            recomputed."""
+            node = self.node
+            while node is not None:
+                node.layout._dirty = True
+                node = node._parent
+
+        # While a layout is being computed, this is a list of the boxes that have
+        # been positioned; the absolute positions of their descendants are updated
+        # once the layout is complete, rather than each time a box is positioned.
+        _positioned: list[Pack.Box] | None = None
+
+        # Travertino updates the absolute position of descendants recursively; these
+        # properties replace that with an iterative update. The origin is stored in
+        # the attributes used by the base class, so that the absolute positions it
+        # reports remain correct.
+        @property
+        def _origin_top(self) -> int:
+            return self._BaseBox__origin_top
+
+        @_origin_top.setter
+        def _origin_top(self, value: int) -> None:
+            if value != self._BaseBox__origin_top:
+                self._BaseBox__origin_top = value
+                self._update_origins()
+
+        @property
+        def _origin_left(self) -> int:
+            return self._BaseBox__origin_left
+
+        @_origin_left.setter
+        def _origin_left(self, value: int) -> None:
+            if value != self._BaseBox__origin_left:
+                self._BaseBox__origin_left = value
+                self._update_origins()
+
+        @property
+        def content_top(self) -> int:
+            return self._content_top
+
+        @content_top.setter
+        def content_top(self, value: int) -> None:
+            self._content_top = value
+            self._positioned_changed()
+
+        @property
+        def content_left(self) -> int:
+            return self._content_left
+
+        @content_left.setter
+        def content_left(self, value: int) -> None:
+            self._content_left = value
+            self._positioned_changed()
+
+        def _positioned_changed(self) -> None:
+            if self._positioned is None:
+                self._update_origins()
+            else:
+                self._positioned.append(self)
+
+        def _update_origins(self) -> None:
+            """Update the origin of all descendants to match the absolute position of
+            this box."""
+            stack = [self]
+            while stack:
+                box = stack.pop()
+                top = box.absolute_content_top
+                left = box.absolute_content_left
+                for child in box.node.children:
+                    layout = child.layout
+                    if (
+                        layout._BaseBox__origin_top != top
+                        or layout._BaseBox__origin_left != left
+                    ):
+                        layout._BaseBox__origin_top = top
+                        layout._BaseBox__origin_left = left
+                        stack.append(layout)
 
     class IntrinsicSize(BaseIntrinsicSize):
         pass
 
     _depth = -1
 
+    # The number of updates in progress that are collecting font changes, whether a
+    # font change has been collected, and the font properties that were last applied.
+    _font_updates = 0
+    _font_pending = False
+    _applied_font: tuple[str, int, str, str, str] | None = None
+
+    # The number of previously computed sizes retained for each leaf node.
+    _MAX_CACHED_SIZES = 16
+
+    def __init__(self, **style: Any):
+        self._resolved = _ResolvedStyle(self)
+        # The CSS equivalent to the style (as declarations, and as a string), when it
+        # has been generated.
+        self._declarations: dict[str, str] | None = None
+        self._css: str | None = None
+        super().__init__(**style)
+
     def _debug(self, *args: str) -> None:  # pragma: no cover
         print("    " * self.__class__._depth, *args)
 
@@ -94,6 +236,11 @@ class Pack(BaseStyle):
         return self.visibility == HIDDEN
 
     def apply(self, prop: str, value: object) -> None:
+        self._declarations = None
+        self._css = None
+        if prop in _RESOLVED_PROPERTIES:
+            setattr(self._resolved, prop, value)
+
         if self._applicator:
             if prop == "text_align":
                 if value is None:
@@ -103,6 +250,7 @@ class Pack(BaseStyle):
                         value = LEFT
                 self._applicator.set_text_alignment(value)
             elif prop == "text_direction":
+                self._applicator.widget.layout.dirty()
                 if self.text_align is None:
                     self._applicator.set_text_alignment(RIGHT if value == RTL else LEFT)
             elif prop == "color":
@@ -127,37 +275,100 @@ class Pack(BaseStyle):
                 "font_variant",
                 "font_weight",
             ):
-                self._applicator.set_font(
-                    Font(
-                        self.font_family,
-                        self.font_size,
-                        style=self.font_style,
-                        variant=self.font_variant,
-                        weight=self.font_weight,
-                    )
-                )
+                if self._font_updates:
+                    self._font_pending = True
+                else:
+                    self._apply_font()
             else:
                 # Any other style change will cause a change in layout geometry,
                 # so perform a refresh.
+                self._applicator.widget.layout.dirty()
                 self._applicator.refresh()
 
+    def _apply_font(self) -> None:
+        """Apply the font described by the font properties, unless it is the font
+        that was last applied."""
+        font = (
+            self.font_family,
+            self.font_size,
+            self.font_style,
+            self.font_variant,
+            self.font_weight,
+        )
+        if font != self._applied_font:
+            self._applicator.set_font(
+                Font(
+                    self.font_family,
+                    self.font_size,
+                    style=self.font_style,
+                    variant=self.font_variant,
+                    weight=self.font_weight,
+                )
+            )
+            self._applied_font = font
+
+    @contextmanager
+    def _collect_font(self) -> Iterator[None]:
+        """Obtain a context in which changes to font properties are collected, so
+        that a single font is applied when the context exits."""
+        self._font_updates += 1
+        try:
+            yield
+        finally:
+            self._font_updates -= 1
+            if not self._font_updates and self._font_pending:
+                self._font_pending = False
+                self._apply_font()
+
+    def update(self, **styles: Any) -> None:
+        with self._collect_font():
+            super().update(**styles)
+
+    def reapply(self) -> None:
+        # The font is being applied to a new implementation, so it must be applied
+        # even if it hasn't changed.
+        self._applied_font = None
+        with self._collect_font():
+            super().reapply()
+
     def layout(self, node: Node, viewport: Any) -> None:
         # self._debug("=" * 80)
         # self._debug(f"Layout root {node}, available {viewport.width}x{viewport.height}")
         self.__class__._depth = -1
 
-        self._layout_node(
-            node,
-            alloc_width=viewport.width,
-            alloc_height=viewport.height,
-            use_all_height=True,  # root node uses all height
-            use_all_width=True,  # root node uses all width
-        )
-        node.layout.content_top = node.style.padding_top
-        node.layout.content_bottom = node.style.padding_bottom
+        # Lay out the tree using an explicit stack of the layouts in progress, rather
+        # than recursing for each level of the tree. See _layout_node.
+        stack = [
+            self._layout_node(
+                node,
+                alloc_width=viewport.width,
+                alloc_height=viewport.height,
+                use_all_height=True,  # root node uses all height
+                use_all_width=True,  # root node uses all width
+            )
+        ]
+        positioned = Pack.Box._positioned = []
+        try:
+            while stack:
+                try:
+                    stack.append(next(stack[-1]))
+                except StopIteration:
+                    stack.pop()
+
+            node.layout.content_top = node.style.padding_top
+            node.layout.content_bottom = node.style.padding_bottom
+
+            node.layout.content_left = node.style.padding_left
+            node.layout.content_right = node.style.padding_right
+        finally:
+            Pack.Box._positioned = None
 
-        node.layout.content_left = node.style.padding_left
-        node.layout.content_right = node.style.padding_right
+        # A box is positioned by its parent after all its descendants have been laid
+        # out, so an ancestor is always positioned after its descendants. Update the
+        # origins in the reverse order, so that each descendant is updated once its
+        # ancestors are in their final position.
+        for box in reversed(positioned):
+            box._update_origins()
 
     def _layout_node(
         self,
@@ -166,8 +377,15 @@ class Pack(BaseStyle):
         alloc_height: int,
         use_all_width: bool,
         use_all_height: bool,
-    ) -> None:
+    ) -> Iterator[Iterator]:
+        """Compute the layout of a node.
+
+        This is a generator; whenever the layout of a child node is needed, it yields
+        the (unstarted) generator that computes the layout of that child, and is
+        resumed once that generator has been exhausted.
+        """
         self.__class__._depth += 1
+        style = self._resolved
         # self._debug(
         #     f"COMPUTE LAYOUT for {node} available "
         #     f"{alloc_width}{'+' if use_all_width else ''}"
@@ -176,17 +394,17 @@ class Pack(BaseStyle):
         # )
 
         # Establish available width
-        if self.width != NONE:
+        if style.width != NONE:
             # If width is specified, use it
-            available_width = self.width
-            min_width = self.width
-            # self._debug(f"SPECIFIED WIDTH {self.width}")
+            available_width = style.width
+            min_width = style.width
+            # self._debug(f"SPECIFIED WIDTH {style.width}")
         else:
             # If no width is specified, assume we're going to use all
             # the available width. If there is an intrinsic width,
             # use it to make sure the width is at least the amount specified.
             available_width = max(
-                0, (alloc_width - self.padding_left - self.padding_right)
+                0, (alloc_width - style.padding_left - style.padding_right)
             )
             # self._debug(f"INITIAL {available_width=}")
             if node.intrinsic.width is not None:
@@ -204,15 +422,15 @@ class Pack(BaseStyle):
                 min_width = 0
 
         # Establish available height
-        if self.height != NONE:
+        if style.height != NONE:
             # If height is specified, use it.
-            available_height = self.height
-            min_height = self.height
-            # self._debug(f"SPECIFIED HEIGHT {self.height}")
+            available_height = style.height
+            min_height = style.height
+            # self._debug(f"SPECIFIED HEIGHT {style.height}")
         else:
             available_height = max(
                 0,
-                alloc_height - self.padding_top - self.padding_bottom,
+                alloc_height - style.padding_top - style.padding_bottom,
             )
             # self._debug(f"INITIAL {available_height=}")
             if node.intrinsic.height is not None:
@@ -229,22 +447,53 @@ class Pack(BaseStyle):
                 # self._debug(f"AUTO {available_height=}")
                 min_height = 0
 
+        # The allocation only affects the layout through the available size, so a
+        # node with a fixed size can reuse its layout regardless of the allocation.
+        key = (available_width, available_height, use_all_width, use_all_height)
+        layout = node.layout
+        if layout._dirty:
+            layout._sizes.clear()
+        elif layout._key == key:
+            # Nothing that affects the layout of the node (or any of its descendants)
+            # has changed since the layout was computed for these inputs, so the
+            # existing layout can be reused.
+            # self._debug("UNCHANGED")
+            self.__class__._depth -= 1
+            return
+        elif key in layout._sizes:
+            # A leaf has no descendants to lay out, so the sizes computed for
+            # previous inputs can be reused.
+            # self._debug("CACHED")
+            (
+                layout.min_content_width,
+                layout.content_width,
+                layout.min_content_height,
+                layout.content_height,
+            ) = layout._sizes[key]
+            layout._key = key
+            self.__class__._depth -= 1
+            return
+
         if node.children:
-            if self.direction == COLUMN:
-                min_width, width, min_height, height = self._layout_column_children(
-                    node,
-                    available_width=available_width,
-                    available_height=available_height,
-                    use_all_height=use_all_height,
-                    use_all_width=use_all_width,
+            if style.direction == COLUMN:
+                min_width, width, min_height, height = (
+                    yield from self._layout_column_children(
+                        node,
+                        available_width=available_width,
+                        available_height=available_height,
+                        use_all_height=use_all_height,
+                        use_all_width=use_all_width,
+                    )
                 )
             else:
-                min_width, width, min_height, height = self._layout_row_children(
-                    node,
-                    available_width=available_width,
-                    available_height=available_height,
-                    use_all_height=use_all_height,
-                    use_all_width=use_all_width,
+                min_width, width, min_height, height = (
+                    yield from self._layout_row_children(
+                        node,
+                        available_width=available_width,
+                        available_height=available_height,
+                        use_all_height=use_all_height,
+                        use_all_width=use_all_width,
+                    )
                 )
             # self._debug(f"HAS CHILDREN {min_width=} {width=} {min_height=} {height=}")
         else:
@@ -254,11 +503,11 @@ class Pack(BaseStyle):
 
         # If an explicit width/height was given, that specification
         # overrides the width/height evaluated by the layout of children
-        if self.width != NONE:
-            width = self.width
+        if style.width != NONE:
+            width = style.width
             min_width = width
-        if self.height != NONE:
-            height = self.height
+        if style.height != NONE:
+            height = style.height
             min_height = height
 
         # self._debug(f"FINAL SIZE {min_width}x{min_height} {width}x{height}")
@@ -268,6 +517,18 @@ class Pack(BaseStyle):
         node.layout.min_content_width = int(min_width)
         node.layout.min_content_height = int(min_height)
 
+        layout._dirty = False
+        layout._key = key
+        if not node.children:
+            if len(layout._sizes) >= self._MAX_CACHED_SIZES:
+                layout._sizes.clear()
+            layout._sizes[key] = (
+                layout.min_content_width,
+                layout.content_width,
+                layout.min_content_height,
+                layout.content_height,
+            )
+
         # self._debug("END LAYOUT", node, node.layout)
         self.__class__._depth -= 1
 
@@ -278,8 +539,9 @@ class Pack(BaseStyle):
         available_height: int,
         use_all_width: bool,
         use_all_height: bool,
-    ) -> tuple[int, int, int, int]:
+    ) -> Generator[Iterator, None, tuple[int, int, int, int]]:
         # self._debug(f"LAYOUT ROW CHILDREN {available_width=} {available_height=}")
+        style = self._resolved
         # Pass 1: Lay out all children with a hard-specified width, or an
         # intrinsic non-flexible width. While iterating, collect the flex
         # total of remaining elements.
@@ -289,15 +551,16 @@ class Pack(BaseStyle):
         min_width = 0
         remaining_width = available_width
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 1 {child}")
-            if child.style.width != NONE:
-                # self._debug(f"- fixed width {child.style.width}")
-                child.style._layout_node(
+            if child_style.width != NONE:
+                # self._debug(f"- fixed width {child_style.width}")
+                yield child.style._layout_node(
                     child,
                     alloc_width=remaining_width,
                     alloc_height=available_height,
                     use_all_width=False,
-                    use_all_height=child.style.direction == ROW,
+                    use_all_height=child_style.direction == ROW,
                 )
                 child_content_width = child.layout.content_width
                 # It doesn't matter how small the children can be laid out;
@@ -305,9 +568,9 @@ class Pack(BaseStyle):
                 min_child_content_width = child.layout.content_width
             elif child.intrinsic.width is not None:
                 if hasattr(child.intrinsic.width, "value"):
-                    if child.style.flex:
+                    if child_style.flex:
                         # self._debug(f"- intrinsic flex width {child.intrinsic.width}")
-                        flex_total += child.style.flex
+                        flex_total += child_style.flex
                         # Final child content size will be computed in pass 2, after the
                         # amount of flexible space is known. For now, set an initial
                         # content height based on the intrinsic size, which will be the
@@ -315,18 +578,18 @@ class Pack(BaseStyle):
                         child_content_width = child.intrinsic.width.value
                         min_child_content_width = child.intrinsic.width.value
                         min_flex += (
-                            child.style.padding_left
+                            child_style.padding_left
                             + child.intrinsic.width.value
-                            + child.style.padding_right
+                            + child_style.padding_right
                         )
                     else:
                         # self._debug(f"- intrinsic non-flex {child.intrinsic.width=}")
-                        child.style._layout_node(
+                        yield child.style._layout_node(
                             child,
                             alloc_width=0,
                             alloc_height=available_height,
                             use_all_width=False,
-                            use_all_height=child.style.direction == ROW,
+                            use_all_height=child_style.direction == ROW,
                         )
                         child_content_width = child.layout.content_width
                         # It doesn't matter how small the children can be laid out;
@@ -334,21 +597,21 @@ class Pack(BaseStyle):
                         min_child_content_width = child.layout.content_width
                 else:
                     # self._debug(f"- intrinsic {child.intrinsic.width=}")
-                    child.style._layout_node(
+                    yield child.style._layout_node(
                         child,
                         alloc_width=remaining_width,
                         alloc_height=available_height,
                         use_all_width=False,
-                        use_all_height=child.style.direction == ROW,
+                        use_all_height=child_style.direction == ROW,
                     )
                     child_content_width = child.layout.content_width
                     # It doesn't matter how small the children can be laid out;
                     # we have an intrinsic size; so don't use min_content_width
                     min_child_content_width = child.layout.content_width
             else:
-                if child.style.flex:
+                if child_style.flex:
                     # self._debug("- unspecified flex width")
-                    flex_total += child.style.flex
+                    flex_total += child_style.flex
                     # Final child content size will be computed in pass 2, after the
                     # amount of flexible space is known. For now, use 0 as the minimum,
                     # as that's the best hint the widget style can give.
@@ -356,28 +619,28 @@ class Pack(BaseStyle):
                     min_child_content_width = 0
                 else:
                     # self._debug("- unspecified non-flex width")
-                    child.style._layout_node(
+                    yield child.style._layout_node(
                         child,
                         alloc_width=remaining_width,
                         alloc_height=available_height,
                         use_all_width=False,
-                        use_all_height=child.style.direction == ROW,
+                        use_all_height=child_style.direction == ROW,
                     )
                     child_content_width = child.layout.content_width
                     min_child_content_width = child.layout.min_content_width
 
             child_width = (
-                child.style.padding_left
+                child_style.padding_left
                 + child_content_width
-                + child.style.padding_right
+                + child_style.padding_right
             )
             width += child_width
             remaining_width -= child_width
 
             min_child_width = (
-                child.style.padding_left
+                child_style.padding_left
                 + min_child_content_width
-                + child.style.padding_right
+                + child_style.padding_right
             )
             min_width += min_child_width
 
@@ -392,16 +655,17 @@ class Pack(BaseStyle):
             # they need to be removed from the flex calculation.
             # self._debug(f"PASS 1a; {quantum=}")
             for child in node.children:
-                if child.style.flex and child.intrinsic.width is not None:
+                child_style = child.style._resolved
+                if child_style.flex and child.intrinsic.width is not None:
                     try:
-                        ideal_width = quantum * child.style.flex
+                        ideal_width = quantum * child_style.flex
                         if child.intrinsic.width.value > ideal_width:
                             # self._debug(f"- {child} overflows ideal width")
-                            flex_total -= child.style.flex
+                            flex_total -= child_style.flex
                             min_flex -= (
-                                child.style.padding_left
+                                child_style.padding_left
                                 + child.intrinsic.width.value
-                                + child.style.padding_right
+                                + child_style.padding_right
                             )
                     except AttributeError:
                         # Intrinsic width isn't flexible
@@ -418,30 +682,31 @@ class Pack(BaseStyle):
         # Pass 2: Lay out children with an intrinsic flexible width,
         # or no width specification at all.
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 2 {child}")
-            if child.style.width != NONE:
+            if child_style.width != NONE:
                 # self._debug("- already laid out (explicit width)")
                 pass
-            elif child.style.flex:
+            elif child_style.flex:
                 if child.intrinsic.width is not None:
                     try:
                         child_alloc_width = (
-                            child.style.padding_left
+                            child_style.padding_left
                             + child.intrinsic.width.value
-                            + child.style.padding_right
+                            + child_style.padding_right
                         )
-                        ideal_width = quantum * child.style.flex
+                        ideal_width = quantum * child_style.flex
                         # self._debug(f"- flexible intrinsic {child_alloc_width=}")
                         if ideal_width > child_alloc_width:
                             # self._debug(f"  {ideal_width=}")
                             child_alloc_width = ideal_width
 
-                        child.style._layout_node(
+                        yield child.style._layout_node(
                             child,
                             alloc_width=child_alloc_width,
                             alloc_height=available_height,
                             use_all_width=True,
-                            use_all_height=child.style.direction == ROW,
+                            use_all_height=child_style.direction == ROW,
                         )
                         # Our width calculation already takes into account the intrinsic
                         # width; that has now expanded as a result of layout, so adjust
@@ -467,19 +732,19 @@ class Pack(BaseStyle):
                 else:
                     if quantum:
                         # self._debug(f"- unspecified flex width with {quantum=}")
-                        child_alloc_width = quantum * child.style.flex
+                        child_alloc_width = quantum * child_style.flex
                     else:
                         # self._debug("- unspecified flex width")
                         child_alloc_width = (
-                            child.style.padding_left + child.style.padding_right
+                            child_style.padding_left + child_style.padding_right
                         )
 
-                    child.style._layout_node(
+                    yield child.style._layout_node(
                         child,
                         alloc_width=child_alloc_width,
                         alloc_height=available_height,
                         use_all_width=True,
-                        use_all_height=child.style.direction == ROW,
+                        use_all_height=child_style.direction == ROW,
                     )
                     # We now know the final min_width/width that accounts for flexible
                     # sizing; add that to the overall.
@@ -503,29 +768,30 @@ class Pack(BaseStyle):
         height = 0
         min_height = 0
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 3: {child} AT HORIZONTAL {offset=}")
-            if node.style.text_direction is RTL:
+            if style.text_direction is RTL:
                 # self._debug("- RTL")
-                offset += child.layout.content_width + child.style.padding_right
+                offset += child.layout.content_width + child_style.padding_right
                 child.layout.content_left = width - offset
-                offset += child.style.padding_left
+                offset += child_style.padding_left
             else:
                 # self._debug("- LTR")
-                offset += child.style.padding_left
+                offset += child_style.padding_left
                 child.layout.content_left = offset
-                offset += child.layout.content_width + child.style.padding_right
+                offset += child.layout.content_width + child_style.padding_right
 
             child_height = (
-                child.style.padding_top
+                child_style.padding_top
                 + child.layout.content_height
-                + child.style.padding_bottom
+                + child_style.padding_bottom
             )
             height = max(height, child_height)
 
             min_child_height = (
-                child.style.padding_top
+                child_style.padding_top
                 + child.layout.min_content_height
-                + child.style.padding_bottom
+                + child_style.padding_bottom
             )
             min_height = max(min_height, min_child_height)
 
@@ -536,21 +802,22 @@ class Pack(BaseStyle):
 
         # Pass 4: set vertical position of each child.
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 4: {child}")
             extra = height - (
                 child.layout.content_height
-                + child.style.padding_top
-                + child.style.padding_bottom
+                + child_style.padding_top
+                + child_style.padding_bottom
             )
             # self._debug(f"- row extra width {extra}")
-            if self.alignment is BOTTOM:
-                child.layout.content_top = extra + child.style.padding_top
+            if style.alignment is BOTTOM:
+                child.layout.content_top = extra + child_style.padding_top
                 # self._debug(f"  align {child} to bottom {child.layout.content_top=}")
-            elif self.alignment is CENTER:
-                child.layout.content_top = int(extra / 2) + child.style.padding_top
+            elif style.alignment is CENTER:
+                child.layout.content_top = int(extra / 2) + child_style.padding_top
                 # self._debug(f"  align {child} to center {child.layout.content_top=}")
             else:
-                child.layout.content_top = child.style.padding_top
+                child.layout.content_top = child_style.padding_top
                 # self._debug(f"  align {child} to top {child.layout.content_top=}")
 
         return min_width, width, min_height, height
@@ -562,8 +829,9 @@ class Pack(BaseStyle):
         available_height: int,
         use_all_width: bool,
         use_all_height: bool,
-    ) -> tuple[int, int, int, int]:
+    ) -> Generator[Iterator, None, tuple[int, int, int, int]]:
         # self._debug(f"LAYOUT COLUMN CHILDREN {available_width=} {available_height=}")
+        style = self._resolved
         # Pass 1: Lay out all children with a hard-specified height, or an
         # intrinsic non-flexible height. While iterating, collect the flex
         # total of remaining elements.
@@ -573,14 +841,15 @@ class Pack(BaseStyle):
         min_height = 0
         remaining_height = available_height
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 1 {child}")
-            if child.style.height != NONE:
-                # self._debug(f"- fixed height {child.style.height}")
-                child.style._layout_node(
+            if child_style.height != NONE:
+                # self._debug(f"- fixed height {child_style.height}")
+                yield child.style._layout_node(
                     child,
                     alloc_width=available_width,
                     alloc_height=remaining_height,
-                    use_all_width=child.style.direction == COLUMN,
+                    use_all_width=child_style.direction == COLUMN,
                     use_all_height=False,
                 )
                 child_content_height = child.layout.content_height
@@ -589,9 +858,9 @@ class Pack(BaseStyle):
                 min_child_content_height = child.layout.content_height
             elif child.intrinsic.height is not None:
                 if hasattr(child.intrinsic.height, "value"):
-                    if child.style.flex:
+                    if child_style.flex:
                         # self._debug(f"- intrinsic flex height {child.intrinsic.height}")
-                        flex_total += child.style.flex
+                        flex_total += child_style.flex
                         # Final child content size will be computed in pass 2, after the
                         # amount of flexible space is known. For now, set an initial
                         # content height based on the intrinsic size, which will be the
@@ -599,17 +868,17 @@ class Pack(BaseStyle):
                         child_content_height = child.intrinsic.height.value
                         min_child_content_height = child.intrinsic.height.value
                         min_flex += (
-                            child.style.padding_top
+                            child_style.padding_top
                             + child_content_height
-                            + child.style.padding_bottom
+                            + child_style.padding_bottom
                         )
                     else:
                         # self._debug(f"- intrinsic non-flex {child.intrinsic.height=}")
-                        child.style._layout_node(
+                        yield child.style._layout_node(
                             child,
                             alloc_width=available_width,
                             alloc_height=0,
-                            use_all_width=child.style.direction == COLUMN,
+                            use_all_width=child_style.direction == COLUMN,
                             use_all_height=False,
                         )
                         child_content_height = child.layout.content_height
@@ -618,11 +887,11 @@ class Pack(BaseStyle):
                         min_child_content_height = child.layout.content_height
                 else:
                     # self._debug(f"- intrinsic {child.intrinsic.height=}")
-                    child.style._layout_node(
+                    yield child.style._layout_node(
                         child,
                         alloc_width=available_width,
                         alloc_height=remaining_height,
-                        use_all_width=child.style.direction == COLUMN,
+                        use_all_width=child_style.direction == COLUMN,
                         use_all_height=False,
                     )
                     child_content_height = child.layout.content_height
@@ -630,9 +899,9 @@ class Pack(BaseStyle):
                     # we have an intrinsic size; so don't use min_content_height
                     min_child_content_height = child.layout.content_height
             else:
-                if child.style.flex:
+                if child_style.flex:
                     # self._debug("- unspecified flex height")
-                    flex_total += child.style.flex
+                    flex_total += child_style.flex
                     # Final child content size will be computed in pass 2, after the
                     # amount of flexible space is known. For now, use 0 as the minimum,
                     # as that's the best hint the widget style can give.
@@ -640,28 +909,28 @@ class Pack(BaseStyle):
                     min_child_content_height = 0
                 else:
                     # self._debug("- unspecified non-flex height")
-                    child.style._layout_node(
+                    yield child.style._layout_node(
                         child,
                         alloc_width=available_width,
                         alloc_height=remaining_height,
-                        use_all_width=child.style.direction == COLUMN,
+                        use_all_width=child_style.direction == COLUMN,
                         use_all_height=False,
                     )
                     child_content_height = child.layout.content_height
                     min_child_content_height = child.layout.min_content_height
 
             child_height = (
-                child.style.padding_top
+                child_style.padding_top
                 + child_content_height
-                + child.style.padding_bottom
+                + child_style.padding_bottom
             )
             height += child_height
             remaining_height -= child_height
 
             min_child_height = (
-                child.style.padding_top
+                child_style.padding_top
                 + min_child_content_height
-                + child.style.padding_bottom
+                + child_style.padding_bottom
             )
             min_height += min_child_height
 
@@ -676,16 +945,17 @@ class Pack(BaseStyle):
             # flex layout, they need to be removed from the flex calculation.
             # self._debug(f"PASS 1a; {quantum=}")
             for child in node.children:
-                if child.style.flex and child.intrinsic.height is not None:
+                child_style = child.style._resolved
+                if child_style.flex and child.intrinsic.height is not None:
                     try:
-                        ideal_height = quantum * child.style.flex
+                        ideal_height = quantum * child_style.flex
                         if child.intrinsic.height.value > ideal_height:
                             # self._debug(f"- {child} overflows ideal height")
-                            flex_total -= child.style.flex
+                            flex_total -= child_style.flex
                             min_flex -= (
-                                child.style.padding_top
+                                child_style.padding_top
                                 + child.intrinsic.height.value
-                                + child.style.padding_bottom
+                                + child_style.padding_bottom
                             )
                     except AttributeError:
                         # Intrinsic height isn't flexible
@@ -703,29 +973,30 @@ class Pack(BaseStyle):
         # Pass 2: Lay out children with an intrinsic flexible height,
         # or no height specification at all.
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 2 {child}")
-            if child.style.height != NONE:
+            if child_style.height != NONE:
                 # self._debug("- already laid out (explicit height)")
                 pass
-            elif child.style.flex:
+            elif child_style.flex:
                 if child.intrinsic.height is not None:
                     try:
                         child_alloc_height = (
-                            child.style.padding_top
+                            child_style.padding_top
                             + child.intrinsic.height.value
-                            + child.style.padding_bottom
+                            + child_style.padding_bottom
                         )
-                        ideal_height = quantum * child.style.flex
+                        ideal_height = quantum * child_style.flex
                         # self._debug(f"- flexible intrinsic {child_alloc_height=}")
                         if ideal_height > child_alloc_height:
                             # self._debug(f"  {ideal_height=}")
                             child_alloc_height = ideal_height
 
-                        child.style._layout_node(
+                        yield child.style._layout_node(
                             child,
                             alloc_width=available_width,
                             alloc_height=child_alloc_height,
-                            use_all_width=child.style.direction == COLUMN,
+                            use_all_width=child_style.direction == COLUMN,
                             use_all_height=True,
                         )
                         # Our height calculation already takes into account the
@@ -752,18 +1023,18 @@ class Pack(BaseStyle):
                 else:
                     if quantum:
                         # self._debug(f"- unspecified flex height with {quantum=}")
-                        child_alloc_height = quantum * child.style.flex
+                        child_alloc_height = quantum * child_style.flex
                     else:
                         # self._debug("- unspecified flex height")
                         child_alloc_height = (
-                            child.style.padding_top + child.style.padding_bottom
+                            child_style.padding_top + child_style.padding_bottom
                         )
 
-                    child.style._layout_node(
+                    yield child.style._layout_node(
                         child,
                         alloc_width=available_width,
                         alloc_height=child_alloc_height,
-                        use_all_width=child.style.direction == COLUMN,
+                        use_all_width=child_style.direction == COLUMN,
                         use_all_height=True,
                     )
                     # We now know the final min_height/height that accounts for flexible
@@ -789,21 +1060,22 @@ class Pack(BaseStyle):
         width = 0
         min_width = 0
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 3: {child} AT VERTICAL OFFSET {offset}")
-            offset += child.style.padding_top
+            offset += child_style.padding_top
             child.layout.content_top = offset
-            offset += child.layout.content_height + child.style.padding_bottom
+            offset += child.layout.content_height + child_style.padding_bottom
             child_width = (
                 child.layout.content_width
-                + child.style.padding_left
-                + child.style.padding_right
+                + child_style.padding_left
+                + child_style.padding_right
             )
             width = max(width, child_width)
 
             min_child_width = (
-                child.style.padding_left
+                child_style.padding_left
                 + child.layout.min_content_width
-                + child.style.padding_right
+                + child_style.padding_right
             )
             min_width = max(min_width, min_child_width)
 
@@ -814,30 +1086,40 @@ class Pack(BaseStyle):
 
         # Pass 4: set horizontal position of each child.
         for child in node.children:
+            child_style = child.style._resolved
             # self._debug(f"PASS 4: {child}")
             extra = width - (
                 child.layout.content_width
-                + child.style.padding_left
-                + child.style.padding_right
+                + child_style.padding_left
+                + child_style.padding_right
             )
             # self._debug(f"-  row extra width {extra}")
-            if self.alignment is RIGHT:
-                child.layout.content_left = extra + child.style.padding_left
+            if style.alignment is RIGHT:
+                child.layout.content_left = extra + child_style.padding_left
                 # self._debug(f"  align {child} to right {child.layout.content_left=}")
-            elif self.alignment is CENTER:
-                child.layout.content_left = int(extra / 2) + child.style.padding_left
+            elif style.alignment is CENTER:
+                child.layout.content_left = int(extra / 2) + child_style.padding_left
                 # self._debug(f"  align {child} to center {child.layout.content_left=}")
             else:
-                child.layout.content_left = child.style.padding_left
+                child.layout.content_left = child_style.padding_left
                 # self._debug(f"  align {child} to left {child.layout.content_left=}")
 
         return min_width, width, min_height, height
 
-    def __css__(self) -> str:
-        css = []
+    def _css_declarations(self) -> dict[str, str]:
+        """The CSS declarations equivalent to this style, as a mapping of CSS property
+        names to values.
+
+        The mapping is cached until the style changes, so it must not be modified. A
+        new mapping is returned once the style has changed.
+        """
+        if self._declarations is not None:
+            return self._declarations
+
+        css = {}
         # display
         if self.display == NONE:
-            css.append("display: none;")
+            css["display"] = "none"
         else:
             # if self.display != NONE, it must be pack; it will inherit
             # the pack definition from the Toga stylesheet.
@@ -845,84 +1127,97 @@ class Pack(BaseStyle):
 
         # visibility
         if self.visibility != VISIBLE:
-            css.append(f"visibility: {self.visibility};")
+            css["visibility"] = self.visibility
 
         # direction
-        css.append(f"flex-direction: {self.direction.lower()};")
+        css["flex-direction"] = self.direction.lower()
         # flex
         if (self.width == NONE and self.direction == ROW) or (
             self.height == NONE and self.direction == COLUMN
         ):
-            css.append(f"flex: {self.flex} 0 auto;")
+            css["flex"] = f"{self.flex} 0 auto"
 
         # width/flex
         if self.width != NONE:
-            css.append(f"width: {self.width}px;")
+            css["width"] = f"{self.width}px"
 
         # height/flex
         if self.height != NONE:
-            css.append(f"height: {self.height}px;")
+            css["height"] = f"{self.height}px"
 
         # alignment
         if self.direction == ROW:
             if self.alignment:
                 if self.alignment == LEFT:
-                    css.append("align-items: start;")
+                    css["align-items"] = "start"
                 elif self.alignment == RIGHT:
-                    css.append("align-items: end;")
+                    css["align-items"] = "end"
                 elif self.alignment == CENTER:
-                    css.append("align-items: center;")
+                    css["align-items"] = "center"
         else:
             if self.alignment:
                 if self.alignment == TOP:
-                    css.append("align-items: start;")
+                    css["align-items"] = "start"
                 elif self.alignment == BOTTOM:
-                    css.append("align-items: end;")
+                    css["align-items"] = "end"
                 elif self.alignment == CENTER:
-                    css.append("align-items: center;")
+                    css["align-items"] = "center"
 
         # padding_*
         if self.padding_top:
-            css.append(f"margin-top: {self.padding_top}px;")
+            css["margin-top"] = f"{self.padding_top}px"
         if self.padding_bottom:
-            css.append(f"margin-bottom: {self.padding_bottom}px;")
+            css["margin-bottom"] = f"{self.padding_bottom}px"
         if self.padding_left:
-            css.append(f"margin-left: {self.padding_left}px;")
+            css["margin-left"] = f"{self.padding_left}px"
         if self.padding_right:
-            css.append(f"margin-right: {self.padding_right}px;")
+            css["margin-right"] = f"{self.padding_right}px"
 
         # color
         if self.color:
-            css.append(f"color: {self.color};")
+            css["color"] = str(self.color)
 
         # background_color
         if self.background_color:
-            css.append(f"background-color: {self.background_color};")
+            css["background-color"] = str(self.background_color)
 
         # text_align
         if self.text_align:
-            css.append(f"text-align: {self.text_align};")
+            css["text-align"] = self.text_align
 
         # text_direction
         if self.text_direction != LTR:
-            css.append(f"text-direction: {self.text_direction};")
+            css["text-direction"] = self.text_direction
 
         # font-*
         if self.font_family != SYSTEM:
             if " " in self.font_family:
-                css.append(f'font-family: "{self.font_family}";')
+                css["font-family"] = f'"{self.font_family}"'
             else:
-                css.append(f"font-family: {self.font_family};")
+                css["font-family"] = self.font_family
         if self.font_size != SYSTEM_DEFAULT_FONT_SIZE:
-            css.append(f"font-size: {self.font_size}pt;")
+            css["font-size"] = f"{self.font_size}pt"
         if self.font_weight != NORMAL:
-            css.append(f"font-weight: {self.font_weight};")
+            css["font-weight"] = self.font_weight
         if self.font_style != NORMAL:
-            css.append(f"font-style: {self.font_style};")
+            css["font-style"] = self.font_style
         if self.font_variant != NORMAL:
-            css.append(f"font-variant: {self.font_variant};")
+            css["font-variant"] = self.font_variant
+
+        self._declarations = css
+        return css
 
-        return " ".join(css)
+    def __css__(self) -> str:
+        if self._css is None:
+            # Identical styles share a single string, so that backends can cheaply
+            # recognize them.
+            self._css = sys.intern(
+                " ".join(
+                    f"{name}: {value};"
+                    for name, value in self._css_declarations().items()
+                )
+            )
+        return self._css
 
 
 Pack.validated_property("display", choices=DISPLAY_CHOICES, initial=PACK)
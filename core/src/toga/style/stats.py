@@ -0,0 +1,250 @@
+"""Instrumentation of the layout of widgets.
+
+Layout statistics are collected once :func:`enable` has been called, or if the
+``TOGA_LAYOUT_STATS`` environment variable is set to ``1`` when the app is created
+(in which case a summary is also printed periodically). While statistics aren't
+being collected, the layout code isn't instrumented at all.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import Counter, deque
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+import toga
+
+if TYPE_CHECKING:
+    from travertino.node import Node
+
+    from toga.widgets.base import Widget
+
+# The interval, in seconds, at which a summary is printed when statistics are
+# enabled by the TOGA_LAYOUT_STATS environment variable.
+DUMP_INTERVAL = 10.0
+
+# The number of recent layout passes that are retained.
+MAX_RECENT_PASSES = 100
+
+
+class LayoutStats:
+    def __init__(self, dump_interval: float | None = None):
+        """Statistics about the layout of widgets.
+
+        :param dump_interval: If provided, the interval, in seconds, at which a
+            summary is printed. The summary is printed at the end of a layout pass,
+            so nothing is printed while no layout is being performed.
+        """
+        self.dump_interval = dump_interval
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all the statistics that have been collected."""
+        #: The number of layout passes that have been performed.
+        self.passes = 0
+        #: The total and maximum time taken by a layout pass, in seconds.
+        self.total_time = 0.0
+        self.max_time = 0.0
+        #: The most recent layout passes, as tuples of (root node, time taken, number
+        #: of node layouts computed, number of node layouts reused from the cache).
+        self.recent_passes: deque[tuple[Node, float, int, int]] = deque(
+            maxlen=MAX_RECENT_PASSES
+        )
+        #: The number of times the layout of each node has been computed. A layout
+        #: that is reused from the layout cache isn't counted.
+        self.node_layouts: WeakKeyDictionary[Node, int] = WeakKeyDictionary()
+        #: The number of times the layout of a node has been reused from the cache.
+        self.cache_hits = 0
+        #: The number of refreshes of each widget, by the property (or for changes
+        #: that weren't caused by a style property, the method) that triggered them.
+        self.refreshes: WeakKeyDictionary[Widget, Counter[str]] = WeakKeyDictionary()
+
+        self._pass_layouts = 0
+        self._pass_hits = 0
+        self._property: str | None = None
+        self._refreshing = 0
+        self._last_dump = perf_counter()
+
+    ######################################################################
+    # Recording
+    ######################################################################
+
+    def _node_layout(self, node: Node, cached: bool) -> None:
+        if cached:
+            self.cache_hits += 1
+            self._pass_hits += 1
+        else:
+            self.node_layouts[node] = self.node_layouts.get(node, 0) + 1
+            self._pass_layouts += 1
+
+    def _pass_complete(self, node: Node, duration: float) -> None:
+        self.passes += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.recent_passes.append((node, duration, self._pass_layouts, self._pass_hits))
+        self._pass_layouts = 0
+        self._pass_hits = 0
+
+        if self.dump_interval is not None:
+            now = perf_counter()
+            if now - self._last_dump >= self.dump_interval:
+                self._last_dump = now
+                print(self.summary(), file=sys.stderr)
+
+    def _refresh(self, widget: Widget, trigger: str) -> None:
+        self.refreshes.setdefault(widget, Counter())[trigger] += 1
+
+    ######################################################################
+    # Reporting
+    ######################################################################
+
+    def rehints(self) -> dict[str, int]:
+        """The number of rehints performed by the container of each window of the
+        app, for backends whose containers count them.
+
+        :returns: A dictionary mapping window IDs to rehint counts.
+        """
+        rehints = {}
+        if toga.App.app is not None:
+            for window in toga.App.app.windows:
+                count = getattr(window._impl.container, "rehint_count", None)
+                if count is not None:
+                    rehints[window.id] = count
+        return rehints
+
+    def summary(self, limit: int = 10) -> str:
+        """A human-readable summary of the statistics.
+
+        :param limit: The maximum number of nodes and refresh triggers to list.
+        """
+        lines = [f"Layout statistics: {self.passes} passes"]
+        if self.passes:
+            lines.append(
+                f"    time: {self.total_time * 1000:.3f} ms total, "
+                f"{self.total_time / self.passes * 1000:.3f} ms mean, "
+                f"{self.max_time * 1000:.3f} ms max"
+            )
+            layouts = [count for _, _, count, _ in self.recent_passes]
+            hits = sum(count for _, _, _, count in self.recent_passes)
+            lines.append(
+                f"    node layouts in the last {len(layouts)} passes: "
+                f"{sum(layouts)} total, {max(layouts)} max, {hits} reused from cache"
+            )
+
+        lines.append("Most laid out nodes:")
+        for node, count in Counter(dict(self.node_layouts.items())).most_common(limit):
+            lines.append(f"    {count:8} {node!r}")
+
+        lines.append("Most frequent refresh triggers:")
+        triggers: Counter[tuple[Widget, str]] = Counter()
+        for widget, counts in self.refreshes.items():
+            for trigger, count in counts.items():
+                triggers[widget, trigger] += count
+        for (widget, trigger), count in triggers.most_common(limit):
+            lines.append(f"    {count:8} {widget!r} {trigger}")
+
+        rehints = self.rehints()
+        if rehints:
+            lines.append("Rehints:")
+            for window_id, count in rehints.items():
+                lines.append(f"    {count:8} window {window_id}")
+
+        return "\n".join(lines)
+
+
+# The statistics being collected, and the methods replaced while collecting them.
+_stats: LayoutStats | None = None
+_originals: dict[tuple[type, str], Any] = {}
+
+
+def get_stats() -> LayoutStats | None:
+    """The layout statistics that are being collected, or :any:`None` if statistics
+    aren't enabled."""
+    return _stats
+
+
+def enable(dump_interval: float | None = None) -> LayoutStats:
+    """Start collecting layout statistics.
+
+    If statistics are already being collected, they will continue to be used.
+
+    :param dump_interval: If provided, the interval, in seconds, at which a summary
+        of the statistics is printed.
+    :returns: The statistics that are being collected.
+    """
+    global _stats
+    if _stats is not None:
+        return _stats
+
+    from toga.style.pack import Pack
+    from toga.widgets.base import Widget
+
+    stats = _stats = LayoutStats(dump_interval=dump_interval)
+
+    original_layout = Pack.layout
+    original_layout_node = Pack._layout_node
+    original_apply = Pack.apply
+    original_refresh = Widget.refresh
+
+    def layout(self: Pack, node: Node, viewport: Any) -> None:
+        start = perf_counter()
+        try:
+            original_layout(self, node, viewport)
+        finally:
+            stats._pass_complete(node, perf_counter() - start)
+
+    def _layout_node(self: Pack, node: Node, *args: Any, **kwargs: Any) -> Any:
+        # The layout of a node is reused if it isn't dirty, and it was last computed
+        # (or for a leaf, has been computed before) for the same inputs; so once the
+        # layout is complete, its inputs show whether it was computed.
+        layout = node.layout
+        previous = None if layout._dirty else (layout._key, set(layout._sizes))
+        result = yield from original_layout_node(self, node, *args, **kwargs)
+        stats._node_layout(
+            node,
+            cached=previous is not None
+            and (layout._key == previous[0] or layout._key in previous[1]),
+        )
+        return result
+
+    def apply(self: Pack, prop: str, value: object) -> None:
+        # Record the property, so that any refresh it causes can be attributed to it.
+        previous, stats._property = stats._property, prop
+        try:
+            original_apply(self, prop, value)
+        finally:
+            stats._property = previous
+
+    def refresh(self: Widget) -> None:
+        # Only the refresh that started a chain of refreshes (e.g., rather than the
+        # refresh of the root that it causes) is recorded.
+        if not stats._refreshing:
+            trigger = stats._property or sys._getframe(1).f_code.co_name
+            stats._refresh(self, trigger)
+        stats._refreshing += 1
+        try:
+            original_refresh(self)
+        finally:
+            stats._refreshing -= 1
+
+    for cls, name, method in [
+        (Pack, "layout", layout),
+        (Pack, "_layout_node", _layout_node),
+        (Pack, "apply", apply),
+        (Widget, "refresh", refresh),
+    ]:
+        _originals[cls, name] = cls.__dict__[name]
+        setattr(cls, name, method)
+
+    return stats
+
+
+def disable() -> None:
+    """Stop collecting layout statistics, removing all instrumentation."""
+    global _stats
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+    _stats = None
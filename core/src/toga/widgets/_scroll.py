@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from .base import Widget
+
+
+class _NearEnd:
+    def __init__(self, widget: Widget, prefetch_threshold: int):
+        """Tracks when the visible rows of a widget displaying a data source approach
+        the end of the data, for the ``on_near_end`` handler of the widget.
+
+        The handler is invoked once each time the end is approached. The tracker
+        listens to the data source, so that any change to the data allows the handler
+        to be invoked again.
+
+        :param widget: The widget displaying the data.
+        :param prefetch_threshold: Initial :any:`threshold`.
+        """
+        self.widget = widget
+        self.threshold = prefetch_threshold
+        self.handler: Callable[[], object] | None = None
+        self._source: Any = None
+        self._result: object = None
+        self._reached = False
+
+    @property
+    def threshold(self) -> int:
+        """The number of rows from the end of the data at which the handler will be
+        invoked."""
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: int) -> None:
+        value = int(value)
+        if value < 0:
+            raise ValueError("prefetch_threshold must be a non-negative integer")
+        self._threshold = value
+
+    def reset(self, handler: Callable[[], object]) -> None:
+        """Use a new handler, which hasn't been invoked yet."""
+        self.handler = handler
+        self._result = None
+        self._reached = False
+
+    def set_source(self, source: Any) -> None:
+        """Track the end of a new data source."""
+        if self._source is not None:
+            self._source.remove_listener(self)
+        self._source = source
+        self._source.add_listener(self)
+        self._reached = False
+
+    # Any change to the data means that the end can be approached again.
+    def change(self, item: object) -> None:
+        self._reached = False
+
+    def insert(self, index: int, item: object) -> None:
+        self._reached = False
+
+    def remove(self, index: int, item: object) -> None:
+        self._reached = False
+
+    def clear(self) -> None:
+        self._reached = False
+
+    def visible_rows_changed(self, last_row: int) -> None:
+        """Invoke the handler if the visible rows are near the end of the data.
+
+        :param last_row: The index of the last row that is visible.
+        """
+        if asyncio.isfuture(self._result) and not self._result.done():
+            # The previous invocation is still loading.
+            return
+
+        if not self._reached and len(self._source) - 1 - last_row <= self.threshold:
+            self._reached = True
+            self._result = self.handler()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from builtins import id as identifier
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from travertino.declaration import BaseStyle
 from travertino.node import Node
@@ -11,15 +14,91 @@ from toga.style import Pack, TogaApplicator
 
 if TYPE_CHECKING:
     from toga.app import App
+    from toga.fonts import Font
     from toga.window import Window
 
 StyleT = TypeVar("StyleT", bound=BaseStyle)
 
 
+class _Batch:
+    """Changes to widgets that have been deferred until the end of a batch update."""
+
+    #: The number of batches that are open, in any widget tree or window. When there
+    #: are none, a widget doesn't need to look for the batch that applies to it.
+    open = 0
+
+    def __init__(self):
+        _Batch.open += 1
+        # The number of batch contexts that are using this batch.
+        self.depth = 0
+        # The widgets that need to be refreshed, in the order they were modified.
+        self.refreshes: dict[Widget, None] = {}
+        # The font that needs to be applied to each widget.
+        self.fonts: dict[Widget, Font] = {}
+
+    def apply(self) -> None:
+        # A batch is applied once, when it is closed.
+        _Batch.open -= 1
+
+        for widget, font in self.fonts.items():
+            widget._impl.set_font(font)
+
+        # Rehint each modified widget, then lay out each affected widget tree once.
+        roots = {}
+        for widget in self.refreshes:
+            root = widget.root
+            if widget is not root:
+                widget._impl.refresh()
+                widget.layout.dirty()
+            roots[root] = None
+
+        for root in roots:
+            root.refresh()
+
+
 class Widget(Node):
     _MIN_WIDTH = 100
     _MIN_HEIGHT = 100
 
+    #: Should widgets resolve their app, window and root through their parent, rather
+    #: than having them assigned to every descendant?
+    #:
+    #: By default, adding a widget to a parent (or to a window) assigns the app and
+    #: window to the widget and to each of its descendants, so moving a tree of widgets
+    #: takes time proportional to the size of the tree. If this is ``True``, only the
+    #: widget that is moved is updated; its descendants look up their app and window
+    #: through their ancestors when required, and cache the result until the structure
+    #: of their tree changes. In this mode:
+    #:
+    #: * widgets are registered in :any:`App.widgets` while they belong to the app,
+    #:   rather than only while they are in a window. This means that switching the
+    #:   content of a window between trees of widgets that have already been shown
+    #:   doesn't need to update the registry;
+    #: * the backend is only notified of the new app and window of the widget that is
+    #:   moved, not of each of its descendants.
+    #:
+    #: This must be set before any widgets are created.
+    lazy_ancestry: bool = False
+
+    # Only used on the top of a widget tree (a widget without an owner). Incremented
+    # whenever the structure of the tree changes, invalidating the ancestry that has
+    # been cached by each widget in the tree when lazy_ancestry is enabled.
+    _ancestry_generation = 0
+    # The cached ancestry of the widget, as a tuple of (top, generation, root, app,
+    # window), where top is the widget at the top of the tree and generation is the
+    # generation of that tree when the ancestry was cached.
+    _ancestry: tuple[Widget, int, Widget, App | None, Window | None] | None = None
+    # The widget that this widget is a child of, or is the content of.
+    _owner: Widget | None = None
+
+    # Layout state; only used on the root of a widget tree.
+    _layout_pending = False
+    _layout_scheduled = False
+    _layout_running = False
+
+    # The batch update started on this widget, if any.
+    _batch: _Batch | None = None
+
     def __init__(
         self,
         id: str | None = None,
@@ -42,6 +121,8 @@ class Widget(Node):
         self._window: Window | None = None
         self._app: App | None = None
         self._impl: Any = None
+        # Callbacks to invoke once a pending layout has been performed.
+        self._after_layout: list[Callable[[], object]] = []
 
         self.factory = get_platform_factory()
 
@@ -88,15 +169,13 @@ class Widget(Node):
         for child in children:
             if child.parent is not self:
                 # remove from old parent
-                if child.parent:
+                if child.parent and not self.lazy_ancestry:
                     child.parent.remove(child)
 
                 # Set app and window. This is done *before* changing any parenting
                 # relationships, so that the widget registry can verify the widget ID is
-                # unique. App must be set before window to ensure the widget registry
-                # can be found.
-                child.app = self.app
-                child.window = self.window
+                # unique.
+                self._adopt(child)
 
                 # add to new parent
                 super().add(child)
@@ -121,15 +200,13 @@ class Widget(Node):
         self._assert_can_have_children()
         if child.parent is not self:
             # remove from old parent
-            if child.parent:
+            if child.parent and not self.lazy_ancestry:
                 child.parent.remove(child)
 
             # Set app and window. This is done *before* changing any parenting
             # relationships, so that the widget registry can verify the widget ID is
-            # unique. App must be set before window to ensure the widget registry
-            # can be found.
-            child.app = self.app
-            child.window = self.window
+            # unique.
+            self._adopt(child)
 
             # add to new parent
             super().insert(index, child)
@@ -181,11 +258,7 @@ class Widget(Node):
             if child.parent is self:
                 removed = True
                 super().remove(child)
-
-                # Remove from the window before removing from the app
-                # so that the widget can be removed from the app-level registry.
-                child.window = None
-                child.app = None
+                self._release(child)
 
                 self._impl.remove_child(child._impl)
 
@@ -212,10 +285,23 @@ class Widget(Node):
 
         :raises ValueError: If this widget is already associated with another app.
         """
+        if self.lazy_ancestry:
+            return self._resolve_ancestry()[3]
         return self._app
 
     @app.setter
     def app(self, app: App | None) -> None:
+        if self.lazy_ancestry:
+            old_app = self.app
+            if old_app is app:
+                return
+
+            self._move_registration(old_app, app)
+            self._app = app
+            self._invalidate_ancestry()
+            self._impl.set_app(app)
+            return
+
         # If the widget is already assigned to an app
         if self._app:
             if self._app == app:
@@ -237,10 +323,20 @@ class Widget(Node):
         If the widget has a value for :any:`window`, it *must* also have a value for
         :any:`app`.
         """
+        if self.lazy_ancestry:
+            return self._resolve_ancestry()[4]
         return self._window
 
     @window.setter
     def window(self, window: Window | None) -> None:
+        if self.lazy_ancestry:
+            # Widgets are registered while they belong to an app, so the registry
+            # doesn't need to change.
+            self._window = window
+            self._invalidate_ancestry()
+            self._impl.set_window(window)
+            return
+
         if self.window is not None and window is None:
             # If the widget is currently in the registry, but is being removed from a
             # window, remove the widget from the widget registry
@@ -249,12 +345,170 @@ class Widget(Node):
             # If the widget is being assigned to a window for the first time, add it to the widget registry
             window.app.widgets._add(self)
 
+        # Move the widget between the indexes of the widgets in each window.
+        if self._window is not window:
+            if self._window is not None:
+                del self._window._widgets[self.id]
+            if window is not None:
+                window._widgets[self.id] = self
+
         self._window = window
         self._impl.set_window(window)
 
         for child in self.children:
             child.window = window
 
+    @property
+    def root(self) -> Widget:
+        """The root of the widget tree containing this widget.
+
+        This is the widget itself if it doesn't have a parent.
+        """
+        if self.lazy_ancestry:
+            return self._resolve_ancestry()[2]
+        return super().root
+
+    def _set_root(self, node: Widget, root: Widget | None) -> None:
+        if self.lazy_ancestry:
+            # Descendants resolve their root when it is required, so only the root of
+            # the node itself needs to be updated.
+            node._root = root
+            node._invalidate_ancestry()
+        else:
+            super()._set_root(node, root)
+
+    def _resolve_ancestry(
+        self,
+    ) -> tuple[Widget, int, Widget, App | None, Window | None]:
+        """Resolve the root, app and window of the widget when lazy_ancestry is
+        enabled.
+
+        The ancestry is inherited from the widget's owner (its parent, or the container
+        that it is the content of), and is cached until the structure of the widget's
+        tree changes. The widget at the top of the tree provides the app and window
+        that were assigned to it.
+        """
+        ancestry = self._ancestry
+        if ancestry is not None and ancestry[1] == ancestry[0]._ancestry_generation:
+            return ancestry
+
+        # Find the closest owner with an up-to-date cache, or the top of the tree.
+        path = []
+        node: Widget | None = self
+        while node is not None and (
+            node._ancestry is None
+            or node._ancestry[1] != node._ancestry[0]._ancestry_generation
+        ):
+            path.append(node)
+            node = node._owner
+
+        if node is None:
+            top = path[-1]
+            generation, root, app, window = (
+                top._ancestry_generation,
+                top,
+                top._app,
+                top._window,
+            )
+        else:
+            top, generation, root, app, window = node._ancestry
+
+        # A widget without a parent (e.g., the content of a container) is the root of
+        # its own tree.
+        for node in reversed(path):
+            if node._parent is None:
+                root = node
+            node._ancestry = (top, generation, root, app, window)
+
+        return self._ancestry
+
+    def _invalidate_ancestry(self) -> None:
+        """Invalidate the ancestry cached by every widget in the same tree as this
+        widget when lazy_ancestry is enabled. Other trees are unaffected."""
+        self._resolve_ancestry()[0]._ancestry_generation += 1
+
+    def _subwidgets(self) -> list[Widget]:
+        """The widgets that belong to this widget: its children, and for container
+        widgets, their content."""
+        return self.children
+
+    def _subtree(self) -> list[Widget]:
+        """This widget, and every widget that belongs to it."""
+        widgets = []
+        stack = [self]
+        while stack:
+            widget = stack.pop()
+            widgets.append(widget)
+            stack.extend(widget._subwidgets())
+        return widgets
+
+    def _move_registration(self, old_app: App | None, app: App | None) -> None:
+        """Move this widget, and every widget that belongs to it, between the widget
+        registries of two apps when lazy_ancestry is enabled."""
+        if old_app is not app:
+            widgets = self._subtree()
+            # Add to the new registry first, so that nothing changes if any of the
+            # widget IDs aren't unique.
+            if app is not None:
+                app.widgets._update(widgets)
+            if old_app is not None:
+                old_app.widgets._remove_all(widgets)
+
+    def _adopt(self, widget: Widget) -> None:
+        """Assign this widget's app and window to a widget that is becoming one of its
+        children, or its content.
+
+        :param widget: The widget that is being adopted.
+        """
+        if not self.lazy_ancestry:
+            # App must be set before window to ensure the widget registry can be found.
+            widget.app = self.app
+            widget.window = self.window
+            return
+
+        app = self.app
+        widget._move_registration(widget.app, app)
+
+        # Both the tree that the widget is leaving, and the tree that it is joining,
+        # are changing structure.
+        widget._invalidate_ancestry()
+        self._invalidate_ancestry()
+
+        # The widget has already been registered with this widget's app, so it can be
+        # removed from its previous parent without updating the registry.
+        parent = widget._parent
+        if parent is not None:
+            Node.remove(parent, widget)
+            parent._impl.remove_child(widget._impl)
+            parent.refresh()
+
+        widget._owner = self
+        widget._app = None
+        widget._window = None
+        widget._impl.set_app(app)
+        widget._impl.set_window(self.window)
+
+    def _release(self, widget: Widget) -> None:
+        """Remove the app and window from a widget that is no longer one of this
+        widget's children, or its content.
+
+        :param widget: The widget that is being released.
+        """
+        if not self.lazy_ancestry:
+            # Remove from the window before removing from the app
+            # so that the widget can be removed from the app-level registry.
+            widget.window = None
+            widget.app = None
+            return
+
+        widget._move_registration(self.app, None)
+        self._invalidate_ancestry()
+        widget._owner = None
+        widget._app = None
+        widget._window = None
+        widget._impl.set_window(None)
+        widget._impl.set_app(None)
+
     @property
     def enabled(self) -> bool:
         """Is the widget currently enabled? i.e., can the user interact with the widget?"""
@@ -264,19 +518,126 @@ class Widget(Node):
     def enabled(self, value: bool) -> None:
         self._impl.set_enabled(bool(value))
 
+    def _current_batch(self) -> _Batch | None:
+        """The batch update that applies to this widget, if any."""
+        if not _Batch.open:
+            return None
+
+        window = self.window
+        if window is not None and window._batch is not None:
+            return window._batch
+
+        node = self
+        while node is not None:
+            if node._batch is not None:
+                return node._batch
+            node = node._parent
+        return None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Obtain a context in which changes to this widget, and its descendants, are
+        applied as a single update.
+
+        Inside the context, changes to the layout of the widget tree (for example,
+        adding widgets, or changing their style or content) are recorded, but not acted
+        upon. When the context exits, each modified widget is rehinted once, and the
+        widget tree is laid out once. This is useful when constructing or modifying a
+        large number of widgets.
+
+        Batch contexts can be nested; the changes are applied when the outermost
+        context exits.
+        """
+        batch = self._current_batch()
+        if batch is None:
+            batch = self._batch = _Batch()
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0:
+                # Only the context that opened the batch can close it.
+                self._batch = None
+                batch.apply()
+
     def refresh(self) -> None:
+        batch = self._current_batch()
+        if batch is not None:
+            # The refresh will be performed when the batch update is complete.
+            batch.refreshes[self] = None
+            return
+
         self._impl.refresh()
+        self.layout.dirty()
 
         # Refresh the layout
-        if self._root:
+        root = self.root
+        if root is not self:
             # We're not the root of the node hierarchy;
             # defer the refresh call to the root node.
-            self._root.refresh()
+            root.refresh()
         else:
             # We can't compute a layout until we have a container
             if self._impl.container:
-                super().refresh(self._impl.container)
-                self._impl.container.refreshed()
+                self._layout_pending = True
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # There's no event loop running (e.g., the app hasn't started
+                    # yet), so there's no later point at which to do the layout.
+                    self.flush_layout()
+                else:
+                    # Defer the layout until the current event loop iteration has
+                    # completed, so that multiple changes result in a single layout.
+                    if not self._layout_scheduled:
+                        self._layout_scheduled = True
+                        loop.call_soon(self._scheduled_layout)
+
+    def _scheduled_layout(self) -> None:
+        self._layout_scheduled = False
+        self.flush_layout()
+
+    def flush_layout(self) -> None:
+        """Perform any pending layout of the widget tree that contains this widget.
+
+        When a widget is modified while the app's event loop is running, the layout of
+        the widget tree isn't updated immediately; instead, it is updated once the
+        current iteration of the event loop has completed. This means that a handler
+        that modifies many widgets will only cause one layout. This method can be used
+        to perform the pending layout immediately, so that the geometry of widgets
+        reflects any changes that have been made.
+        """
+        root = self.root
+        container = root._impl.container
+        if root._layout_pending and container:
+            root._layout_pending = False
+            root._layout_running = True
+            try:
+                # The backend may have deferred rehinting some widgets until the
+                # next layout; once the layout is complete, the backend doesn't need
+                # to lay out the content again.
+                container.refreshing()
+                Node.refresh(root, container)
+                container.refreshed()
+            finally:
+                root._layout_running = False
+
+            callbacks, root._after_layout = root._after_layout, []
+            for callback in callbacks:
+                callback()
+
+    def _call_after_layout(self, callback: Callable[[], object]) -> None:
+        """Invoke a callback once any pending layout has been performed.
+
+        :param callback: The callback to invoke. If there is no pending layout, and a
+            layout isn't in progress, it will be invoked immediately.
+        """
+        root = self.root
+        if (root._layout_pending or root._layout_running) and root._impl.container:
+            root._after_layout.append(callback)
+        else:
+            callback()
 
     def focus(self) -> None:
         """Give this widget the input focus.
@@ -8,6 +8,7 @@ import toga
 from toga.handlers import wrapped_handler
 from toga.sources import ListSource, Row, Source
 
+from ._scroll import _NearEnd
 from .base import StyleT, Widget
 
 SourceT = TypeVar("SourceT", bound=Source)
@@ -51,6 +52,15 @@ class OnSelectHandler(Protocol):
         """
 
 
+class OnNearEndHandler(Protocol):
+    def __call__(self, widget: DetailedList, /, **kwargs: Any) -> object:
+        """A handler to invoke when the visible rows approach the end of the list.
+
+        :param widget: The DetailedList that is approaching its end.
+        :param kwargs: Ensures compatibility with arguments added in future versions.
+        """
+
+
 class DetailedList(Widget):
     def __init__(
         self,
@@ -65,6 +75,8 @@ class DetailedList(Widget):
         on_secondary_action: OnSecondaryActionHandler | None = None,
         on_refresh: OnRefreshHandler | None = None,
         on_select: toga.widgets.detailedlist.OnSelectHandler | None = None,
+        on_near_end: toga.widgets.detailedlist.OnNearEndHandler | None = None,
+        prefetch_threshold: int = 10,
         on_delete: None = None,  # DEPRECATED
     ):
         """Create a new DetailedList widget.
@@ -83,6 +95,8 @@ class DetailedList(Widget):
         :param secondary_action: The name for the secondary action.
         :param on_secondary_action: Initial :any:`on_secondary_action` handler.
         :param on_refresh: Initial :any:`on_refresh` handler.
+        :param on_near_end: Initial :any:`on_near_end` handler.
+        :param prefetch_threshold: Initial :any:`prefetch_threshold`.
         :param on_delete: **DEPRECATED**; use ``on_primary_action``.
         """
         super().__init__(id=id, style=style)
@@ -109,6 +123,8 @@ class DetailedList(Widget):
         self._primary_action = primary_action
         self._secondary_action = secondary_action
         self.on_select = None
+        self._near_end = _NearEnd(self, prefetch_threshold)
+        self.on_near_end = None
 
         self._data: SourceT | ListSource = None
 
@@ -119,6 +135,7 @@ class DetailedList(Widget):
         self.on_secondary_action = on_secondary_action
         self.on_refresh = on_refresh
         self.on_select = on_select
+        self.on_near_end = on_near_end
 
     @property
     def enabled(self) -> Literal[True]:
@@ -162,6 +179,7 @@ class DetailedList(Widget):
             self._data = ListSource(data=data, accessors=self.accessors)
 
         self._data.add_listener(self._impl)
+        self._near_end.set_source(self._data)
         self._impl.change_source(source=self._data)
 
     def scroll_to_top(self) -> None:
@@ -269,6 +287,41 @@ class DetailedList(Widget):
     def on_select(self, handler: toga.widgets.detailedlist.OnSelectHandler) -> None:
         self._on_select = wrapped_handler(self, handler)
 
+    @property
+    def on_near_end(self) -> OnNearEndHandler:
+        """The callback function that is invoked when the visible rows of the list come
+        within :any:`prefetch_threshold` rows of the end of the data.
+
+        This can be used to load the next page of data before the user reaches the end
+        of the list. The handler is invoked once each time the end is approached; it
+        won't be invoked again until the data has changed. If the handler is
+        asynchronous, it won't be invoked again until it has completed.
+        """
+        return self._on_near_end
+
+    @on_near_end.setter
+    def on_near_end(self, handler: toga.widgets.detailedlist.OnNearEndHandler) -> None:
+        self._on_near_end = wrapped_handler(self, handler)
+        self._near_end.reset(self._on_near_end)
+
+    @property
+    def prefetch_threshold(self) -> int:
+        """The number of rows from the end of the data at which :any:`on_near_end` will
+        be invoked.
+        """
+        return self._near_end.threshold
+
+    @prefetch_threshold.setter
+    def prefetch_threshold(self, value: int) -> None:
+        self._near_end.threshold = value
+
+    def _visible_rows_changed(self, last_row: int) -> None:
+        """Invoked by the backend when the rows that are visible have changed.
+
+        :param last_row: The index of the last row that is visible.
+        """
+        self._near_end.visible_rows_changed(last_row)
+
     ######################################################################
     # 2023-06: Backwards compatibility
     ######################################################################
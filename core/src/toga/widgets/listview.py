@@ -0,0 +1,463 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, Protocol, TypeVar
+
+from toga.sources import ListSource, Source
+from toga.style.pack import COLUMN, Pack
+
+from .base import StyleT, Widget
+from .box import Box
+from .scrollcontainer import OnScrollHandler, ScrollContainer
+
+SourceT = TypeVar("SourceT", bound=Source)
+
+
+class RowFactory(Protocol):
+    def __call__(self, row: Any, widget: Widget | None, /) -> Widget:
+        """A function that provides the widget used to display a row of data.
+
+        :param row: The row of data that will be displayed.
+        :param widget: A widget that was previously returned by the factory, but is no
+            longer displaying a row. The factory can update and return this widget
+            rather than creating a new one. If no widget is available for reuse, this
+            will be :any:`None`.
+        :returns: The widget that will display the row.
+        """
+
+
+class _HeightIndex:
+    def __init__(self, heights: list[int | None]):
+        """The heights of the rows of a list, indexed by position.
+
+        The index is a pair of Fenwick trees over the measured heights, and the number
+        of measured rows. This allows the total height of the rows above any position,
+        and the row at any vertical offset, to be found in O(log n) time, even though
+        the height assumed for rows that haven't been measured can change.
+
+        :param heights: The measured height of each row, or :any:`None` for rows that
+            haven't been measured.
+        """
+        self.heights = heights
+        self._build()
+
+    def _build(self) -> None:
+        size = len(self.heights)
+        self._sums = [0] * (size + 1)
+        self._counts = [0] * (size + 1)
+        for index, height in enumerate(self.heights, start=1):
+            if height is not None:
+                self._sums[index] += height
+                self._counts[index] += 1
+            parent = index + (index & -index)
+            if parent <= size:
+                self._sums[parent] += self._sums[index]
+                self._counts[parent] += self._counts[index]
+
+    def __len__(self) -> int:
+        return len(self.heights)
+
+    def _update(self, index: int, height: int, count: int) -> None:
+        index += 1
+        while index <= len(self.heights):
+            self._sums[index] += height
+            self._counts[index] += count
+            index += index & -index
+
+    def measure(self, index: int, height: int | None) -> None:
+        """Record (or with :any:`None`, forget) the measured height of a row."""
+        old_height = self.heights[index]
+        if old_height is not None:
+            self._update(index, -old_height, -1)
+        if height is not None:
+            self._update(index, height, 1)
+        self.heights[index] = height
+
+    def insert(self, index: int, height: int | None) -> None:
+        """Insert a row.
+
+        Appending a row takes O(log n) time; inserting a row anywhere else requires
+        the index to be rebuilt.
+
+        :param index: The position of the new row.
+        :param height: The measured height of the row, or :any:`None` if it hasn't
+            been measured.
+        """
+        if index != len(self.heights):
+            self.heights.insert(index, height)
+            self._build()
+            return
+
+        self.heights.append(height)
+        # The new node of each tree covers the rows after the node that precedes it
+        # at the same level; add up the nodes that cover those rows.
+        position = len(self.heights)
+        total, count = (0, 0) if height is None else (height, 1)
+        child = position - 1
+        while child > position - (position & -position):
+            total += self._sums[child]
+            count += self._counts[child]
+            child -= child & -child
+        self._sums.append(total)
+        self._counts.append(count)
+
+    def remove(self, index: int) -> None:
+        """Remove a row.
+
+        Removing the last row takes O(1) time; removing any other row requires the
+        index to be rebuilt.
+
+        :param index: The position of the row.
+        """
+        if index != len(self.heights) - 1:
+            del self.heights[index]
+            self._build()
+            return
+
+        # No node covers a row after itself, so only the last node includes the row.
+        self.heights.pop()
+        self._sums.pop()
+        self._counts.pop()
+
+    def height(self, index: int, row_height: float) -> float:
+        """The height of a row.
+
+        :param row_height: The height assumed for rows that haven't been measured.
+        """
+        height = self.heights[index]
+        return row_height if height is None else height
+
+    def total(self, row_height: float) -> float:
+        """The total height of all the rows."""
+        total, count = 0, 0
+        index = len(self.heights)
+        while index:
+            total += self._sums[index]
+            count += self._counts[index]
+            index -= index & -index
+        return total + (len(self.heights) - count) * row_height
+
+    def find(self, y: float, row_height: float) -> tuple[int, float]:
+        """Find the first row that ends below a vertical offset.
+
+        :param y: The vertical offset.
+        :param row_height: The height assumed for rows that haven't been measured.
+        :returns: The index of the row, and the total height of the rows above it.
+        """
+        index, above = 0, 0.0
+        step = 1 << len(self.heights).bit_length()
+        while step:
+            next_index = index + step
+            if next_index <= len(self.heights):
+                height = (
+                    self._sums[next_index]
+                    + (step - self._counts[next_index]) * row_height
+                )
+                if above + height <= y:
+                    index = next_index
+                    above += height
+            step >>= 1
+        return index, above
+
+
+class _SourceListener:
+    """A listener that forwards data source notifications to a ListView.
+
+    ListView can't be a listener itself, because the ``insert``, ``remove`` and
+    ``clear`` methods of a widget are used to manage child widgets.
+    """
+
+    def __init__(self, list_view: ListView):
+        self.list_view = list_view
+
+    def change(self, item: object) -> None:
+        self.list_view._change_row(item)
+
+    def insert(self, index: int, item: object) -> None:
+        self.list_view._insert_row(index, item)
+
+    def remove(self, index: int, item: object) -> None:
+        self.list_view._remove_row(index, item)
+
+    def clear(self) -> None:
+        self.list_view._reset_heights()
+        self.list_view._update_rows()
+
+
+class ListView(ScrollContainer):
+    def __init__(
+        self,
+        row_factory: RowFactory,
+        id: str | None = None,
+        style: StyleT | None = None,
+        data: SourceT | Iterable | None = None,
+        accessors: Iterable[str] = ("value",),
+        estimated_row_height: int = 50,
+        on_scroll: OnScrollHandler | None = None,
+    ):
+        """Create a new ListView widget.
+
+        :param row_factory: A function that provides the widget used to display each
+            row of data.
+        :param id: The ID for the widget.
+        :param style: A style object. If no style is provided, a default style will be
+            applied to the widget.
+        :param data: Initial :any:`data` to be displayed in the list.
+        :param accessors: The accessors to use when converting ``data`` into a
+            :any:`ListSource`. By default, each item of data is stored in the ``value``
+            attribute of a row.
+        :param estimated_row_height: The height that will be assumed for rows that
+            haven't been displayed, until the height of at least one row has been
+            measured.
+        :param on_scroll: Initial :any:`on_scroll` handler.
+        """
+        # Scroll events can be generated while the container is being created, so
+        # prime the properties used to display rows.
+        self._data: SourceT | ListSource | None = None
+        self._row_factory = row_factory
+        self._accessors = list(accessors)
+        self._listener = _SourceListener(self)
+        self._estimated_row_height = estimated_row_height
+
+        # The rows currently displayed, as a map of id(row) -> (row, widget), and the
+        # position of each displayed row in the data source.
+        self._row_widgets: dict[int, tuple[Any, Widget]] = {}
+        self._row_indices: dict[int, int] = {}
+        # Widgets that are no longer displaying a row, and can be reused.
+        self._recycled: list[Widget] = []
+        # The measured heights of rows, as a map of id(row) -> height, plus the
+        # total of all measured heights.
+        self._row_heights: dict[int, int] = {}
+        self._measured_height = 0
+        # The measured heights, indexed by the position of each row. The index is
+        # updated when rows are inserted or removed, and rebuilt if the position of a
+        # change isn't known.
+        self._height_index: _HeightIndex | None = None
+        # The height of the viewport when the visible rows were last determined.
+        self._viewport_height = 0
+
+        # Spacers stand in for the rows above and below the visible rows.
+        self._top_spacer = Box(style=Pack(height=0))
+        self._bottom_spacer = Box(style=Pack(height=0))
+
+        super().__init__(
+            id=id,
+            style=style,
+            horizontal=False,
+            on_scroll=on_scroll,
+            content=Box(
+                style=Pack(direction=COLUMN),
+                children=[self._top_spacer, self._bottom_spacer],
+            ),
+        )
+
+        self.data = data
+
+    @property
+    def data(self) -> SourceT | ListSource:
+        """The data to display in the list.
+
+        When setting this property:
+
+        * A :any:`Source` will be used as-is. It must either be a :any:`ListSource`, or
+          a custom class that provides the same methods.
+
+        * A value of None is turned into an empty ListSource.
+
+        * Otherwise, the value must be an iterable, which is copied into a new
+          ListSource. Items are converted as shown :ref:`here <listsource-item>`.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data: SourceT | Iterable | None) -> None:
+        if self._data is not None:
+            self._data.remove_listener(self._listener)
+
+        if data is None:
+            self._data = ListSource(data=[], accessors=self._accessors)
+        elif isinstance(data, Source):
+            self._data = data
+        else:
+            self._data = ListSource(data=data, accessors=self._accessors)
+
+        self._data.add_listener(self._listener)
+
+        self._reset_heights()
+        self._update_rows()
+
+    @property
+    def visible_rows(self) -> list[Any]:
+        """The rows of data that currently have a widget displaying them (read-only)"""
+        return [row for row, widget in self._row_widgets.values()]
+
+    def refresh(self) -> None:
+        super().refresh()
+        # The size of the viewport may have changed.
+        self._call_after_layout(self._update_rows)
+
+    def _scrolled(self) -> None:
+        # Bring the rows into view before any handlers are invoked.
+        self._update_rows()
+        super()._scrolled()
+
+    def _resized(self) -> None:
+        # If the viewport has grown, more rows may need to be displayed. The rows are
+        # updated once the layout that changed the size is complete.
+        if self.layout.content_height != self._viewport_height:
+            self._call_after_layout(self._update_rows)
+
+    ######################################################################
+    # Row management
+    ######################################################################
+
+    def _row_height(self) -> float:
+        """The height assumed for a row that hasn't been measured."""
+        if self._row_heights:
+            return self._measured_height / len(self._row_heights)
+        return self._estimated_row_height
+
+    def _forget_height(self, row: Any) -> None:
+        try:
+            self._measured_height -= self._row_heights.pop(id(row))
+        except KeyError:
+            return
+
+        if self._height_index is not None and id(row) in self._row_indices:
+            self._height_index.measure(self._row_indices[id(row)], None)
+        else:
+            # The position of a row that isn't displayed isn't known.
+            self._height_index = None
+
+    def _insert_row(self, index: int, row: Any) -> None:
+        heights = self._height_index
+        if (
+            heights is not None
+            and len(heights) + 1 == len(self._data)
+            and 0 <= index < len(self._data)
+            and self._data[index] is row
+        ):
+            heights.insert(index, self._row_heights.get(id(row)))
+        else:
+            # The notification doesn't describe where the row was inserted.
+            self._height_index = None
+        self._update_rows()
+
+    def _remove_row(self, index: int, row: Any) -> None:
+        heights = self._height_index
+        if (
+            heights is not None
+            and len(heights) - 1 == len(self._data)
+            and 0 <= index < len(heights)
+        ):
+            heights.remove(index)
+        else:
+            # The notification doesn't describe where the row was removed from.
+            self._height_index = None
+        try:
+            self._measured_height -= self._row_heights.pop(id(row))
+        except KeyError:
+            pass
+        self._update_rows()
+
+    def _reset_heights(self) -> None:
+        self._row_heights = {}
+        self._measured_height = 0
+        self._height_index = None
+
+    def _heights(self) -> _HeightIndex:
+        """The height index for the current content of the data source."""
+        if self._height_index is None:
+            self._height_index = _HeightIndex(
+                [self._row_heights.get(id(row)) for row in self._data]
+            )
+        return self._height_index
+
+    def _change_row(self, row: Any) -> None:
+        self._forget_height(row)
+        try:
+            _, widget = self._row_widgets[id(row)]
+        except KeyError:
+            # The row isn't being displayed, so there's nothing to update.
+            return
+
+        new_widget = self._row_factory(row, widget)
+        if new_widget is not widget:
+            self._row_widgets[id(row)] = (row, new_widget)
+            self.content.replace(widget, new_widget)
+            self._recycled.append(widget)
+
+        self._update_rows()
+
+    def _update_rows(self) -> None:
+        """Display the rows that intersect the visible area of the container."""
+        if self._data is None:
+            return
+
+        row_height = self._row_height()
+        self._viewport_height = self.layout.content_height
+        viewport_height = self._viewport_height or self._MIN_HEIGHT
+        top = self.vertical_position
+        bottom = top + viewport_height
+
+        # Find the rows that intersect the viewport, using measured heights where
+        # they're known.
+        heights = self._heights()
+        index, above = heights.find(top, row_height)
+        visible = []
+        y = above
+        while index < len(heights) and y < bottom:
+            visible.append((index, self._data[index]))
+            y += heights.height(index, row_height)
+            index += 1
+
+        below = max(heights.total(row_height) - y, 0)
+
+        # Release the widgets for rows that are no longer visible.
+        self._row_indices = {id(row): index for index, row in visible}
+        released = []
+        for key in list(self._row_widgets):
+            if key not in self._row_indices:
+                _, widget = self._row_widgets.pop(key)
+                released.append(widget)
+        if released:
+            self.content.remove(*released)
+            self._recycled.extend(released)
+
+        # Add widgets for rows that have become visible. Rows keep their relative
+        # order in the data source, so the rows that remain visible are already in
+        # order.
+        for position, (_, row) in enumerate(visible, start=1):
+            if id(row) not in self._row_widgets:
+                widget = self._row_factory(
+                    row, self._recycled.pop() if self._recycled else None
+                )
+                self._row_widgets[id(row)] = (row, widget)
+                self.content.insert(position, widget)
+
+        if self._top_spacer.style.height != int(above):
+            self._top_spacer.style.height = int(above)
+        if self._bottom_spacer.style.height != int(below):
+            self._bottom_spacer.style.height = int(below)
+
+        # Record the height of the rows once they have been laid out.
+        self.content._call_after_layout(self._measure_rows)
+
+    def _measure_rows(self) -> None:
+        heights = self._heights()
+        measured = False
+        for key, (row, widget) in self._row_widgets.items():
+            if key not in self._row_heights and widget.layout.content_height:
+                height = (
+                    widget.style.padding_top
+                    + widget.layout.content_height
+                    + widget.style.padding_bottom
+                )
+                self._row_heights[key] = height
+                self._measured_height += height
+                heights.measure(self._row_indices[key], height)
+                measured = True
+
+        if measured:
+            # The height assumed for unmeasured rows may have changed.
+            self._update_rows()
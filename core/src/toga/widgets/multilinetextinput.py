@@ -17,6 +17,20 @@ class OnChangeHandler(Protocol):
         """
 
 
+def _count_lines(lines: tuple[int, bool], text: str) -> tuple[int, bool]:
+    """Count the lines that result from adding text to the end of a value.
+
+    :param lines: The lines in the value, as a tuple of the number of complete lines
+        (i.e., the number of newlines), and whether the value ends with an incomplete
+        line.
+    :param text: The text to add.
+    :returns: The lines in the value once the text has been added.
+    """
+    if not text:
+        return lines
+    return lines[0] + text.count("\n"), not text.endswith("\n")
+
+
 class MultilineTextInput(Widget):
     def __init__(
         self,
@@ -26,6 +40,7 @@ class MultilineTextInput(Widget):
         readonly: bool = False,
         placeholder: str | None = None,
         on_change: toga.widgets.multilinetextinput.OnChangeHandler | None = None,
+        max_lines: int | None = None,
     ):
         """Create a new multi-line text input widget.
 
@@ -38,6 +53,8 @@ class MultilineTextInput(Widget):
             there is no user content to display.
         :param on_change: A handler that will be invoked when the value of
             the widget changes.
+        :param max_lines: The maximum number of lines of text to retain when text is
+            added using :meth:`append`.
         """
 
         super().__init__(id=id, style=style)
@@ -48,6 +65,10 @@ class MultilineTextInput(Widget):
         # Set a dummy handler before installing the actual on_change, because we do not want
         # on_change triggered by the initial value being set
         self.on_change = None
+        self.max_lines = max_lines
+        # The lines in the value, as counted by _count_lines(); or None if the value
+        # has been changed by the user, so the lines need to be counted again.
+        self._lines: tuple[int, bool] | None = None
         self.value = value
 
         # Set all the properties
@@ -94,7 +115,60 @@ class MultilineTextInput(Widget):
 
     @value.setter
     def value(self, value: object) -> None:
-        self._impl.set_value("" if value is None else str(value))
+        value = "" if value is None else str(value)
+        self._impl.set_value(value)
+        self._lines = _count_lines((0, False), value)
+        self.refresh()
+
+    @property
+    def max_lines(self) -> int | None:
+        """The maximum number of lines of text to retain when text is added using
+        :meth:`append`, or :any:`None` if the number of lines is unlimited.
+
+        When :meth:`append` causes the number of lines to exceed this limit, lines are
+        removed from the start of the text. Lines are removed in chunks of a tenth of
+        the limit, so that a stream of appends doesn't need to remove lines every time
+        text is added. A newline at the end of the text ends the last line, rather than
+        starting a new one.
+        """
+        return self._max_lines
+
+    @max_lines.setter
+    def max_lines(self, value: int | None) -> None:
+        if value is not None:
+            value = int(value)
+            if value < 1:
+                raise ValueError("max_lines must be a positive integer")
+        self._max_lines = value
+
+    def append(self, value: object) -> None:
+        """Add text to the end of the widget's value.
+
+        This is more efficient than updating :any:`value`, as only the new text is
+        passed to the native widget. If the view is scrolled to the bottom of the text
+        when text is appended, it will remain scrolled to the bottom, so that the new
+        text is visible; otherwise, the scroll position won't change.
+
+        :param value: The text to append. Any object other than a string will be
+            converted to a string using ``str()``.
+        """
+        value = str(value)
+        lines = self._lines
+        self._impl.append(value)
+        # Only the appended text needs to be counted, unless the value has been
+        # changed by the user since the lines were last counted.
+        if lines is None:
+            lines = _count_lines((0, False), self.value)
+        else:
+            lines = _count_lines(lines, value)
+
+        line_count = lines[0] + lines[1]
+        if self.max_lines is not None and line_count > self.max_lines:
+            count = line_count - self.max_lines + self.max_lines // 10
+            self._impl.remove_lines(count)
+            lines = (lines[0] - count, lines[1])
+
+        self._lines = lines
         self.refresh()
 
     def scroll_to_bottom(self) -> None:
@@ -115,3 +189,11 @@ class MultilineTextInput(Widget):
         self, handler: toga.widgets.multilinetextinput.OnChangeHandler
     ) -> None:
         self._on_change = wrapped_handler(self, handler)
+
+    def _value_changed(self) -> None:
+        """Forget the lines that have been counted, and invoke the on_change handler."""
+        # If the user changed the value, the lines will need to be counted again.
+        # Changes made through the interface count the lines once the change is
+        # complete.
+        self._lines = None
+        self.on_change()
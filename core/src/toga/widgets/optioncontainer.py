@@ -188,6 +188,7 @@ class OptionItem:
 
         self._index = index
         self._interface = interface
+        interface._adopt(self.content)
         interface._impl.add_option(index, text, self.content._impl, icon)
 
         # The option now exists on the implementation; finalize the display properties
@@ -231,6 +232,7 @@ class OptionList:
 
         self.interface._impl.remove_option(index)
         del self._options[index]
+        self.interface._release(deleted_item.content)
         # Update the index for each of the options
         # after the one that was removed.
         for option in self._options[index:]:
@@ -464,6 +466,9 @@ class OptionContainer(Widget):
 
         self._impl.set_current_tab_index(index)
 
+    def _subwidgets(self) -> list[Widget]:
+        return [item._content for item in self._content]
+
     @Widget.app.setter
     def app(self, app) -> None:
         # Invoke the superclass property setter
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Literal, Protocol, SupportsInt
 
 from toga.handlers import wrapped_handler
@@ -20,6 +21,16 @@ class OnScrollHandler(Protocol):
         """
 
 
+class OnNearEndHandler(Protocol):
+    def __call__(self, widget: ScrollContainer, /, **kwargs: Any) -> object:
+        """A handler to invoke when the container is scrolled close to the end of its
+        content.
+
+        :param widget: The ScrollContainer that is approaching its end.
+        :param kwargs: Ensures compatibility with arguments added in future versions.
+        """
+
+
 class ScrollContainer(Widget):
     def __init__(
         self,
@@ -29,6 +40,8 @@ class ScrollContainer(Widget):
         vertical: bool = True,
         on_scroll: OnScrollHandler | None = None,
         content: Widget | None = None,
+        on_near_end: OnNearEndHandler | None = None,
+        prefetch_threshold: int = 200,
     ):
         """Create a new Scroll Container.
 
@@ -39,11 +52,15 @@ class ScrollContainer(Widget):
         :param vertical: Should horizontal scrolling be permitted?
         :param on_scroll: Initial :any:`on_scroll` handler.
         :param content: The content to display in the scroll window.
+        :param on_near_end: Initial :any:`on_near_end` handler.
+        :param prefetch_threshold: Initial :any:`prefetch_threshold`.
         """
         super().__init__(id=id, style=style)
 
         self._content: Widget | None = None
         self.on_scroll = None
+        self.on_near_end = None
+        self.prefetch_threshold = prefetch_threshold
 
         # Create a platform specific implementation of a Scroll Container
         self._impl = self.factory.ScrollContainer(interface=self)
@@ -53,6 +70,10 @@ class ScrollContainer(Widget):
         self.horizontal = horizontal
         self.content = content
         self.on_scroll = on_scroll
+        self.on_near_end = on_near_end
+
+    def _subwidgets(self) -> list[Widget]:
+        return [self._content] if self._content else []
 
     @Widget.app.setter
     def app(self, app) -> None:
@@ -97,13 +118,10 @@ class ScrollContainer(Widget):
     @content.setter
     def content(self, widget: Widget | None) -> None:
         if self._content:
-            # Clear the window before the app so that registry entries can be cleared
-            self._content.window = None
-            self._content.app = None
+            self._release(self._content)
 
         if widget:
-            widget.app = self.app
-            widget.window = self.window
+            self._adopt(widget)
             self._impl.set_content(widget._impl)
         else:
             self._impl.set_content(None)
@@ -143,6 +161,63 @@ class ScrollContainer(Widget):
     def on_scroll(self, on_scroll: OnScrollHandler) -> None:
         self._on_scroll = wrapped_handler(self, on_scroll)
 
+    @property
+    def on_near_end(self) -> OnNearEndHandler:
+        """Handler to invoke when the container is scrolled to within
+        :any:`prefetch_threshold` of the bottom of the content.
+
+        This can be used to load more content before the user reaches the end of the
+        content that is currently displayed. The handler is invoked once each time the
+        end is approached; it won't be invoked again until the size of the content has
+        changed. If the handler is asynchronous, it won't be invoked again until it has
+        completed. The handler is only invoked if vertical scrolling is enabled.
+        """
+        return self._on_near_end
+
+    @on_near_end.setter
+    def on_near_end(self, handler: OnNearEndHandler) -> None:
+        self._on_near_end = wrapped_handler(self, handler)
+        self._near_end_result = None
+        self._near_end_position = None
+
+    @property
+    def prefetch_threshold(self) -> int:
+        """The distance from the bottom of the content, in CSS pixels, at which
+        :any:`on_near_end` will be invoked.
+        """
+        return self._prefetch_threshold
+
+    @prefetch_threshold.setter
+    def prefetch_threshold(self, value: int) -> None:
+        value = int(value)
+        if value < 0:
+            raise ValueError("prefetch_threshold must be a non-negative integer")
+        self._prefetch_threshold = value
+
+    def _scrolled(self) -> None:
+        """Invoked by the backend whenever the container has been scrolled."""
+        self._check_near_end()
+        self.on_scroll()
+
+    def _check_near_end(self) -> None:
+        if not self.vertical:
+            return
+
+        if asyncio.isfuture(self._near_end_result) and not self._near_end_result.done():
+            # The previous invocation is still loading.
+            return
+
+        max_position = self.max_vertical_position
+        if (
+            max_position - self.vertical_position <= self.prefetch_threshold
+            and max_position != self._near_end_position
+        ):
+            self._near_end_position = max_position
+            self._near_end_result = self.on_near_end()
+
+    def _resized(self) -> None:
+        """Invoked by the backend whenever the size of the container has changed."""
+
     @property
     def max_horizontal_position(self) -> int:
         """The maximum horizontal scroll position (read-only)."""
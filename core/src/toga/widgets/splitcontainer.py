@@ -121,8 +121,11 @@ class SplitContainer(Widget):
             flex.append(flex_value)
 
             if widget:
-                widget.app = self.app
-                widget.window = self.window
+                self._adopt(widget)
+
+        for widget in self._content:
+            if widget is not None and widget not in _content:
+                self._release(widget)
 
         self._impl.set_content(
             list(w._impl if w is not None else None for w in _content),
@@ -131,6 +134,9 @@ class SplitContainer(Widget):
         self._content = list(_content)
         self.refresh()
 
+    def _subwidgets(self) -> list[Widget]:
+        return [widget for widget in self._content if widget is not None]
+
     @Widget.app.setter
     def app(self, app: App | None) -> None:
         # Invoke the superclass property setter
@@ -9,6 +9,7 @@ from toga.handlers import wrapped_handler
 from toga.sources import ListSource, Row, Source
 from toga.sources.accessors import build_accessors, to_accessor
 
+from ._scroll import _NearEnd
 from .base import StyleT, Widget
 
 SourceT = TypeVar("SourceT", bound=Source)
@@ -33,6 +34,15 @@ class OnActivateHandler(Protocol):
         """
 
 
+class OnNearEndHandler(Protocol):
+    def __call__(self, widget: Table, /, **kwargs: Any) -> object:
+        """A handler to invoke when the visible rows approach the end of the table.
+
+        :param widget: The Table that is approaching its end.
+        :param kwargs: Ensures compatibility with arguments added in future versions.
+        """
+
+
 class Table(Widget):
     def __init__(
         self,
@@ -45,6 +55,8 @@ class Table(Widget):
         on_select: toga.widgets.table.OnSelectHandler | None = None,
         on_activate: toga.widgets.table.OnActivateHandler | None = None,
         missing_value: str = "",
+        on_near_end: toga.widgets.table.OnNearEndHandler | None = None,
+        prefetch_threshold: int = 10,
         on_double_click: None = None,  # DEPRECATED
     ):
         """Create a new Table widget.
@@ -76,6 +88,8 @@ class Table(Widget):
         :param missing_value: The string that will be used to populate a cell when the
             value provided by its accessor is :any:`None`, or the accessor isn't
             defined.
+        :param on_near_end: Initial :any:`on_near_end` handler.
+        :param prefetch_threshold: Initial :any:`prefetch_threshold`.
         :param on_double_click: **DEPRECATED**; use :attr:`on_activate`.
         """
         super().__init__(id=id, style=style)
@@ -117,6 +131,8 @@ class Table(Widget):
         # Prime some properties that need to exist before the table is created.
         self.on_select = None
         self.on_activate = None
+        self._near_end = _NearEnd(self, prefetch_threshold)
+        self.on_near_end = None
         self._data = None
 
         self._impl = self.factory.Table(interface=self)
@@ -124,6 +140,7 @@ class Table(Widget):
 
         self.on_select = on_select
         self.on_activate = on_activate
+        self.on_near_end = on_near_end
 
     @property
     def enabled(self) -> Literal[True]:
@@ -167,6 +184,7 @@ class Table(Widget):
             self._data = ListSource(accessors=self._accessors, data=data)
 
         self._data.add_listener(self._impl)
+        self._near_end.set_source(self._data)
         self._impl.change_source(source=self._data)
 
     @property
@@ -232,6 +250,41 @@ class Table(Widget):
     def on_activate(self, handler: toga.widgets.table.OnActivateHandler) -> None:
         self._on_activate = wrapped_handler(self, handler)
 
+    @property
+    def on_near_end(self) -> OnNearEndHandler:
+        """The callback function that is invoked when the visible rows of the table come
+        within :any:`prefetch_threshold` rows of the end of the data.
+
+        This can be used to load the next page of data before the user reaches the end
+        of the table. The handler is invoked once each time the end is approached; it
+        won't be invoked again until the data has changed. If the handler is
+        asynchronous, it won't be invoked again until it has completed.
+        """
+        return self._on_near_end
+
+    @on_near_end.setter
+    def on_near_end(self, handler: toga.widgets.table.OnNearEndHandler) -> None:
+        self._on_near_end = wrapped_handler(self, handler)
+        self._near_end.reset(self._on_near_end)
+
+    @property
+    def prefetch_threshold(self) -> int:
+        """The number of rows from the end of the data at which :any:`on_near_end` will
+        be invoked.
+        """
+        return self._near_end.threshold
+
+    @prefetch_threshold.setter
+    def prefetch_threshold(self, value: int) -> None:
+        self._near_end.threshold = value
+
+    def _visible_rows_changed(self, last_row: int) -> None:
+        """Invoked by the backend when the rows that are visible have changed.
+
+        :param last_row: The index of the last row that is visible.
+        """
+        self._near_end.visible_rows_changed(last_row)
+
     def add_column(self, heading: str, accessor: str | None = None) -> None:
         """**DEPRECATED**: use :meth:`~toga.Table.append_column`"""
         self.insert_column(len(self._accessors), heading, accessor=accessor)
@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import warnings
 from builtins import id as identifier
-from collections.abc import Coroutine, Iterator, MutableSet
+from collections.abc import Coroutine, Iterator, Mapping, MutableSet
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from weakref import WeakValueDictionary
 
 import toga
 from toga import dialogs
 from toga.command import CommandSet
+from toga.constants import ResizePolicy
 from toga.handlers import AsyncResult, wrapped_handler
 from toga.images import Image
 from toga.platform import get_platform_factory
 from toga.types import Position, Size
+from toga.widgets.base import _Batch
 
 if TYPE_CHECKING:
     from toga.app import App
@@ -46,27 +50,22 @@ def _initial_position() -> Position:
 
 
 class FilteredWidgetRegistry:
-    # A class that exposes a mapping lookup interface, filtered to widgets from a single
-    # window. The underlying data store is on the app.
+    # A class that exposes a mapping lookup interface to the widgets from a single
+    # window. The widgets are registered on the app; the window keeps an index of the
+    # widgets it contains, so that lookups don't need to consider every widget in the
+    # app.
 
     def __init__(self, window: Window) -> None:
         self._window = window
 
     def __len__(self) -> int:
-        return len(list(self.items()))
+        return len(self._window._widget_index())
 
     def __getitem__(self, key: str) -> Widget:
-        item = self._window.app.widgets[key]
-        if item.window != self._window:
-            raise KeyError(key)
-        return item
+        return self._window._widget_index()[key]
 
     def __contains__(self, key: str) -> bool:
-        try:
-            item = self._window.app.widgets[key]
-            return item.window == self._window
-        except KeyError:
-            return False
+        return key in self._window._widget_index()
 
     def __iter__(self) -> Iterator[Widget]:
         return iter(self.values())
@@ -75,19 +74,13 @@ class FilteredWidgetRegistry:
         return "{" + ", ".join(f"{k!r}: {v!r}" for k, v in sorted(self.items())) + "}"
 
     def items(self) -> Iterator[tuple[str, Widget]]:
-        for item in self._window.app.widgets.items():
-            if item[1].window == self._window:
-                yield item
+        return iter(self._window._widget_index().items())
 
     def keys(self) -> Iterator[str]:
-        for item in self._window.app.widgets.items():
-            if item[1].window == self._window:
-                yield item[0]
+        return iter(self._window._widget_index().keys())
 
     def values(self) -> Iterator[Widget]:
-        for item in self._window.app.widgets.items():
-            if item[1].window == self._window:
-                yield item[1]
+        return iter(self._window._widget_index().values())
 
 
 class OnCloseHandler(Protocol):
@@ -188,12 +181,19 @@ class Window:
         self._id = str(id if id else identifier(self))
         self._impl: Any = None
         self._content: Widget | None = None
+        self._batch: _Batch | None = None
+        # The widgets in the window, by ID. This is maintained as widgets are assigned
+        # to the window, unless widgets resolve their window lazily; in that case, the
+        # index is rebuilt when the content, or the structure of its tree, has changed.
+        self._widgets: WeakValueDictionary[str, Widget] = WeakValueDictionary()
+        self._lazy_widgets: tuple[Widget, int, dict[str, Widget]] | None = None
         self._is_full_screen = False
         self._closed = False
 
         self._resizable = resizable
         self._closable = closable
         self._minimizable = minimizable
+        self._resize_policy = ResizePolicy.IMMEDIATE
 
         # The app needs to exist before windows are created. _app will only be None
         # until the window is added to the app below.
@@ -260,6 +260,19 @@ class Window:
         """Can the window be resized by the user?"""
         return self._resizable
 
+    @property
+    def resize_policy(self) -> ResizePolicy:
+        """How the content of the window is laid out while the window is being
+        resized.
+
+        Defaults to :attr:`~toga.constants.ResizePolicy.IMMEDIATE`.
+        """
+        return self._resize_policy
+
+    @resize_policy.setter
+    def resize_policy(self, policy: ResizePolicy) -> None:
+        self._resize_policy = ResizePolicy(policy)
+
     @property
     def _default_title(self) -> str:
         return toga.App.app.formal_name
@@ -325,6 +338,10 @@ class Window:
         # closing the app.
         if self.content:
             self.content.window = None
+            if self.content.lazy_ancestry:
+                # Widgets are registered while they belong to the app, so the content
+                # must also leave the app to release its widget IDs.
+                self.content.app = None
         self.app.windows.discard(self)
         self._impl.close()
         self._closed = True
@@ -370,6 +387,32 @@ class Window:
         # Update the geometry of the widget
         widget.refresh()
 
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Obtain a context in which changes to the widgets in this window are applied
+        as a single update.
+
+        Inside the context, changes to the layout of the window's widgets (for example,
+        adding widgets, or changing their style or content) are recorded, but not acted
+        upon. When the context exits, each modified widget is rehinted once, and the
+        window's content is laid out once. This is useful when constructing or modifying
+        a large number of widgets.
+
+        Batch contexts can be nested; the changes are applied when the outermost
+        context exits.
+        """
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0:
+                self._batch = None
+                batch.apply()
+
     @property
     def widgets(self) -> FilteredWidgetRegistry:
         """The widgets contained in the window.
@@ -378,6 +421,22 @@ class Window:
         """
         return FilteredWidgetRegistry(self)
 
+    def _widget_index(self) -> Mapping[str, Widget]:
+        """The widgets in the window, by ID."""
+        content = self._content
+        if content is None or not content.lazy_ancestry:
+            return self._widgets
+
+        generation = content._ancestry_generation
+        index = self._lazy_widgets
+        if index is None or index[0] is not content or index[1] != generation:
+            self._lazy_widgets = (
+                content,
+                generation,
+                {widget.id: widget for widget in content._subtree()},
+            )
+        return self._lazy_widgets[2]
+
     ######################################################################
     # Window size
     ######################################################################
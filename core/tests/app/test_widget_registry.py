@@ -79,6 +79,40 @@ def test_remove_widget(widget_registry):
     assert "widget-2" not in widget_registry
 
 
+def test_remove_all_widgets(widget_registry):
+    """Widgets can be bulk removed from the registry."""
+    widget1 = ExampleWidget(id="widget-1")
+    widget2 = ExampleWidget(id="widget-2")
+    widget3 = ExampleWidget(id="widget-3")
+    widget_registry._update([widget1, widget2, widget3])
+
+    widget_registry._remove_all([widget1, widget3])
+
+    assert list(widget_registry) == [widget2]
+
+
+def test_update_duplicate_widgets(widget_registry):
+    """If any widget in a bulk update has a duplicate ID, no widgets are added."""
+    widget1 = ExampleWidget(id="widget-1")
+    widget_registry._add(widget1)
+
+    widget2 = ExampleWidget(id="widget-2")
+    with pytest.raises(
+        KeyError,
+        match=r"There is already a widget with the id 'widget-1'",
+    ):
+        widget_registry._update([widget2, ExampleWidget(id="widget-1")])
+
+    # The IDs must also be unique within the update.
+    with pytest.raises(
+        KeyError,
+        match=r"There is already a widget with the id 'widget-2'",
+    ):
+        widget_registry._update([widget2, ExampleWidget(id="widget-2")])
+
+    assert list(widget_registry) == [widget1]
+
+
 def test_add_same_widget_twice(widget_registry):
     """A widget cannot be added to the same registry twice."""
     # Add a widget to the registry
@@ -27,7 +27,8 @@ def test_no_camera(monkeypatch, app):
         monkeypatch.delattr(app, "_camera")
     except AttributeError:
         pass
-    monkeypatch.delattr(factory, "Camera")
+    monkeypatch.delattr(factory, "Camera", raising=False)
+    monkeypatch.delitem(factory.toga_dummy_imports, "Camera")
 
     # Accessing the camera object should raise NotImplementedError
     with pytest.raises(NotImplementedError):
@@ -19,7 +19,8 @@ def test_no_location(monkeypatch, app):
         monkeypatch.delattr(app, "_location")
     except AttributeError:
         pass
-    monkeypatch.delattr(factory, "Location")
+    monkeypatch.delattr(factory, "Location", raising=False)
+    monkeypatch.delitem(factory.toga_dummy_imports, "Location")
 
     # Accessing the location object should raise NotImplementedError
     with pytest.raises(NotImplementedError):
@@ -0,0 +1,225 @@
+from unittest.mock import patch
+
+from travertino.size import at_least
+
+from toga.style.pack import COLUMN, ROW, Pack
+
+from ..utils import ExampleNode, ExampleViewport, layouts, nodes
+
+
+def build_tree():
+    return ExampleNode(
+        "app",
+        style=Pack(direction=COLUMN),
+        children=[
+            ExampleNode(
+                "header",
+                style=Pack(direction=ROW),
+                children=[
+                    ExampleNode(
+                        "title",
+                        style=Pack(flex=1),
+                        size=(at_least(100), 20),
+                    ),
+                    ExampleNode("button", style=Pack(), size=(at_least(50), 30)),
+                ],
+            ),
+            ExampleNode(
+                "body",
+                style=Pack(direction=ROW, flex=1),
+                children=[
+                    ExampleNode("left", style=Pack(flex=1), size=(at_least(10), 10)),
+                    ExampleNode("right", style=Pack(flex=2), size=(at_least(10), 10)),
+                ],
+            ),
+        ],
+    )
+
+
+def computed_nodes(root, viewport):
+    """Lay out the tree, returning the names of the nodes whose layouts were
+    computed."""
+    computed = []
+    original = Pack._layout_node
+
+    def _layout_node(self, node, *args, **kwargs):
+        dirty = node.layout._dirty
+        old_key = node.layout._key
+        cached = set(node.layout._sizes)
+        index = len(computed)
+
+        yield from original(self, node, *args, **kwargs)
+
+        # Record nodes in the order their layout was started.
+        new_key = node.layout._key
+        if dirty or (new_key != old_key and new_key not in cached):
+            computed.insert(index, node.name)
+
+    with patch.object(Pack, "_layout_node", _layout_node):
+        root.style.layout(root, viewport)
+
+    return computed
+
+
+def test_initial_layout():
+    """All nodes are computed by the initial layout, and are then clean."""
+    root = build_tree()
+    assert len(computed_nodes(root, ExampleViewport(640, 480))) == 7
+    assert not any(node.layout._dirty for node in nodes(root))
+
+
+def test_repeat_layout():
+    """A repeated layout with the same viewport doesn't recompute anything."""
+    root = build_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+    expected = layouts(root)
+
+    assert computed_nodes(root, ExampleViewport(640, 480)) == []
+    assert layouts(root) == expected
+
+
+def test_intrinsic_change():
+    """A change in intrinsic size only recomputes the node and its ancestors."""
+    root = build_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    title = root.children[0].children[0]
+    title.intrinsic.width = at_least(120)
+
+    # The node and its ancestors are dirty; the rest of the tree is clean.
+    assert [node.name for node in nodes(root) if node.layout._dirty] == [
+        "app",
+        "header",
+        "title",
+    ]
+
+    # The size of the header hasn't changed, so its siblings and their children
+    # aren't recomputed.
+    assert computed_nodes(root, ExampleViewport(640, 480)) == [
+        "app",
+        "header",
+        "title",
+    ]
+
+    # The result is the same as laying out the tree from scratch.
+    reference = build_tree()
+    reference.children[0].children[0].intrinsic.width = at_least(120)
+    reference.style.layout(reference, ExampleViewport(640, 480))
+    assert layouts(root) == layouts(reference)
+
+
+def test_intrinsic_change_affects_siblings():
+    """If a change in intrinsic size changes the allocation of other nodes, those
+    nodes are also recomputed."""
+    root = build_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    button = root.children[0].children[1]
+    button.intrinsic.height = 50
+
+    # The header is now taller, so the body has less space. The title's
+    # allocation hasn't changed, and the children of the body have a fixed height,
+    # so they don't need to be recomputed.
+    assert computed_nodes(root, ExampleViewport(640, 480)) == [
+        "app",
+        "header",
+        "button",
+        "body",
+    ]
+
+    reference = build_tree()
+    reference.children[0].children[1].intrinsic.height = 50
+    reference.style.layout(reference, ExampleViewport(640, 480))
+    assert layouts(root) == layouts(reference)
+
+
+def test_style_change():
+    """A change in style marks the node and its ancestors as dirty."""
+    root = build_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    right = root.children[1].children[1]
+    right.style.padding_left = 20
+
+    assert [node.name for node in nodes(root) if node.layout._dirty] == [
+        "app",
+        "body",
+        "right",
+    ]
+
+    # The header subtree doesn't need to be recomputed.
+    computed = computed_nodes(root, ExampleViewport(640, 480))
+    assert "header" not in computed
+    assert "title" not in computed
+
+    reference = build_tree()
+    reference.children[1].children[1].style.padding_left = 20
+    reference.style.layout(reference, ExampleViewport(640, 480))
+    assert layouts(root) == layouts(reference)
+
+
+def test_viewport_change():
+    """A change in viewport recomputes any node whose allocation has changed."""
+    root = build_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+    root.style.layout(root, ExampleViewport(800, 600))
+
+    reference = build_tree()
+    reference.style.layout(reference, ExampleViewport(800, 600))
+    assert layouts(root) == layouts(reference)
+
+
+def test_fixed_size_resize():
+    """A node with a fixed size isn't recomputed when its allocation changes."""
+    root = ExampleNode(
+        "app",
+        style=Pack(direction=ROW),
+        children=[
+            ExampleNode(
+                "sidebar",
+                style=Pack(direction=COLUMN, width=200),
+                children=[
+                    ExampleNode("item1", style=Pack(), size=(at_least(10), 20)),
+                    ExampleNode("item2", style=Pack(), size=(at_least(10), 20)),
+                ],
+            ),
+            ExampleNode("content", style=Pack(flex=1), size=(at_least(10), 10)),
+        ],
+    )
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    # Only the root and the flexible content are recomputed.
+    assert computed_nodes(root, ExampleViewport(800, 480)) == ["app", "content"]
+    assert root.children[1].layout.content_width == 600
+
+
+def test_leaf_sizes_cached():
+    """A leaf node reuses the sizes computed for previous allocations."""
+    root = build_tree()
+    root.style.layout(root, ExampleViewport(640, 480))
+    root.style.layout(root, ExampleViewport(800, 600))
+
+    # Returning to a previous viewport only needs to recompute nodes that have
+    # children.
+    computed = computed_nodes(root, ExampleViewport(640, 480))
+    assert computed == ["app", "header", "body"]
+
+    reference = build_tree()
+    reference.style.layout(reference, ExampleViewport(640, 480))
+    assert layouts(root) == layouts(reference)
+
+    # If the node changes, the cached sizes are discarded.
+    left = root.children[1].children[0]
+    left.style.padding = 5
+    assert "left" in computed_nodes(root, ExampleViewport(800, 600))
+    assert len(left.layout._sizes) == 1
+
+
+def test_leaf_sizes_bounded():
+    """A limited number of sizes are cached for each node."""
+    root = build_tree()
+    for width in range(640, 640 + Pack._MAX_CACHED_SIZES + 1):
+        root.style.layout(root, ExampleViewport(width, 480))
+
+    title = root.children[0].children[0]
+    assert len(title.layout._sizes) == 1
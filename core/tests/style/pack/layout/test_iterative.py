@@ -0,0 +1,103 @@
+import random
+import sys
+
+import pytest
+from travertino.size import at_least
+
+from toga.style.pack import BOTTOM, CENTER, COLUMN, LEFT, RIGHT, ROW, RTL, TOP, Pack
+
+from ..utils import ExampleNode, ExampleViewport, layouts, nodes
+from .recursive_pack import layout as layout_recursively
+
+
+def random_style(rng):
+    style = Pack(
+        direction=rng.choice([ROW, COLUMN]),
+        padding=tuple(rng.choice([0, 0, 5, 10]) for _ in range(4)),
+    )
+    if rng.random() < 0.4:
+        style.flex = rng.choice([1, 2, 3])
+    if rng.random() < 0.2:
+        style.width = rng.randint(10, 200)
+    if rng.random() < 0.2:
+        style.height = rng.randint(10, 200)
+    if rng.random() < 0.3:
+        style.alignment = rng.choice([TOP, BOTTOM, LEFT, RIGHT, CENTER])
+    if rng.random() < 0.1:
+        style.text_direction = RTL
+    return style
+
+
+def random_size(rng):
+    def dimension():
+        value = rng.randint(0, 100)
+        return rng.choice([None, value, at_least(value)])
+
+    return (dimension(), dimension())
+
+
+def random_tree(seed):
+    rng = random.Random(seed)
+    count = 0
+
+    def build(depth):
+        nonlocal count
+        count += 1
+        name = f"node{count}"
+        if depth > 0 and rng.random() < 0.7:
+            node = ExampleNode(name, style=random_style(rng), children=[])
+            for _ in range(rng.randint(1, 4)):
+                node.add(build(depth - 1))
+        else:
+            node = ExampleNode(name, style=random_style(rng), size=random_size(rng))
+        return node
+
+    return build(rng.randint(1, 6))
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_same_as_recursive(seed):
+    """The iterative layout gives the same result as the original recursive
+    layout."""
+    viewport = ExampleViewport(640, 480)
+    root = random_tree(seed)
+    root.style.layout(root, viewport)
+
+    reference = random_tree(seed)
+    layout_recursively(reference.style, reference, viewport)
+    assert layouts(root) == layouts(reference)
+
+    # The layouts also match when the tree is laid out again for another viewport.
+    viewport = ExampleViewport(320, 800)
+    root.style.layout(root, viewport)
+    layout_recursively(reference.style, reference, viewport)
+    assert layouts(root) == layouts(reference)
+
+
+def test_deep_tree():
+    """A tree that is deeper than the recursion limit can be laid out."""
+    depth = sys.getrecursionlimit() + 100
+    root = node = ExampleNode("root", style=Pack(direction=COLUMN), children=[])
+    for level in range(depth):
+        child = ExampleNode(
+            f"level{level}", style=Pack(direction=COLUMN, padding=1), children=[]
+        )
+        node.add(child)
+        node = child
+    node.add(ExampleNode("leaf", style=Pack(), size=(at_least(10), 10)))
+
+    root.style.layout(root, ExampleViewport(640, 480))
+
+    leaf = list(nodes(root))[-1]
+    assert (
+        leaf.layout.absolute_content_left,
+        leaf.layout.absolute_content_top,
+    ) == (depth, depth)
+    assert (node.layout.content_left, node.layout.content_top) == (1, 1)
+    assert (node.layout._origin_left, node.layout._origin_top) == (depth - 1, depth - 1)
+    assert root.layout.content_height == 2 * depth + 10
+
+    # Moving the root moves the whole tree.
+    root.style.padding_left = 5
+    root.style.layout(root, ExampleViewport(640, 480))
+    assert leaf.layout.absolute_content_left == depth + 5
@@ -4,8 +4,10 @@ from toga.colors import rgb
 from toga.fonts import Font
 from toga.style.pack import (
     CENTER,
+    COLUMN,
     HIDDEN,
     LEFT,
+    NONE,
     RIGHT,
     RTL,
     VISIBLE,
@@ -62,13 +64,53 @@ def test_set_font():
             font_weight="bold",
         ),
     )
+    root._impl.set_font.reset_mock()
     root.style.reapply()
-    root._impl.set_font.assert_called_with(
+    # All the font properties are applied as a single font.
+    root._impl.set_font.assert_called_once_with(
         Font("Roboto", 12, style="normal", variant="small-caps", weight="bold")
     )
     root.refresh.assert_called_with()
 
 
+def test_update_font():
+    """Changes to several font properties in one update apply a single font."""
+    root = ExampleNode("app", style=Pack())
+    root.style.reapply()
+    root._impl.set_font.reset_mock()
+
+    root.style.update(font_family="Roboto", font_size=20, font_weight="bold")
+    root._impl.set_font.assert_called_once_with(
+        Font("Roboto", 20, style="normal", variant="normal", weight="bold")
+    )
+
+    # A single font property change applies a font immediately.
+    root._impl.set_font.reset_mock()
+    root.style.font_style = "italic"
+    root._impl.set_font.assert_called_once_with(
+        Font("Roboto", 20, style="italic", variant="normal", weight="bold")
+    )
+
+    # An update that doesn't change any font property doesn't apply a font.
+    root._impl.set_font.reset_mock()
+    root.style.update(font_size=20, color="#ffffff")
+    root._impl.set_font.assert_not_called()
+
+
+def test_font_unchanged():
+    """A font isn't applied again if the effective font hasn't changed."""
+    root = ExampleNode("app", style=Pack(font_size=20))
+    root.style.reapply()
+    root._impl.set_font.reset_mock()
+
+    root.style.apply("font_size", 20)
+    root._impl.set_font.assert_not_called()
+
+    # Reapplying the style always applies the font.
+    root.style.reapply()
+    root._impl.set_font.assert_called_once_with(Font("system", 20))
+
+
 def test_set_visibility_hidden():
     root = ExampleNode("app", style=Pack(visibility=HIDDEN))
     root.style.reapply()
@@ -118,3 +160,33 @@ def test_set_visibility_inherited():
     # Show grandparent again; the other two should reappear.
     grandparent.style.visibility = VISIBLE
     assert_hidden_called(False, False, False)
+
+
+def test_resolved_style():
+    """The values used by the layout track the values of the style properties."""
+    style = Pack(width=100, padding=(1, 2, 3, 4), direction=COLUMN)
+    assert style._resolved.width == 100
+    assert style._resolved.height == NONE
+    assert style._resolved.direction == COLUMN
+    assert (
+        style._resolved.padding_top,
+        style._resolved.padding_right,
+        style._resolved.padding_bottom,
+        style._resolved.padding_left,
+    ) == (1, 2, 3, 4)
+
+    # Changes to the style are reflected in the resolved values.
+    style.update(flex=2, alignment=CENTER)
+    style.text_direction = RTL
+    del style.width
+    assert style._resolved.flex == 2
+    assert style._resolved.alignment == CENTER
+    assert style._resolved.text_direction == RTL
+    assert style._resolved.width == NONE
+
+    # A copy of a style has its own resolved values.
+    copy = style.copy()
+    copy.visibility = HIDDEN
+    assert copy._resolved.flex == 2
+    assert copy._resolved.visibility == HIDDEN
+    assert style._resolved.visibility == VISIBLE
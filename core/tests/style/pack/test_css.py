@@ -477,3 +477,45 @@ from toga.style.pack import (
 def test_rendering(style, expected_css):
     """An empty style node can be rendered."""
     assert style.__css__() == expected_css
+
+
+def test_cached():
+    """The CSS for a style is cached until the style changes."""
+    style = Pack(width=10, padding_top=5)
+    css = style.__css__()
+    assert style.__css__() is css
+
+    # Identical styles share the same CSS string.
+    assert Pack(width=10, padding_top=5).__css__() is css
+
+    style.padding_top = 10
+    assert style.__css__() == "flex-direction: row; width: 10px; margin-top: 10px;"
+
+    del style.width
+    assert style.__css__() == "flex-direction: row; flex: 0.0 0 auto; margin-top: 10px;"
+
+
+def test_declarations_cached():
+    """The CSS declarations for a style are cached until the style changes."""
+    style = Pack(width=10, padding_top=5)
+    declarations = style._css_declarations()
+    assert declarations == {
+        "flex-direction": "row",
+        "width": "10px",
+        "margin-top": "5px",
+    }
+    assert style._css_declarations() is declarations
+
+    # A change to the style produces new declarations.
+    style.update(padding_top=0, color="red")
+    del style.width
+    assert style._css_declarations() == {
+        "flex-direction": "row",
+        "flex": "0.0 0 auto",
+        "color": "rgb(255, 0, 0)",
+    }
+    assert declarations == {
+        "flex-direction": "row",
+        "width": "10px",
+        "margin-top": "5px",
+    }
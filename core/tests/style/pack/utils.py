@@ -56,6 +56,10 @@ class ExampleNode(Node):
             lines[-1] = lines[-1] + f"</{tag}>"
         return "\n".join(lines)
 
+    def _current_batch(self):
+        # Batch updates aren't used when testing layouts.
+        return None
+
     def refresh(self):
         # We're directly modifying styles and computing layouts for specific
         # viewports, so we don't need to trigger layout changes when a style is
@@ -76,6 +80,31 @@ class ExampleViewport:
         self.width = width
 
 
+def nodes(node):
+    """Iterate over all the nodes in a tree, in depth-first order."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+
+def layouts(root):
+    """The computed layout of every node in a tree."""
+    return [
+        (
+            node.name,
+            node.layout.absolute_content_left,
+            node.layout.absolute_content_top,
+            node.layout.content_width,
+            node.layout.content_height,
+            node.layout.min_content_width,
+            node.layout.min_content_height,
+        )
+        for node in nodes(root)
+    ]
+
+
 def _assert_layout(node, expected_layout):
     assert (
         node.layout.absolute_content_left,
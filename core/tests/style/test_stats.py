@@ -0,0 +1,171 @@
+import pytest
+
+import toga
+from toga.style import Pack, stats
+from toga.style.pack import COLUMN
+from toga.widgets.base import Widget
+
+
+@pytest.fixture
+def layout_stats():
+    layout_stats = stats.enable()
+    yield layout_stats
+    stats.disable()
+
+
+@pytest.fixture
+def content(app):
+    content = toga.Box(
+        style=Pack(direction=COLUMN),
+        children=[toga.Label("First"), toga.Label("Second")],
+    )
+    window = toga.Window()
+    window.content = content
+    return content
+
+
+def test_disabled():
+    """If statistics aren't enabled, the layout isn't instrumented."""
+    assert stats.get_stats() is None
+
+    layout = Pack.__dict__["layout"]
+    refresh = Widget.__dict__["refresh"]
+
+    layout_stats = stats.enable()
+    assert stats.get_stats() is layout_stats
+    assert Pack.__dict__["layout"] is not layout
+    assert Widget.__dict__["refresh"] is not refresh
+
+    # Enabling statistics again returns the existing statistics.
+    assert stats.enable() is layout_stats
+
+    stats.disable()
+    assert stats.get_stats() is None
+    assert Pack.__dict__["layout"] is layout
+    assert Widget.__dict__["refresh"] is refresh
+
+
+def test_layout_counts(layout_stats, content):
+    """Layout passes, and the layout of each node, are counted."""
+    assert layout_stats.passes == 1
+    assert layout_stats.total_time > 0
+    assert layout_stats.max_time == layout_stats.total_time
+    assert layout_stats.node_layouts[content] == 1
+    for child in content.children:
+        assert layout_stats.node_layouts[child] == 1
+
+    root, duration, layouts, hits = layout_stats.recent_passes[-1]
+    assert root is content
+    assert duration == layout_stats.total_time
+    assert layouts == 3
+    assert hits == 0
+
+    # Only the layouts that are computed are counted; the second label's layout is
+    # reused from the cache.
+    content.children[0].style.width = 50
+    assert layout_stats.passes == 2
+    assert layout_stats.node_layouts[content] == 2
+    assert layout_stats.node_layouts[content.children[0]] == 2
+    assert layout_stats.node_layouts[content.children[1]] == 1
+    assert layout_stats.cache_hits == 1
+    assert layout_stats.recent_passes[-1][2:] == (2, 1)
+
+    # Refreshing the root only lays out the root again; the layouts of the children
+    # are reused.
+    content.refresh()
+    assert layout_stats.passes == 3
+    assert layout_stats.node_layouts[content] == 3
+    assert layout_stats.node_layouts[content.children[0]] == 2
+    assert layout_stats.node_layouts[content.children[1]] == 1
+    assert layout_stats.cache_hits == 3
+    assert layout_stats.recent_passes[-1][2:] == (1, 2)
+
+    layout_stats.reset()
+    assert layout_stats.passes == 0
+    assert layout_stats.cache_hits == 0
+    assert len(layout_stats.node_layouts) == 0
+
+
+def test_refresh_triggers(layout_stats, content):
+    """The property or method that triggered each refresh is recorded."""
+    label = content.children[0]
+    label.style.padding_top = 10
+    label.text = "Changed"
+    label.text = "Changed again"
+    label.style.font_size = 20
+
+    # The text was also set when the label was created.
+    assert layout_stats.refreshes[label] == {
+        "padding_top": 1,
+        "text": 3,
+        "font_size": 1,
+    }
+    # The refresh of the root caused by each change isn't recorded; the root was
+    # only refreshed when its children were added, and when it was added to the
+    # window.
+    assert layout_stats.refreshes[content] == {"add": 1, "content": 1}
+
+
+def test_summary(layout_stats, content):
+    """A summary of the statistics can be produced."""
+    content.children[1].text = "Changed"
+
+    summary = layout_stats.summary()
+    assert "Layout statistics: 2 passes" in summary
+    assert f"       2 {content!r}" in summary
+    assert f"       2 {content.children[1]!r} text" in summary
+
+    # The dummy backend counts the rehints of the widgets in a window's container.
+    window = content.window
+    assert layout_stats.rehints()[window.id] == window._impl.container.rehint_count
+    assert f"window {window.id}" in summary
+
+    # The summary can be limited.
+    assert repr(content.children[0]) not in layout_stats.summary(limit=1)
+
+
+def test_rehints_unavailable(monkeypatch, layout_stats, content):
+    """Rehints are only reported for containers that count them."""
+    window = content.window
+    del window._impl.container.rehint_count
+    assert window.id not in layout_stats.rehints()
+
+    monkeypatch.setattr(toga.App, "app", None)
+    assert layout_stats.rehints() == {}
+    assert "Rehints" not in layout_stats.summary()
+
+
+def test_summary_no_passes():
+    """A summary can be produced before any layout has been performed."""
+    summary = stats.LayoutStats().summary()
+    assert summary.startswith("Layout statistics: 0 passes\nMost laid out nodes:")
+
+
+def test_dump(capsys, content):
+    """A summary can be printed periodically."""
+    stats.enable(dump_interval=0)
+    try:
+        content.refresh()
+    finally:
+        stats.disable()
+
+    assert "Layout statistics: 1 passes" in capsys.readouterr().err
+
+    # A summary isn't printed until the interval has elapsed.
+    stats.enable(dump_interval=1000)
+    try:
+        content.refresh()
+    finally:
+        stats.disable()
+
+    assert capsys.readouterr().err == ""
+
+
+def test_environment(monkeypatch):
+    """Statistics can be enabled by an environment variable."""
+    monkeypatch.setenv("TOGA_LAYOUT_STATS", "1")
+    try:
+        toga.App("Stats Test", "org.beeware.toga.stats")
+        assert stats.get_stats().dump_interval == stats.DUMP_INTERVAL
+    finally:
+        stats.disable()
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from pathlib import Path
 
 import pytest
@@ -115,6 +117,32 @@ def test_builtin_font(family, size, weight, style, variant, as_str):
     assert str(font) == as_str
 
 
+def test_interned():
+    """Equal fonts share a single instance while the font is in use."""
+    font = toga.Font(SANS_SERIF, 12, weight=BOLD)
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD) is font
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD)._impl is font._impl
+
+    # Fonts are interned by their normalized properties.
+    assert toga.Font(SANS_SERIF, "12pt", weight=BOLD) is font
+    assert toga.Font(f"'{SANS_SERIF}'", "12", weight=BOLD) is font
+    assert toga.Font(SANS_SERIF, 12) is toga.Font(SANS_SERIF, 12, weight="unknown")
+
+    # Fonts that differ in any property are different instances.
+    assert toga.Font(SANS_SERIF, 12) is not font
+    assert toga.Font(SANS_SERIF, 13, weight=BOLD) is not font
+    assert toga.Font(SYSTEM, 12, weight=BOLD) is not font
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD, style=ITALIC) is not font
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD, variant=SMALL_CAPS) is not font
+
+    # Once a font is no longer in use, it isn't retained.
+    font_ref = weakref.ref(font)
+    del font
+    gc.collect()
+    assert font_ref() is None
+    assert toga.Font(SANS_SERIF, 12, weight=BOLD).weight == BOLD
+
+
 @pytest.mark.parametrize(
     "family, weight, style, variant, key",
     [
@@ -171,6 +199,24 @@ def test_register_font(app, path, registered):
     )
 
 
+def test_register_interned_font(app):
+    """Registering a font file means an interned font will be created again."""
+    font = toga.Font("Interned Font", 12, weight=BOLD)
+    other = toga.Font("Interned Font", 12)
+
+    toga.Font.register("Interned Font", "path/to/font.otf", weight=BOLD)
+
+    # Existing references keep their font, but new references get a new font.
+    new_font = toga.Font("Interned Font", 12, weight=BOLD)
+    assert new_font is not font
+    assert new_font._impl is not font._impl
+    assert new_font == font
+    assert toga.Font("Interned Font", 12, weight=BOLD) is new_font
+
+    # Fonts that don't match the registration are still interned.
+    assert toga.Font("Interned Font", 12) is other
+
+
 @pytest.mark.parametrize(
     "path, registered",
     [
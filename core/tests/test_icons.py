@@ -1,11 +1,14 @@
+import os
+import shutil
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 import toga
 import toga_dummy
-from toga.icons import _APP_ICON
+from toga.icons import _APP_ICON, _ResourceDirectory
 from toga_dummy.icons import Icon as DummyIcon
 
 APP_RESOURCES = Path(__file__).parent / "resources"
@@ -239,6 +242,136 @@ def test_create_app_icon_missing_non_script(monkeypatch, app, capsys):
     assert "WARNING: Can't find app icon" in capsys.readouterr().out.replace("\\", "/")
 
 
+def test_resolution_memoized(monkeypatch, app):
+    """The resolution of an icon path is memoized."""
+    monkeypatch.setattr(DummyIcon, "SIZES", [32, 72])
+
+    icon = toga.Icon("resources/red")
+
+    # A second icon for the same path doesn't need to search the resource directory.
+    with patch.object(toga.Icon, "_full_path") as full_path:
+        other = toga.Icon("resources/red")
+    full_path.assert_not_called()
+
+    assert other._impl.interface == other
+    assert other._impl.path == icon._impl.path
+    # Each icon has its own copy of the size variants.
+    assert other._impl.path is not icon._impl.path
+
+    # A missing icon is also memoized.
+    toga.Icon("resources/missing")
+    with patch.object(toga.Icon, "_full_path") as full_path:
+        icon = toga.Icon("resources/missing")
+    full_path.assert_not_called()
+    assert icon._impl.interface == toga.Icon.DEFAULT_ICON
+
+
+def test_resource_directory_modified(monkeypatch, app, tmp_path):
+    """If a resource directory is modified, it is indexed again."""
+    monkeypatch.setattr(toga.platform, "current_platform", "dummy")
+    shutil.copy(APP_RESOURCES / "red.png", tmp_path / "icon.png")
+    assert toga.Icon(tmp_path / "icon")._impl.path == tmp_path / "icon.png"
+
+    shutil.copy(APP_RESOURCES / "red.png", tmp_path / "icon-dummy.png")
+    # Make sure the modification time of the directory changes, regardless of the
+    # resolution of the filesystem's timestamps.
+    mtime = tmp_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(tmp_path, ns=(mtime, mtime))
+
+    assert toga.Icon(tmp_path / "icon")._impl.path == tmp_path / "icon-dummy.png"
+
+
+def test_resource_directory_missing(app, tmp_path):
+    """A resource directory that doesn't exist is indexed as empty."""
+    icon = toga.Icon(tmp_path / "missing/icon")
+    assert icon._impl.interface == toga.Icon.DEFAULT_ICON
+
+    (tmp_path / "missing").mkdir()
+    shutil.copy(APP_RESOURCES / "red.png", tmp_path / "missing/icon.png")
+
+    icon = toga.Icon(tmp_path / "missing/icon")
+    assert icon._impl.path == tmp_path / "missing/icon.png"
+
+
+def case_insensitive_exists(path):
+    """Simulate Path.exists on a case-insensitive filesystem."""
+    try:
+        names = os.listdir(path.parent)
+    except OSError:
+        return False
+    return path.name.casefold() in {name.casefold() for name in names}
+
+
+def case_sensitive_exists(path):
+    """Simulate Path.exists on a case-sensitive filesystem."""
+    try:
+        return path.name in os.listdir(path.parent)
+    except OSError:
+        return False
+
+
+@pytest.mark.parametrize(
+    "exists, found",
+    [
+        (case_insensitive_exists, True),
+        (case_sensitive_exists, False),
+    ],
+)
+def test_resource_directory_case_insensitive(monkeypatch, app, tmp_path, exists, found):
+    """A file is found with a name of a different case if the filesystem is
+    case-insensitive, without asking the filesystem about each lookup."""
+    monkeypatch.setattr(toga.platform, "current_platform", "dummy")
+    shutil.copy(APP_RESOURCES / "red.png", tmp_path / "Icon.png")
+    shutil.copy(APP_RESOURCES / "red.png", tmp_path / "Other.png")
+
+    checks = []
+
+    def check(path):
+        checks.append(path)
+        return exists(path)
+
+    monkeypatch.setattr(Path, "exists", check)
+
+    icon = toga.Icon(tmp_path / "icon")
+    if found:
+        assert icon._impl.path == tmp_path / "icon.png"
+    else:
+        assert icon._impl.interface == toga.Icon.DEFAULT_ICON
+
+    # The filesystem was only asked once, when the directory was indexed.
+    assert len(checks) == 1
+
+    # Looking up other files, whether they exist or not, only uses the index.
+    assert toga.Icon(tmp_path / "OTHER")._impl.path == (
+        tmp_path / "OTHER.png" if found else TOGA_RESOURCES / "toga.png"
+    )
+    assert toga.Icon(tmp_path / "missing")._impl.interface == toga.Icon.DEFAULT_ICON
+    assert len(checks) == 1
+
+
+@pytest.mark.parametrize(
+    "name, case_insensitive",
+    [
+        ("Resources", True),
+        ("123", False),
+    ],
+)
+def test_resource_directory_uncased_names(
+    monkeypatch, tmp_path, name, case_insensitive
+):
+    """If none of the files in a directory have a case, the case sensitivity of the
+    filesystem is determined from the name of the directory."""
+    path = tmp_path / name
+    path.mkdir()
+    (path / "1").touch()
+    monkeypatch.setattr(Path, "exists", case_insensitive_exists)
+
+    directory = _ResourceDirectory(path, path.stat().st_mtime_ns)
+    assert directory.case_insensitive is case_insensitive
+    assert "1" in directory
+    assert "2" not in directory
+
+
 @pytest.mark.parametrize(
     "name, path",
     [
@@ -1,4 +1,8 @@
+import importlib
+import importlib.metadata
 import sys
+from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -36,3 +40,105 @@ def test_lazy_fail():
         AttributeError, match="module 'toga' has no attribute 'nonexistent'"
     ):
         toga.nonexistent
+
+
+def test_lazy_factory(monkeypatch):
+    """Backend implementations are imported on demand."""
+    import toga_dummy
+    import toga_dummy.widgets
+
+    for mod_name in ["toga_dummy.factory", "toga_dummy.widgets.canvas"]:
+        monkeypatch.delitem(sys.modules, mod_name, raising=False)
+    monkeypatch.delattr(toga_dummy, "factory", raising=False)
+    monkeypatch.delattr(toga_dummy.widgets, "canvas", raising=False)
+
+    # A clean import of the factory doesn't import the implementation of every widget.
+    from toga_dummy import factory
+
+    assert "toga_dummy.widgets.canvas" not in sys.modules
+
+    # Accessing a name imports the implementation.
+    Canvas = factory.Canvas
+    assert "toga_dummy.widgets.canvas" in sys.modules
+    assert Canvas is sys.modules["toga_dummy.widgets.canvas"].Canvas
+    assert Canvas is factory.Canvas
+
+    # A name that the backend doesn't implement raises an error.
+    with pytest.raises(
+        NotImplementedError,
+        match=r"Toga's Dummy backend doesn't implement Nonexistent",
+    ):
+        factory.Nonexistent
+
+
+@pytest.mark.parametrize("mod_name", ["toga", "toga_dummy"])
+def test_lazy_version(monkeypatch, mod_name):
+    """The version of a package is determined on demand."""
+    import toga
+
+    module = importlib.import_module(mod_name)
+    # Make sure any version that is determined by the test is discarded.
+    monkeypatch.setitem(vars(module), "__version__", None)
+    monkeypatch.delitem(vars(module), "__version__")
+    package_version = Mock(return_value="1.2.3")
+    monkeypatch.setattr(toga, "_package_version", package_version)
+
+    assert module.__version__ == "1.2.3"
+    package_version.assert_called_once_with(module.__file__, mod_name)
+
+    # The version is only determined once.
+    assert module.__version__ == "1.2.3"
+    package_version.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "mod_name, package",
+    [
+        ("toga", "toga-core"),
+        ("toga_dummy", "toga-dummy"),
+    ],
+)
+def test_package_version_installed(monkeypatch, mod_name, package):
+    """If setuptools_scm isn't available, the version is read from the installer
+    metadata."""
+    import toga
+
+    # Importing a module whose entry in sys.modules is None fails.
+    monkeypatch.setitem(sys.modules, "setuptools_scm", None)
+    module = importlib.import_module(mod_name)
+
+    version = toga._package_version(module.__file__, mod_name)
+    assert version == importlib.metadata.version(package)
+
+
+def test_package_version_not_checkout(tmp_path):
+    """If the code isn't in a source checkout, the version is read from the
+    installer metadata."""
+    pytest.importorskip("setuptools_scm")
+    import toga
+
+    version = toga._package_version(tmp_path / "a/b/c/__init__.py", "toga")
+    assert version == importlib.metadata.version("toga-core")
+
+
+def test_package_version_checkout():
+    """In a source checkout, the version is read from the SCM metadata."""
+    setuptools_scm = pytest.importorskip("setuptools_scm")
+    import toga
+
+    root = Path(toga.__file__).parents[3]
+    if not (root / ".git").exists():
+        pytest.skip("Toga isn't installed from a source checkout")
+
+    version = toga._package_version(toga.__file__, "toga")
+    assert version == setuptools_scm.get_version(root=root)
+
+
+def test_lazy_version_fail():
+    """Nonexistent names on a backend should raise a normal AttributeError."""
+    import toga_dummy
+
+    with pytest.raises(
+        AttributeError, match="module 'toga_dummy' has no attribute 'nonexistent'"
+    ):
+        toga_dummy.nonexistent
@@ -1,7 +1,11 @@
+import asyncio
+from unittest.mock import Mock
+
 import pytest
 
 import toga
 from toga.style import Pack
+from toga.widgets.base import _Batch
 from toga_dummy.utils import (
     EventLog,
     assert_action_not_performed,
@@ -1221,6 +1225,148 @@ def test_refresh_child(widget):
     assert_action_performed(widget, "refresh")
 
 
+def test_layout_without_event_loop(widget):
+    """If the event loop isn't running, layout is performed immediately."""
+    window = toga.Window()
+    window.content = widget
+    assert window._impl.container.layout_count == 1
+
+    child = ExampleLeafWidget(style=Pack(width=20))
+    widget.add(child)
+    assert window._impl.container.layout_count == 2
+    assert child.layout.content_width == 20
+
+
+async def test_deferred_layout(widget):
+    """While the event loop is running, layouts are coalesced."""
+    window = toga.Window()
+    window.content = widget
+    container = window._impl.container
+
+    # The layout is deferred until the end of the current loop iteration.
+    assert container.layout_count == 0
+    await asyncio.sleep(0)
+    assert container.layout_count == 1
+
+    # Make many changes to the layout
+    children = [ExampleLeafWidget() for i in range(10)]
+    for child in children:
+        widget.add(child)
+    for child in children:
+        child.style.width = 20
+
+    # The layout hasn't been updated
+    assert container.layout_count == 1
+    assert children[0].layout.content_width == 0
+
+    # One layout is performed once control returns to the event loop.
+    await asyncio.sleep(0)
+    assert container.layout_count == 2
+    assert children[0].layout.content_width == 20
+
+
+async def test_flush_layout(widget):
+    """A pending layout can be performed immediately."""
+    window = toga.Window()
+    window.content = widget
+    container = window._impl.container
+
+    child = ExampleLeafWidget()
+    widget.add(child)
+    child.style.width = 20
+    assert container.layout_count == 0
+
+    # The backend is notified before the layout is performed, so that it can update
+    # any hints it has deferred.
+    widths = []
+    container.refreshing = Mock(
+        side_effect=lambda: widths.append(child.layout.content_width)
+    )
+
+    # The layout can be flushed from any widget in the tree.
+    child.flush_layout()
+    assert container.layout_count == 1
+    assert child.layout.content_width == 20
+    container.refreshing.assert_called_once_with()
+    assert widths == [0]
+
+    # Flushing again has no effect
+    widget.flush_layout()
+    assert container.layout_count == 1
+
+    # The scheduled layout doesn't need to do anything.
+    await asyncio.sleep(0)
+    assert container.layout_count == 1
+
+
+def test_batch(widget):
+    """Changes to a widget tree can be applied as a single update."""
+    window = toga.Window()
+    window.content = widget
+    container = window._impl.container
+    assert container.layout_count == 1
+
+    child = ExampleWidget(id="child_id")
+    widget.add(child)
+    assert container.layout_count == 2
+
+    # A batch can be started on any widget in the tree; it applies to that widget
+    # and its descendants.
+    with child.batch():
+        grandchildren = [ExampleLeafWidget() for i in range(5)]
+        child.add(*grandchildren)
+        for grandchild in grandchildren:
+            grandchild.style.width = 20
+
+        # Batches can be nested
+        with grandchildren[0].batch():
+            grandchildren[0].style.padding = 10
+        assert grandchildren[0]._batch is None
+
+        # Nothing has been applied
+        assert container.layout_count == 2
+        assert grandchildren[0].layout.content_width == 0
+        assert child._batch is not None
+
+    # Once the batch is complete, there's a single layout.
+    assert container.layout_count == 3
+    assert grandchildren[0].layout.content_width == 20
+    assert grandchildren[0].layout.content_left == 10
+    assert child._batch is None
+
+
+def test_batch_count(widget):
+    """The batches that are open are counted, so that a widget only looks for a batch
+    when one is open."""
+    child = ExampleLeafWidget()
+    widget.add(child)
+    assert _Batch.open == 0
+    assert child._current_batch() is None
+
+    with widget.batch():
+        assert _Batch.open == 1
+        assert child._current_batch() is widget._batch
+
+        # A nested batch is part of the open batch.
+        with child.batch():
+            assert _Batch.open == 1
+
+    assert _Batch.open == 0
+    assert child._current_batch() is None
+
+
+def test_batch_outside_tree(widget):
+    """Changes to widgets outside the batched tree are applied immediately."""
+    window = toga.Window()
+    window.content = widget
+    container = window._impl.container
+
+    other = ExampleWidget()
+    with other.batch():
+        widget.style.width = 20
+        assert container.layout_count == 2
+
+
 def test_focus(widget):
     """A widget can be given focus."""
     widget.focus()
@@ -263,6 +263,32 @@ def test_refresh(detailedlist, on_refresh_handler):
     )
 
 
+def test_near_end(detailedlist):
+    """The near end handler is invoked as the visible rows approach the end of the
+    data."""
+    assert detailedlist.on_near_end._raw is None
+    assert detailedlist.prefetch_threshold == 10
+    # Reaching the end without a handler is a no-op.
+    detailedlist._impl.simulate_scroll(2)
+
+    handler = Mock()
+    detailedlist.on_near_end = handler
+    detailedlist.prefetch_threshold = 5
+    assert detailedlist.prefetch_threshold == 5
+    detailedlist.data = [{"key": f"Item {i}"} for i in range(50)]
+
+    detailedlist._impl.simulate_scroll(20)
+    handler.assert_not_called()
+    detailedlist._impl.simulate_scroll(44)
+    handler.assert_called_once_with(detailedlist)
+    handler.reset_mock()
+
+    # The handler is invoked again once more data has been loaded.
+    detailedlist.data.append({"key": "Item 50"})
+    detailedlist._impl.simulate_scroll(49)
+    handler.assert_called_once_with(detailedlist)
+
+
 def test_scroll_to_top(detailedlist):
     """A DetailedList can be scrolled to the top."""
     detailedlist.scroll_to_top()
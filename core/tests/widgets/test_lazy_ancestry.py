@@ -0,0 +1,261 @@
+from unittest.mock import patch
+
+import pytest
+
+import toga
+from toga.widgets.base import Widget
+from toga_dummy.utils import attribute_value
+
+
+@pytest.fixture(autouse=True)
+def lazy_ancestry(monkeypatch):
+    monkeypatch.setattr(Widget, "lazy_ancestry", True)
+
+
+def build_screen(name, size=3):
+    """A box containing a number of labels, one of which is in a nested box."""
+    return toga.Box(
+        id=name,
+        children=[
+            toga.Box(
+                id=f"{name}-inner",
+                children=[toga.Label(name, id=f"{name}-nested")],
+            ),
+            *(toga.Label(name, id=f"{name}-{i}") for i in range(size)),
+        ],
+    )
+
+
+def ids(registry):
+    return sorted(widget.id for widget in registry)
+
+
+def test_resolve_ancestry(app):
+    """Descendants resolve their app, window and root through their ancestors."""
+    window = toga.Window()
+    screen = build_screen("screen")
+    inner = screen.children[0]
+    nested = inner.children[0]
+
+    assert nested.app is None
+    assert nested.window is None
+    assert nested.root is screen
+
+    window.content = screen
+    assert nested.app is app
+    assert nested.window is window
+    assert inner.root is screen
+
+    # Only the widget that was assigned to the window was updated.
+    assert attribute_value(screen, "window") is window
+    assert attribute_value(nested, "window") is None
+
+    # The whole tree has been registered.
+    assert ids(app.widgets) == ids(screen._subtree())
+    assert ids(window.widgets) == ids(screen._subtree())
+
+
+def test_cached_ancestry(app):
+    """The ancestry of a widget is cached until the structure of a tree changes."""
+    window = toga.Window(content=build_screen("screen"))
+    nested = window.content.children[0].children[0]
+
+    assert nested.window is window
+    ancestry = nested._ancestry
+    assert ancestry[0] is window.content
+
+    # The cached ancestry is used while the structure is unchanged.
+    assert nested.app is app
+    assert nested._ancestry is ancestry
+
+    # A change in the structure of the tree invalidates the cache.
+    window.content.add(toga.Label("extra"))
+    assert nested.window is window
+    assert nested._ancestry is not ancestry
+    ancestry = nested._ancestry
+
+    # A change in the structure of another tree doesn't.
+    other = toga.Window(content=build_screen("other"))
+    other.content.add(toga.Label("extra"))
+    other.content.children[0].add(toga.Label("more"))
+    assert nested.window is window
+    assert nested._ancestry is ancestry
+
+
+def test_switch_content(app):
+    """Window content can be switched between prebuilt trees without visiting every
+    widget."""
+    window = toga.Window()
+    first = build_screen("first", size=50)
+    second = build_screen("second", size=50)
+
+    window.content = first
+    window.content = second
+
+    # Both trees remain registered with the app, but only the second tree is in the
+    # window.
+    assert ids(app.widgets) == ids(first._subtree() + second._subtree())
+    assert ids(window.widgets) == ids(second._subtree())
+    assert first.children[1].window is None
+    assert second.children[1].window is window
+
+    # Switching back doesn't need to visit the widgets in either tree.
+    with patch.object(Widget, "_subtree") as subtree:
+        window.content = first
+        window.content = second
+        window.content = first
+    subtree.assert_not_called()
+
+    assert first.children[1].window is window
+    assert second.children[1].window is None
+
+    # Closing the window releases the IDs of its content.
+    window.close()
+    assert ids(app.widgets) == ids(second._subtree())
+
+
+def test_detached_subtree(app):
+    """Widgets that are removed from the content of a window are no longer in the
+    window, even though they remain in the app until they are removed from it."""
+    window = toga.Window(content=build_screen("screen"))
+    screen = window.content
+    inner = screen.children[0]
+    assert "screen-nested" in window.widgets
+
+    # Move the subtree into a tree that belongs to the app, but isn't in a window.
+    detached = toga.Box(id="detached")
+    detached.app = app
+    detached.add(inner)
+    assert "screen-nested" in app.widgets
+    assert "screen-nested" not in window.widgets
+    assert "screen-inner" not in window.widgets
+    assert inner.children[0].window is None
+
+    # Remove a widget from the content.
+    screen.remove(screen.children[0])
+    assert "screen-0" not in window.widgets
+    assert ids(window.widgets) == ids(screen._subtree())
+
+    # Adding the subtree back to the content puts it back in the window.
+    screen.add(detached)
+    assert "screen-nested" in window.widgets
+    assert ids(window.widgets) == ids(screen._subtree())
+
+
+def test_move_subtree(app):
+    """A subtree can be moved between parents in an app without visiting every
+    widget."""
+    window = toga.Window(content=build_screen("screen"))
+    screen = window.content
+    inner = screen.children[0]
+    target = screen.children[1:]
+    new_parent = toga.Box(id="new-parent")
+    screen.add(new_parent)
+
+    with patch.object(Widget, "_subtree") as subtree:
+        new_parent.add(inner)
+    subtree.assert_not_called()
+
+    assert inner.parent is new_parent
+    assert inner not in screen.children
+    assert screen.children[:-1] == target
+    assert inner.children[0].window is window
+    assert inner.children[0].root is screen
+    assert "screen-nested" in app.widgets
+
+
+def test_add_to_other_tree(app):
+    """A subtree that is added to a tree in a different app (or no app) is
+    re-registered."""
+    window = toga.Window(content=build_screen("screen"))
+    inner = window.content.children[0]
+
+    orphan_parent = toga.Box()
+    orphan_parent.insert(0, inner)
+    assert inner.children[0].app is None
+    assert inner.children[0].root is orphan_parent
+    assert "screen-nested" not in app.widgets
+
+    window.content.add(orphan_parent)
+    assert inner.children[0].window is window
+    assert "screen-nested" in app.widgets
+
+
+def test_remove(app):
+    """Removing a subtree removes it from the app."""
+    window = toga.Window(content=build_screen("screen"))
+    inner = window.content.children[0]
+
+    window.content.remove(inner)
+
+    assert inner.parent is None
+    assert inner.root is inner
+    assert inner.children[0].app is None
+    assert inner.children[0].window is None
+    assert inner.children[0].root is inner
+    assert attribute_value(inner, "window") is None
+    assert "screen-inner" not in app.widgets
+    assert "screen-nested" not in app.widgets
+
+
+def test_duplicate_id(app):
+    """If a subtree contains a duplicate ID, it isn't added."""
+    window = toga.Window(content=build_screen("screen"))
+    duplicate = toga.Box(children=[toga.Label("dup", id="screen-nested")])
+    registered = ids(app.widgets)
+
+    with pytest.raises(
+        KeyError,
+        match=r"There is already a widget with the id 'screen-nested'",
+    ):
+        window.content.add(duplicate)
+
+    assert duplicate.parent is None
+    assert duplicate.children[0].window is None
+    assert ids(app.widgets) == registered
+
+
+def test_container_content(app):
+    """The content of a container resolves its ancestry through the container."""
+    window = toga.Window()
+    content = build_screen("content")
+    scroll = toga.ScrollContainer(content=content)
+    split = toga.SplitContainer(content=[toga.Box(id="left"), scroll])
+    window.content = split
+
+    nested = content.children[0].children[0]
+    assert nested.window is window
+    assert nested.root is content
+    assert "content-nested" in app.widgets
+    assert "left" in app.widgets
+
+    # Replacing the content releases the old content.
+    scroll.content = toga.Box(id="replacement")
+    assert nested.window is None
+    assert "content-nested" not in app.widgets
+    assert "replacement" in app.widgets
+
+    split.content = [toga.Box(id="new-left"), scroll]
+    assert "left" not in app.widgets
+    assert "new-left" in app.widgets
+
+
+def test_option_container_content(app):
+    """The content of an option container resolves its ancestry through the
+    container."""
+    window = toga.Window()
+    container = toga.OptionContainer(
+        content=[("First", toga.Box(id="first")), ("Second", toga.Box(id="second"))]
+    )
+    window.content = container
+
+    first = container.content["First"].content
+    assert first.window is window
+    assert "second" in app.widgets
+
+    container.content.append("Third", toga.Box(id="third"))
+    assert container.content["Third"].content.window is window
+    assert "third" in app.widgets
+
+    del container.content["Second"]
+    assert "second" not in app.widgets
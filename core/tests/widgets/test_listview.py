@@ -0,0 +1,371 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga.sources import ListSource
+from toga.style import Pack
+from toga.widgets.listview import _HeightIndex
+from toga_dummy.utils import assert_action_performed
+
+
+@pytest.fixture
+def source():
+    return ListSource(
+        accessors=["title"],
+        data=[{"title": f"Item {i}"} for i in range(100)],
+    )
+
+
+@pytest.fixture
+def row_factory():
+    def make_row(row, widget):
+        if widget is None:
+            widget = toga.Label("", style=Pack(height=30, padding_bottom=10))
+            make_row.created.append(widget)
+        widget.text = row.title
+        return widget
+
+    make_row.created = []
+    return make_row
+
+
+@pytest.fixture
+def on_scroll_handler():
+    return Mock()
+
+
+@pytest.fixture
+def listview(app, source, row_factory, on_scroll_handler):
+    listview = toga.ListView(
+        row_factory=row_factory,
+        data=source,
+        style=Pack(height=200),
+        on_scroll=on_scroll_handler,
+    )
+    # Put the list in a window so that it has a layout.
+    window = toga.Window()
+    window.content = listview
+    return listview
+
+
+def titles(listview):
+    return [widget.text for widget in listview.content.children[1:-1]]
+
+
+def test_widget_created(row_factory):
+    """A ListView can be created with minimal arguments."""
+    listview = toga.ListView(row_factory=row_factory)
+    assert listview._impl.interface == listview
+    assert_action_performed(listview, "create ScrollContainer")
+
+    assert isinstance(listview.data, ListSource)
+    assert len(listview.data) == 0
+    assert listview.visible_rows == []
+    assert listview.vertical
+    assert not listview.horizontal
+    assert listview.on_scroll._raw is None
+
+
+def test_create_with_values(row_factory, on_scroll_handler):
+    """A ListView can be created with initial values."""
+    listview = toga.ListView(
+        row_factory=row_factory,
+        accessors=["title"],
+        data=[("First",), ("Second",)],
+        on_scroll=on_scroll_handler,
+    )
+    assert listview.data[0].title == "First"
+    assert listview.on_scroll._raw == on_scroll_handler
+
+    # Both rows fit in the minimum size of the list.
+    assert titles(listview) == ["First", "Second"]
+
+
+def test_visible_rows(listview, source, row_factory):
+    """Only the rows that intersect the viewport have widgets."""
+    # The rows are 40 pixels high (including padding), so 5 rows fill the list.
+    assert titles(listview) == [f"Item {i}" for i in range(5)]
+    assert listview.visible_rows == list(source)[:5]
+    assert len(row_factory.created) == 5
+
+    # The spacers represent the unseen rows.
+    assert listview._top_spacer.style.height == 0
+    assert listview._bottom_spacer.style.height == 95 * 40
+
+
+def test_scroll(listview, source, row_factory, on_scroll_handler):
+    """Scrolling updates the visible rows, reusing widgets."""
+    listview.vertical_position = 420
+
+    # The viewport covers 420-620; Item 10 covers 400-440, Item 15 covers 600-640.
+    assert titles(listview) == [f"Item {i}" for i in range(10, 16)]
+    assert listview._top_spacer.style.height == 400
+    assert listview._bottom_spacer.style.height == 84 * 40
+
+    # Only one new widget was needed.
+    assert len(row_factory.created) == 6
+
+    # The user's handler was invoked.
+    on_scroll_handler.assert_called_once_with(listview)
+
+    # A small scroll only replaces some widgets.
+    listview.vertical_position = 460
+    assert titles(listview) == [f"Item {i}" for i in range(11, 17)]
+    assert len(row_factory.created) == 6
+
+
+async def test_deferred_layout(app, source, row_factory):
+    """If the layout is deferred, rows are updated once the layout is complete."""
+    listview = toga.ListView(
+        row_factory=row_factory,
+        data=source,
+        style=Pack(height=300),
+    )
+    window = toga.Window()
+    window.content = listview
+
+    # Before the layout, the list is assumed to have the minimum height, and the
+    # estimated row height is used.
+    assert titles(listview) == ["Item 0", "Item 1"]
+
+    # Once the layout is complete, the displayed rows are updated.
+    await asyncio.sleep(0)
+    assert titles(listview) == [f"Item {i}" for i in range(8)]
+
+
+def test_estimated_heights(app, row_factory):
+    """Rows that haven't been measured use the average measured height."""
+    listview = toga.ListView(
+        row_factory=row_factory,
+        accessors=["title"],
+        estimated_row_height=20,
+    )
+    # Before any rows have been measured, the estimated row height is used.
+    assert listview._row_height() == 20
+
+    # Once rows have been displayed, the measured height is used. The list is
+    # assumed to be at least the minimum height.
+    listview.data = [(f"Item {i}",) for i in range(100)]
+    assert listview._row_height() == 40
+    assert len(listview.visible_rows) == 3
+    assert listview._bottom_spacer.style.height == 97 * 40
+
+
+def test_insert(listview, source):
+    """Inserting a row into the source updates the visible rows."""
+    source.insert(2, {"title": "New"})
+    assert titles(listview) == ["Item 0", "Item 1", "New", "Item 2", "Item 3"]
+
+    # A row inserted out of view only changes the size of the spacers.
+    source.append({"title": "Last"})
+    assert titles(listview) == ["Item 0", "Item 1", "New", "Item 2", "Item 3"]
+    assert listview._bottom_spacer.style.height == 97 * 40
+
+
+def test_insert_many(listview, source, monkeypatch):
+    """Appending rows updates the height index without rebuilding it."""
+    builds = []
+    build = _HeightIndex._build
+    monkeypatch.setattr(
+        _HeightIndex, "_build", lambda self: builds.append(self) or build(self)
+    )
+
+    for i in range(200):
+        source.append({"title": f"New {i}"})
+    assert titles(listview) == [f"Item {i}" for i in range(5)]
+    assert listview._bottom_spacer.style.height == 295 * 40
+    assert builds == []
+
+    # Removing the last row doesn't rebuild the index either.
+    for i in range(100):
+        source.remove(source[-1])
+    assert listview._bottom_spacer.style.height == 195 * 40
+    assert builds == []
+
+
+def test_insert_unknown_position(listview, source):
+    """If a notification doesn't describe the position of a change, the height index
+    is rebuilt."""
+    # Replacing a row is notified as an insertion.
+    heights = listview._height_index
+    source[1] = {"title": "Replaced"}
+    assert listview._height_index is not heights
+    assert len(listview._height_index) == 100
+    assert titles(listview) == ["Item 0", "Replaced", "Item 2", "Item 3", "Item 4"]
+
+    heights = listview._height_index
+    source.notify("remove", index=0, item=source[0])
+    assert listview._height_index is not heights
+    assert len(listview._height_index) == 100
+    assert titles(listview) == ["Item 0", "Replaced", "Item 2", "Item 3", "Item 4"]
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [("insert", 3, 25)],
+        [("insert", 0, None)],
+        [("insert", 10, 25), ("insert", 11, None), ("insert", 12, 7)],
+        [("remove", 9)],
+        [("remove", 0), ("remove", 4)],
+        [("insert", 10, 5), ("remove", 10), ("insert", 10, None), ("remove", 3)],
+        [("insert", i, i) for i in range(10, 40)],
+        [("remove", i) for i in range(9, -1, -1)],
+    ],
+)
+def test_height_index(operations):
+    """The height index can be updated incrementally."""
+    heights = [10, None, 20, 30, None, None, 40, 50, None, 60]
+    index = _HeightIndex(list(heights))
+    for operation, position, *height in operations:
+        getattr(index, operation)(position, *height)
+        if operation == "insert":
+            heights.insert(position, *height)
+        else:
+            del heights[position]
+
+    rebuilt = _HeightIndex(list(heights))
+    assert index.heights == heights
+    assert index._sums == rebuilt._sums
+    assert index._counts == rebuilt._counts
+    for y in range(0, 600, 7):
+        assert index.find(y, 15) == rebuilt.find(y, 15)
+    assert index.total(15) == rebuilt.total(15)
+
+
+def test_remove(listview, source):
+    """Removing a row from the source updates the visible rows."""
+    source.remove(source[1])
+    assert titles(listview) == ["Item 0", "Item 2", "Item 3", "Item 4", "Item 5"]
+    assert listview._bottom_spacer.style.height == 94 * 40
+
+
+def test_change(listview, source):
+    """Changing a visible row refreshes the widget displaying it."""
+    widget = listview.content.children[2]
+    source[1].title = "Changed"
+
+    assert titles(listview) == ["Item 0", "Changed", "Item 2", "Item 3", "Item 4"]
+    assert listview.content.children[2] is widget
+
+    # Changing a row that isn't visible has no effect.
+    source[50].title = "Also changed"
+    assert titles(listview) == ["Item 0", "Changed", "Item 2", "Item 3", "Item 4"]
+
+    # Changing a row that has been measured, but is no longer visible, means it will
+    # be measured again.
+    listview.vertical_position = 400
+    source[1].title = "Changed again"
+    assert id(source[1]) not in listview._row_heights
+    listview.vertical_position = 0
+    assert titles(listview) == ["Item 0", "Changed again", "Item 2", "Item 3", "Item 4"]
+    assert listview._row_heights[id(source[1])] == 40
+
+
+def test_change_new_widget(listview, source):
+    """A row factory can return a different widget when a row changes."""
+    listview._row_factory = lambda row, widget: toga.Label(
+        row.title, style=Pack(height=30, padding_bottom=10)
+    )
+    old_widget = listview.content.children[2]
+    source[1].title = "Changed"
+
+    assert titles(listview) == ["Item 0", "Changed", "Item 2", "Item 3", "Item 4"]
+    assert listview.content.children[2] is not old_widget
+    assert old_widget in listview._recycled
+
+
+def test_clear(listview, source):
+    """Clearing the source removes all rows."""
+    source.clear()
+    assert titles(listview) == []
+    assert listview._top_spacer.style.height == 0
+    assert listview._bottom_spacer.style.height == 0
+
+    # The released widgets will be reused.
+    assert len(listview._recycled) == 5
+
+
+def test_set_data(listview, row_factory):
+    """The data source can be replaced."""
+    listview.data = [{"title": "A"}, {"title": "B"}]
+
+    assert titles(listview) == ["A", "B"]
+    assert len(row_factory.created) == 5
+
+    listview.data = None
+    assert titles(listview) == []
+
+    # The old source is no longer observed.
+    source = listview.data
+    listview.data = [{"title": "C"}]
+    assert listview._listener not in source.listeners
+    source.append({"title": "D"})
+    assert titles(listview) == ["C"]
+
+
+def test_resize(app, source, row_factory):
+    """If the list is resized by a change elsewhere in the layout, the visible rows
+    are updated."""
+    listview = toga.ListView(
+        row_factory=row_factory,
+        data=source,
+        style=Pack(flex=1),
+    )
+    box = toga.Box(style=Pack(direction="column", height=200), children=[listview])
+    window = toga.Window()
+    window.content = box
+    assert titles(listview) == [f"Item {i}" for i in range(5)]
+
+    box.style.height = 400
+    assert titles(listview) == [f"Item {i}" for i in range(10)]
+    assert listview._bottom_spacer.style.height == 90 * 40
+
+    # A layout that doesn't change the height of the list doesn't change the rows.
+    widgets = listview.content.children
+    box.style.width = 300
+    assert listview.content.children == widgets
+
+
+def test_scroll_large(app, row_factory):
+    """The rows at an offset are found without visiting the rows above them."""
+    source = ListSource(
+        accessors=["title"],
+        data=[{"title": f"Item {i}"} for i in range(100_000)],
+    )
+    listview = toga.ListView(
+        row_factory=row_factory,
+        data=source,
+        style=Pack(height=200),
+    )
+    window = toga.Window()
+    window.content = listview
+    listview._impl._set_value("max_vertical_position", 4_000_000)
+
+    # Make the first row taller than the others.
+    listview._row_factory = lambda row, widget: toga.Label(
+        row.title,
+        style=Pack(height=70 if row.title == "First" else 30, padding_bottom=10),
+    )
+    source[0].title = "First"
+
+    accessed = []
+    getitem = ListSource.__getitem__
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            ListSource,
+            "__getitem__",
+            lambda self, index: accessed.append(index) or getitem(self, index),
+        )
+        listview.vertical_position = 80_000
+
+    # Only the rows around the viewport were accessed, rather than every row above it.
+    assert accessed
+    assert min(accessed) > 1000
+
+    # The first visible row intersects the top of the viewport.
+    first = listview.visible_rows[0]
+    assert listview._top_spacer.style.height <= 80_000
+    assert listview._top_spacer.style.height + listview._row_heights[id(first)] > 80_000
@@ -3,7 +3,13 @@ from unittest.mock import Mock
 import pytest
 
 import toga
-from toga_dummy.utils import EventLog, assert_action_performed, attribute_value
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+    assert_action_performed_with,
+    attribute_value,
+)
 
 
 @pytest.fixture
@@ -165,3 +171,99 @@ def test_on_change(widget):
 
     # Callback was invoked
     handler.assert_called_once_with(widget)
+
+
+def test_append(widget):
+    """Text can be appended to the value of the widget."""
+    widget.value = "First line\n"
+
+    # Install an on_change handler
+    handler = Mock()
+    widget.on_change = handler
+
+    widget.append("Second line\n")
+    assert widget.value == "First line\nSecond line\n"
+    assert_action_performed_with(widget, "append", value="Second line\n")
+
+    # No lines were removed.
+    assert_action_not_performed(widget, "remove lines")
+
+    # Callback was invoked
+    handler.assert_called_once_with(widget)
+
+    # Any object can be appended.
+    widget.append(42)
+    assert widget.value == "First line\nSecond line\n42"
+
+
+def test_append_refresh(widget):
+    """Appending text refreshes the layout, as the size of the content has
+    changed."""
+    widget.refresh = Mock()
+    widget.append("More text")
+    widget.refresh.assert_called_once_with()
+
+
+def test_max_lines():
+    """When text is appended, lines are removed in chunks to honor max_lines."""
+    widget = toga.MultilineTextInput(max_lines=20)
+    assert widget.max_lines == 20
+
+    # Setting the value directly doesn't remove lines.
+    widget.value = "".join(f"Line {i}\n" for i in range(25))
+    assert widget.value.startswith("Line 0\n")
+
+    # Appending text removes enough lines to leave 18, so that lines don't need to be
+    # removed on the next append. The newline at the end of the text ends the last
+    # line, rather than starting a new one.
+    widget.append("Line 25\n")
+    assert_action_performed_with(widget, "remove lines", count=8)
+    assert widget.value == "".join(f"Line {i}\n" for i in range(8, 26))
+
+    # The next append doesn't need to remove any lines.
+    widget._impl.remove_lines = Mock(wraps=widget._impl.remove_lines)
+    widget.append("Line 26\n")
+    widget._impl.remove_lines.assert_not_called()
+    assert widget.value == "".join(f"Line {i}\n" for i in range(8, 27))
+
+    # Text that doesn't end with a newline is an incomplete line, which text appended
+    # later is added to.
+    widget.append("Line 27")
+    widget.append(" continued\n")
+    widget._impl.remove_lines.assert_not_called()
+    assert widget.value.endswith("Line 26\nLine 27 continued\n")
+
+    # The limit can be removed.
+    widget.max_lines = None
+    assert widget.max_lines is None
+    widget.append("".join(f"Line {i}\n" for i in range(28, 60)))
+    assert widget.value.startswith("Line 8\n")
+
+
+def test_max_lines_user_change():
+    """If the user changes the value, the lines are counted again."""
+    widget = toga.MultilineTextInput(max_lines=10)
+    widget.value = "".join(f"Line {i}\n" for i in range(9))
+
+    # The user adds some lines.
+    widget._impl._set_value("value", "".join(f"Line {i}\n" for i in range(12)))
+    widget._impl.simulate_change()
+
+    # When text is next appended, the lines added by the user are counted.
+    widget.append("Line 12\n")
+    assert_action_performed_with(widget, "remove lines", count=4)
+    assert widget.value == "".join(f"Line {i}\n" for i in range(4, 13))
+
+    # Once the lines have been counted, only appended text needs to be counted.
+    widget._impl.remove_lines = Mock(wraps=widget._impl.remove_lines)
+    widget._impl.get_value = Mock(wraps=widget._impl.get_value)
+    widget.append("Line 13\n")
+    widget._impl.remove_lines.assert_not_called()
+    widget._impl.get_value.assert_not_called()
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_invalid_max_lines(widget, value):
+    """max_lines must be positive."""
+    with pytest.raises(ValueError, match=r"max_lines must be a positive integer"):
+        widget.max_lines = value
@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga.sources import ListSource
+from toga.widgets._scroll import _NearEnd
+
+
+@pytest.fixture
+def source():
+    return ListSource(accessors=["key"], data=[f"Item {i}" for i in range(50)])
+
+
+@pytest.fixture
+def handler():
+    return Mock()
+
+
+@pytest.fixture
+def near_end(source, handler):
+    near_end = _NearEnd(toga.Box(), prefetch_threshold=5)
+    near_end.set_source(source)
+    near_end.reset(handler)
+    return near_end
+
+
+def test_threshold(near_end):
+    """The threshold can be changed, but can't be negative."""
+    assert near_end.threshold == 5
+
+    near_end.threshold = "7"
+    assert near_end.threshold == 7
+
+    with pytest.raises(
+        ValueError,
+        match=r"prefetch_threshold must be a non-negative integer",
+    ):
+        near_end.threshold = -1
+
+
+def test_near_end(near_end, handler):
+    """The handler is invoked once as the visible rows approach the end."""
+    # Rows that aren't near the end don't invoke the handler.
+    near_end.visible_rows_changed(20)
+    handler.assert_not_called()
+
+    # Row 44 is within 5 rows of the end.
+    near_end.visible_rows_changed(44)
+    handler.assert_called_once_with()
+    handler.reset_mock()
+
+    # Further scrolling doesn't invoke the handler again.
+    near_end.visible_rows_changed(45)
+    near_end.visible_rows_changed(49)
+    handler.assert_not_called()
+
+    # A new handler can be invoked.
+    new_handler = Mock()
+    near_end.reset(new_handler)
+    near_end.visible_rows_changed(49)
+    new_handler.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        pytest.param(lambda source: source.append("More"), id="insert"),
+        pytest.param(lambda source: source.remove(source[0]), id="remove"),
+        pytest.param(lambda source: setattr(source[0], "key", "Changed"), id="change"),
+        pytest.param(lambda source: source.clear(), id="clear"),
+    ],
+)
+def test_data_changed(near_end, handler, source, modify):
+    """Any change to the data allows the handler to be invoked again, even if the
+    length of the data is unchanged."""
+    near_end.visible_rows_changed(49)
+    handler.reset_mock()
+
+    modify(source)
+    near_end.visible_rows_changed(len(source) - 1)
+    handler.assert_called_once_with()
+
+
+def test_set_source(near_end, handler, source):
+    """A new data source can reach its end, and the old source is ignored."""
+    near_end.visible_rows_changed(49)
+    handler.reset_mock()
+
+    new_source = ListSource(accessors=["key"], data=["A", "B"])
+    near_end.set_source(new_source)
+    near_end.visible_rows_changed(1)
+    handler.assert_called_once_with()
+    handler.reset_mock()
+
+    assert near_end not in source.listeners
+    source.append("Old")
+    near_end.visible_rows_changed(1)
+    handler.assert_not_called()
+
+
+async def test_pending(near_end, source):
+    """The handler isn't invoked again while an asynchronous result is pending."""
+    result = asyncio.get_running_loop().create_future()
+    handler = Mock(return_value=result)
+    near_end.reset(handler)
+
+    near_end.visible_rows_changed(49)
+    handler.assert_called_once_with()
+    handler.reset_mock()
+
+    # The data changes, but the handler is still loading.
+    source.append("More")
+    near_end.visible_rows_changed(50)
+    handler.assert_not_called()
+
+    # Once loading is complete, the handler can be invoked again.
+    result.set_result(None)
+    near_end.visible_rows_changed(50)
+    handler.assert_called_once_with()
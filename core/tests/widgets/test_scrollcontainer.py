@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -415,3 +416,97 @@ def test_position(scroll_container, on_scroll_handler, position, expected):
 
     # scroll handler fired
     on_scroll_handler.assert_called_with(scroll_container)
+
+
+def test_near_end_defaults(scroll_container):
+    """By default, there is no near end handler."""
+    assert scroll_container.on_near_end._raw is None
+    assert scroll_container.prefetch_threshold == 200
+
+    # Reaching the end without a handler is a no-op.
+    scroll_container.vertical_position = 2000
+
+
+def test_prefetch_threshold(scroll_container):
+    """The prefetch threshold can be changed, but can't be negative."""
+    scroll_container.prefetch_threshold = 50
+    assert scroll_container.prefetch_threshold == 50
+
+    with pytest.raises(
+        ValueError,
+        match=r"prefetch_threshold must be a non-negative integer",
+    ):
+        scroll_container.prefetch_threshold = -1
+
+
+def test_near_end(content, on_scroll_handler):
+    """The near end handler is invoked once as the container approaches the end."""
+    handler = Mock()
+    scroll_container = toga.ScrollContainer(
+        content=content,
+        on_scroll=on_scroll_handler,
+        on_near_end=handler,
+        prefetch_threshold=100,
+    )
+    assert scroll_container.on_near_end._raw == handler
+    assert scroll_container.prefetch_threshold == 100
+
+    # Positions that aren't near the end don't trigger the handler.
+    scroll_container.vertical_position = 1000
+    handler.assert_not_called()
+    on_scroll_handler.assert_called_once_with(scroll_container)
+
+    # 1900 is within 100 pixels of the end.
+    scroll_container.vertical_position = 1900
+    handler.assert_called_once_with(scroll_container)
+    handler.reset_mock()
+
+    # Further scrolling doesn't invoke the handler again...
+    scroll_container.vertical_position = 2000
+    handler.assert_not_called()
+
+    # ... until the content has grown.
+    scroll_container._impl._set_value("max_vertical_position", 3000)
+    scroll_container.vertical_position = 2950
+    handler.assert_called_once_with(scroll_container)
+    handler.reset_mock()
+
+    # If vertical scrolling is disabled, the handler isn't invoked.
+    scroll_container._impl._set_value("max_vertical_position", 4000)
+    scroll_container.vertical = False
+    handler.assert_not_called()
+
+
+async def test_near_end_async(scroll_container):
+    """An asynchronous near end handler isn't invoked again while it is running."""
+    loading = asyncio.Event()
+    calls = []
+
+    async def load_more(widget, **kwargs):
+        calls.append(widget.max_vertical_position)
+        await loading.wait()
+        widget._impl._set_value("max_vertical_position", 3000)
+
+    scroll_container.on_near_end = load_more
+
+    scroll_container.vertical_position = 2000
+    await asyncio.sleep(0)
+    assert calls == [2000]
+
+    # While more content is loading, the handler isn't invoked, even though the
+    # content has changed.
+    scroll_container._impl._set_value("max_vertical_position", 2500)
+    scroll_container.vertical_position = 2500
+    await asyncio.sleep(0)
+    assert calls == [2000]
+
+    # Once loading is complete, the handler can be invoked again.
+    loading.set()
+    await asyncio.sleep(0)
+    loading.clear()
+    scroll_container.vertical_position = 3000
+    await asyncio.sleep(0)
+    assert calls == [2000, 3000]
+
+    loading.set()
+    await asyncio.sleep(0)
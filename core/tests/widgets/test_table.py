@@ -265,6 +265,32 @@ def test_activation(table, on_activate_handler):
     on_activate_handler.assert_called_once_with(table, row=table.data[1])
 
 
+def test_near_end(table):
+    """The near end handler is invoked as the visible rows approach the end of the
+    data."""
+    assert table.on_near_end._raw is None
+    assert table.prefetch_threshold == 10
+    # Reaching the end without a handler is a no-op.
+    table._impl.simulate_scroll(2)
+
+    handler = Mock()
+    table.on_near_end = handler
+    table.prefetch_threshold = 5
+    assert table.prefetch_threshold == 5
+    table.data = [{"key": f"Item {i}"} for i in range(50)]
+
+    table._impl.simulate_scroll(20)
+    handler.assert_not_called()
+    table._impl.simulate_scroll(44)
+    handler.assert_called_once_with(table)
+    handler.reset_mock()
+
+    # The handler is invoked again once more data has been loaded.
+    table.data.append({"key": "Item 50"})
+    table._impl.simulate_scroll(49)
+    handler.assert_called_once_with(table)
+
+
 def test_scroll_to_top(table):
     """A table can be scrolled to the top."""
     table.scroll_to_top()
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 import toga
+from toga.widgets.base import Widget
 
 
 # Create the simplest possible widget with a concrete implementation
@@ -218,3 +221,47 @@ def test_reuse_id(app):
     assert "magic" in win_1.widgets
     assert "magic" not in win_2.widgets
     assert app.widgets["magic"] == second
+
+
+def test_window_index(app):
+    """Lookups in a window's registry only consider the widgets in that window."""
+    win_1 = make_window("1")
+    make_window("2")
+
+    with patch.object(type(app.widgets), "items") as items:
+        assert len(win_1.widgets) == 3
+        assert sorted(win_1.widgets.keys()) == ["1.0", "1.1", "1.2"]
+        assert "2.1" not in win_1.widgets
+    items.assert_not_called()
+
+
+def test_move_between_windows(app):
+    """A widget that is moved directly between windows moves between their
+    registries."""
+    win_1 = make_window("1")
+    win_2 = make_window("2")
+
+    widget = win_1.content.children[0]
+    widget.window = win_2
+
+    assert "1.1" in app.widgets
+    assert "1.1" not in win_1.widgets
+    assert win_2.widgets["1.1"] == widget
+
+
+def test_lazy_ancestry(monkeypatch, app):
+    """If widgets resolve their window lazily, the index is rebuilt when the widget
+    trees change."""
+    monkeypatch.setattr(Widget, "lazy_ancestry", True)
+    win_1 = make_window("1")
+
+    assert sorted(win_1.widgets.keys()) == ["1.0", "1.1", "1.2"]
+    # The index is reused until the widget trees change.
+    index = win_1._widget_index()
+    assert win_1._widget_index() is index
+
+    win_1.content.add(ExampleWidget(id="1.3"))
+    assert sorted(win_1.widgets.keys()) == ["1.0", "1.1", "1.2", "1.3"]
+
+    win_1.content = ExampleBox(id="other")
+    assert sorted(win_1.widgets.keys()) == ["other"]
@@ -4,7 +4,9 @@ from unittest.mock import Mock
 import pytest
 
 import toga
+from toga.constants import ResizePolicy
 from toga_dummy.utils import (
+    EventLog,
     assert_action_not_performed,
     assert_action_performed,
     assert_action_performed_with,
@@ -30,6 +32,7 @@ def test_window_created(app):
     assert window.resizable
     assert window.closable
     assert window.minimizable
+    assert window.resize_policy == ResizePolicy.IMMEDIATE
     assert not hasattr(window, "toolbar")
     assert window.on_close._raw is None
 
@@ -88,6 +91,18 @@ def test_window_created_without_app():
         toga.Window()
 
 
+def test_resize_policy(window):
+    """The policy for laying out content during a resize can be changed."""
+    window.resize_policy = ResizePolicy.THROTTLED
+    assert window.resize_policy == ResizePolicy.THROTTLED
+
+    window.resize_policy = 0
+    assert window.resize_policy == ResizePolicy.IMMEDIATE
+
+    with pytest.raises(ValueError, match=r"42 is not a valid ResizePolicy"):
+        window.resize_policy = 42
+
+
 def test_set_app(window, app):
     """A window's app cannot be reassigned."""
     assert window.app == app
@@ -239,6 +254,49 @@ def test_set_size_with_content(window):
     assert_action_performed(content, "refresh")
 
 
+def test_batch_update(window):
+    """Changes to widgets in a window can be applied as a single update."""
+    content = toga.Box()
+    window.content = content
+    container = window._impl.container
+    assert container.layout_count == 1
+
+    with window.batch_update():
+        labels = [toga.Label(f"Label {i}") for i in range(10)]
+        content.add(*labels)
+        for label in labels:
+            label.style.font_size = 20
+            label.text = "New text"
+
+        # Batches can be nested
+        with window.batch_update():
+            content.add(toga.Label("Last"))
+
+        # Nothing has been applied. The labels were rehinted when they were
+        # created, but they weren't part of the window at that time.
+        assert container.layout_count == 1
+        assert_action_not_performed(labels[0], "set font")
+        assert len(EventLog.performed_actions(labels[0], "refresh")) == 1
+
+    # Once the batch is complete, there's a single layout.
+    assert container.layout_count == 2
+    assert_action_performed(labels[0], "set font")
+    assert window._batch is None
+
+    # Each modified widget was rehinted once.
+    assert len(EventLog.performed_actions(labels[0], "refresh")) == 2
+
+
+def test_batch_update_content(window):
+    """Window content can be assigned in a batch update."""
+    content = toga.Box()
+    with window.batch_update():
+        window.content = content
+        assert window._impl.container.layout_count == 0
+
+    assert window._impl.container.layout_count == 1
+
+
 def test_show_hide(window, app):
     """The window can be shown and hidden."""
     assert window.app == app
@@ -2,4 +2,8 @@ import toga
 
 from . import factory  # noqa: F401
 
-__version__ = toga._package_version(__file__, __name__)
+
+def __getattr__(name):
+    if name == "__version__":
+        return toga._version(__file__, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -78,3 +78,5 @@ class Widget(LoggedObject):
 
     def refresh(self):
         self._action("refresh")
+        if self.container:
+            self.container.rehint_count += 1
@@ -45,3 +45,6 @@ class DetailedList(Widget):
 
     def stimulate_refresh(self):
         self.interface.on_refresh()
+
+    def simulate_scroll(self, last_row):
+        self.interface._visible_rows_changed(last_row)
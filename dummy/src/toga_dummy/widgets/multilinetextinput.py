@@ -12,6 +12,16 @@ class MultilineTextInput(Widget):
     def get_value(self):
         return self._get_value("value")
 
+    def append(self, value):
+        self._action("append", value=value)
+        self._set_value("value", self._get_value("value") + value)
+        self.interface.on_change()
+
+    def remove_lines(self, count):
+        self._action("remove lines", count=count)
+        self._set_value("value", self._get_value("value").split("\n", count)[-1])
+        self.interface.on_change()
+
     def get_placeholder(self):
         return self._get_value("placeholder")
 
@@ -31,4 +41,4 @@ class MultilineTextInput(Widget):
         self._action("scroll to top")
 
     def simulate_change(self):
-        self.interface.on_change()
+        self.interface._value_changed()
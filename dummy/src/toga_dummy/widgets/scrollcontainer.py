@@ -15,6 +15,10 @@ class ScrollContainer(Widget):
     def get_height(self):
         return 4200
 
+    def set_bounds(self, x, y, width, height):
+        super().set_bounds(x, y, width, height)
+        self.interface._resized()
+
     def set_content(self, widget):
         self.scroll_container.content = widget
         self._action("set content", widget=widget)
@@ -29,7 +33,7 @@ class ScrollContainer(Widget):
         # Disabling scrolling implies a position reset; that's a scroll event.
         if value is False:
             self._set_value("vertical_position", 0)
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def get_horizontal(self):
         return self._get_value("horizontal", True)
@@ -40,7 +44,7 @@ class ScrollContainer(Widget):
         # Disabling scrolling implies a position reset; that's a scroll event.
         if value is False:
             self._set_value("horizontal_position", 0)
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def set_on_scroll(self, on_scroll):
         self._set_value("on_scroll", on_scroll)
@@ -48,7 +52,7 @@ class ScrollContainer(Widget):
     def set_position(self, horizontal_position, vertical_position):
         self._set_value("horizontal_position", horizontal_position)
         self._set_value("vertical_position", vertical_position)
-        self.interface.on_scroll()
+        self.interface._scrolled()
 
     def get_horizontal_position(self):
         return self._get_value("horizontal_position", 0)
@@ -60,4 +64,6 @@ class ScrollContainer(Widget):
         return self._get_value("vertical_position", 0)
 
     def get_max_vertical_position(self):
-        return 2000 if self.get_vertical() else 0
+        return (
+            self._get_value("max_vertical_position", 2000) if self.get_vertical() else 0
+        )
@@ -42,3 +42,6 @@ class Table(Widget):
 
     def simulate_activate(self, row):
         self.interface.on_activate(row=self.interface.data[row])
+
+    def simulate_scroll(self, last_row):
+        self.interface._visible_rows_changed(last_row)
@@ -13,6 +13,10 @@ class Container:
     def __init__(self, content=None):
         self.baseline_dpi = 96
         self.dpi = 96
+        # The number of times the content has been laid out, and the number of
+        # widgets that have been rehinted.
+        self.layout_count = 0
+        self.rehint_count = 0
 
         # Prime the underlying storage before using setter
         self._content = None
@@ -39,7 +43,11 @@ class Container:
     def height(self):
         return self.content.get_size().height
 
+    def refreshing(self):
+        pass
+
     def refreshed(self):
+        self.layout_count += 1
         if self.content:
             self.content.refresh()
 
@@ -1,4 +1,6 @@
-from .libs import Gdk, Gtk
+from toga.constants import ResizePolicy
+
+from .libs import Gdk, GLib, Gtk, update_css_stylesheet
 
 #######################################################################################
 # Implementation notes:
@@ -8,6 +10,12 @@ from .libs import Gdk, Gtk
 # details.
 #######################################################################################
 
+# When a window uses the THROTTLED resize policy, the minimum interval between layouts
+# for intermediate sizes, and the time for which the size must be unchanged before the
+# content is laid out for the final size, in seconds.
+RESIZE_LAYOUT_INTERVAL = 0.05
+RESIZE_SETTLE_TIME = 0.15
+
 
 class TogaContainer(Gtk.Fixed):
     """A GTK container widget implementing Toga's layout.
@@ -31,8 +39,45 @@ class TogaContainer(Gtk.Fixed):
         # A flag that can be used to explicitly flag that a redraw is required.
         self.needs_redraw = True
 
+        # The (width, height) for which the content was last laid out. The layout is
+        # reused by the preferred size queries and the allocation of a frame, unless
+        # the container has been marked as needing a redraw.
+        self._layout_size = None
+
+        # The geometry that was last allocated to each child widget.
+        self._allocations = {}
+
+        # The frame times (in microseconds) of the last layout, and of the last change
+        # in size while a throttled resize is in progress; and the tick callback that
+        # waits for a throttled resize to settle.
+        self._laid_out_at = 0
+        self._resized_at = 0
+        self._resize_tick_id = None
+
+        # The number of times the content has been laid out, the number of widgets
+        # that have been rehinted, and the number of child widget allocations that
+        # changed the widget's geometry.
+        self.layout_count = 0
+        self.rehint_count = 0
+        self.allocation_count = 0
+
+    def refreshing(self):
+        # The interface is about to lay out the content; make sure it uses the
+        # current hints of any widgets that have been marked as dirty.
+        self.rehint()
+
     def refreshed(self):
-        pass
+        # The interface has laid out the content for the current size, so the
+        # container doesn't need to lay it out again. If a widget was marked as dirty
+        # during the layout, that layout used stale hints, so the content must still
+        # be laid out again before the next redraw.
+        self.layout_count += 1
+        if not self._dirty_widgets:
+            self._layout_size = (self.width, self.height)
+            self.needs_redraw = False
+
+        self.min_width = self._content.interface.layout.min_width
+        self.min_height = self._content.interface.layout.min_height
 
     def make_dirty(self, widget=None):
         """Mark the container (or a specific widget in the container) as dirty.
@@ -88,25 +133,85 @@ class TogaContainer(Gtk.Fixed):
         else:
             self.make_dirty()
 
+    def rehint(self):
+        """Rehint any widgets that have been marked as dirty.
+
+        The layout must then be recomputed, and the widgets will need to be
+        reallocated.
+        """
+        if self._dirty_widgets:
+            # The widgets must be measured with any CSS classes they have been given.
+            update_css_stylesheet()
+
+        while self._dirty_widgets:
+            widget = self._dirty_widgets.pop()
+            widget.rehint()
+            self._allocations.pop(widget.native, None)
+            self.rehint_count += 1
+            self.needs_redraw = True
+
     def recompute(self):
         """Rehint and re-layout the container's content, if necessary.
 
-        Any widgets known to be dirty will be rehinted. The minimum possible layout size
-        for the container will also be recomputed.
+        Any widgets known to be dirty will be rehinted. The content will then be laid
+        out for the current size of the container, unless it has already been laid out
+        for that size; this also recomputes the minimum possible layout size for the
+        container.
         """
-        if self._content and self._dirty_widgets:
-            # If any of the widgets have been marked as dirty,
-            # recompute their bounds, and re-evaluate the minimum
-            # allowed size for the layout.
-            while self._dirty_widgets:
-                widget = self._dirty_widgets.pop()
-                widget.rehint()
+        if self._content:
+            self.rehint()
+
+            size = (self.width, self.height)
+            if self.needs_redraw or (
+                size != self._layout_size and not self._defer_resize_layout()
+            ):
+                # Recompute the layout
+                self._content.interface.style.layout(self._content.interface, self)
+                self.layout_count += 1
+                self._layout_size = size
+                self.needs_redraw = False
+
+                frame_clock = self.get_frame_clock()
+                if frame_clock:
+                    self._laid_out_at = frame_clock.get_frame_time()
+
+                self.min_width = self._content.interface.layout.min_width
+                self.min_height = self._content.interface.layout.min_height
 
-            # Recompute the layout
-            self._content.interface.style.layout(self._content.interface, self)
+    def _defer_resize_layout(self):
+        """Should the layout for a new size of the container be deferred?
 
-            self.min_width = self._content.interface.layout.min_width
-            self.min_height = self._content.interface.layout.min_height
+        If the window uses the THROTTLED resize policy, the content is laid out for
+        intermediate sizes at most once every RESIZE_LAYOUT_INTERVAL; in between, the
+        children keep their previous geometry. A tick callback on the frame clock
+        ensures the content is laid out for the final size once the size settles.
+        Changes to the content itself are never deferred.
+        """
+        window = self._content.interface.window
+        frame_clock = self.get_frame_clock()
+        if (
+            window is None
+            or window.resize_policy != ResizePolicy.THROTTLED
+            or frame_clock is None
+            or self._layout_size is None
+        ):
+            return False
+
+        self._resized_at = frame_clock.get_frame_time()
+        if self._resize_tick_id is None:
+            self._resize_tick_id = self.add_tick_callback(self._resize_tick)
+
+        return self._resized_at - self._laid_out_at < RESIZE_LAYOUT_INTERVAL * 1e6
+
+    def _resize_tick(self, widget, frame_clock):
+        if frame_clock.get_frame_time() - self._resized_at < RESIZE_SETTLE_TIME * 1e6:
+            return GLib.SOURCE_CONTINUE
+
+        # The size has settled; if the final size hasn't been laid out, do so now.
+        self._resize_tick_id = None
+        if self._content and (self.width, self.height) != self._layout_size:
+            self.make_dirty()
+        return GLib.SOURCE_REMOVE
 
     def do_get_preferred_width(self):
         """Return (recomputing if necessary) the preferred width for the container.
@@ -159,39 +264,44 @@ class TogaContainer(Gtk.Fixed):
         # print(self._content, f"Container layout {allocation.width}x{allocation.height} @ {allocation.x}x{allocation.y}")  # noqa: E501
 
         # The container will occupy the full space it has been allocated.
-        resized = (allocation.width, allocation.height) != (self.width, self.height)
         self.set_allocation(allocation)
 
         if self._content:
-            # This function may be called in response to irrelevant events like button clicks,
-            # so only refresh if we really need to.
-            if resized or self.needs_redraw:
-                # Re-evaluate the layout using the allocation size as the basis for geometry
-                # print("REFRESH LAYOUT", allocation.width, allocation.height)
-                self._content.interface.style.layout(self._content.interface, self)
-
-                # Ensure the minimum content size from the layout is retained
-                self.min_width = self._content.interface.layout.min_width
-                self.min_height = self._content.interface.layout.min_height
+            # This function may be called in response to irrelevant events like button
+            # clicks, so the layout is only recomputed if the size has changed, or if
+            # it hasn't been computed since the content changed.
+            self.recompute()
 
             # WARNING! This is the list of children of the *container*, not
             # the Toga widget. Toga maintains a tree of children; all nodes
             # in that tree are direct children of the container.
+            allocations = {}
             for widget in self.get_children():
                 if widget.get_visible():
                     # Set the size of the child widget to the computed layout size.
                     # print(f"  allocate child {widget.interface}: {widget.interface.layout}")
-                    widget_allocation = Gdk.Rectangle()
-                    widget_allocation.x = (
-                        widget.interface.layout.absolute_content_left + allocation.x
+                    layout = widget.interface.layout
+                    geometry = (
+                        layout.absolute_content_left + allocation.x,
+                        layout.absolute_content_top + allocation.y,
+                        layout.content_width,
+                        layout.content_height,
                     )
-                    widget_allocation.y = (
-                        widget.interface.layout.absolute_content_top + allocation.y
-                    )
-                    widget_allocation.width = widget.interface.layout.content_width
-                    widget_allocation.height = widget.interface.layout.content_height
+                    allocations[widget] = geometry
 
+                    # GTK requires every visible child to be allocated whenever the
+                    # container is, even if the geometry hasn't changed; otherwise
+                    # the child is left with a pending resize and isn't redrawn.
+                    widget_allocation = Gdk.Rectangle()
+                    (
+                        widget_allocation.x,
+                        widget_allocation.y,
+                        widget_allocation.width,
+                        widget_allocation.height,
+                    ) = geometry
                     widget.size_allocate(widget_allocation)
 
-        # The layout has been redrawn
-        self.needs_redraw = False
+                    if self._allocations.get(widget) != geometry:
+                        self.allocation_count += 1
+
+            self._allocations = allocations
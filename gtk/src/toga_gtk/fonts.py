@@ -12,7 +12,8 @@ from toga.fonts import (
     SYSTEM_DEFAULT_FONTS,
 )
 
-from .libs import FontConfig, Pango, PangoCairo, PangoFc
+from . import libs
+from .libs import FontConfig, Pango, PangoFc
 
 _FONT_CACHE = {}
 
@@ -28,7 +29,9 @@ class Font:
         )
         if Pango is None:  # pragma: no cover
             raise RuntimeError(import_error.format("Pango"))
-        if PangoCairo is None:  # pragma: no cover
+        # PangoCairo (and cairo) are imported when the first font is created, rather
+        # than when the backend is imported.
+        if libs.PangoCairo is None:  # pragma: no cover
             raise RuntimeError(import_error.format("PangoCairo"))
 
         try:
@@ -65,7 +68,7 @@ class Font:
                         # Ubuntu 22.04 includes the typelib file in gir1.2-pango-1.0,
                         # and it does require a cache_clear to make new fonts visible
                         # to the Canvas.
-                        PangoCairo.FontMap.get_default().cache_clear()
+                        libs.PangoCairo.FontMap.get_default().cache_clear()
                 else:
                     raise ValueError(f"Font file {font_path} could not be found")
 
@@ -5,6 +5,32 @@ import toga
 
 from .libs import GdkPixbuf, GLib
 
+# Decoded icons, shared between all icons, keyed by (path, modification time, size),
+# and the maximum number of decoded icons that will be retained.
+_PIXBUFS = {}
+MAX_PIXBUFS = 256
+
+
+def _load_pixbuf(path, mtime, size):
+    key = (str(path), mtime, size)
+    try:
+        return _PIXBUFS[key]
+    except KeyError:
+        try:
+            native = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                str(path), size, size, False
+            )
+        except GLib.GError as exc:
+            # The header of the file was valid when the icon was created, but the
+            # image can't be decoded, or the file is no longer readable.
+            raise ValueError(f"Unable to load icon from {path}") from exc
+
+        if len(_PIXBUFS) >= MAX_PIXBUFS:
+            # Discard the oldest icon.
+            del _PIXBUFS[next(iter(_PIXBUFS))]
+        _PIXBUFS[key] = native
+        return native
+
 
 class Icon:
     EXTENSIONS = [".png", ".ico", ".icns"]
@@ -35,25 +61,29 @@ class Icon:
         if not path:
             raise FileNotFoundError("No icon variants found")
 
-        # Preload all the required icon sizes
-        try:
-            for size, path in self.paths.items():
-                native = GdkPixbuf.Pixbuf.new_from_file(str(path)).scale_simple(
-                    size, size, GdkPixbuf.InterpType.BILINEAR
-                )
-                self._native[size] = native
-        except GLib.GError:
-            raise ValueError(f"Unable to load icon from {path}")
+        # Icons are only decoded when a size is requested; but make sure that every
+        # file can be loaded, so that a bad file is reported when the icon is created.
+        # The modification time of each file is recorded, so that decoded icons can
+        # be shared with other icons that use the same version of the file.
+        self._mtimes = {}
+        for path in set(self.paths.values()):
+            info = GdkPixbuf.Pixbuf.get_file_info(str(path))
+            if info is None or info[0] is None:
+                raise ValueError(f"Unable to load icon from {path}")
+            self._mtimes[path] = Path(path).stat().st_mtime_ns
 
     def native(self, size):
         try:
             return self._native[size]
         except KeyError:
-            # self._native will have at least one entry, and it will have been populated
-            # in reverse size order, so the first value returned will be the largest
-            # size discovered.
-            native = self._native[next(iter(self._native))].scale_simple(
-                size, size, GdkPixbuf.InterpType.BILINEAR
-            )
+            try:
+                path = self.paths[size]
+            except KeyError:
+                # Use the smallest variant that is at least as big as the requested
+                # size; or if there isn't one, the largest variant.
+                larger = [variant for variant in self.paths if variant >= size]
+                path = self.paths[min(larger) if larger else max(self.paths)]
+
+            native = _load_pixbuf(path, self._mtimes[path], size)
             self._native[size] = native
             return native
@@ -1,4 +1,10 @@
+from . import gtk as _gtk
 from .fontconfig import FontConfig  # noqa: F401, F403
 from .gtk import *  # noqa: F401, F403
 from .styles import *  # noqa: F401, F403
 from .utils import *  # noqa: F401, F403
+
+
+def __getattr__(name):
+    # Libraries that are imported on first use.
+    return getattr(_gtk, name)
@@ -24,42 +24,82 @@ IS_WAYLAND = not isinstance(Gdk.Display.get_default(), GdkX11.X11Display)
 # The following imports will fail if the underlying libraries or their API
 # wrappers aren't installed; handle failure gracefully (see
 # https://github.com/beeware/toga/issues/26)
-try:
-    try:
-        gi.require_version("WebKit2", "4.1")
-    except ValueError:  # pragma: no cover
-        gi.require_version("WebKit2", "4.0")
-    from gi.repository import WebKit2  # noqa: F401
-except (ImportError, ValueError):  # pragma: no cover
-    WebKit2 = None
-
 try:
     gi.require_version("Pango", "1.0")
     from gi.repository import Pango  # noqa: F401
 except (ImportError, ValueError):  # pragma: no cover
     Pango = None
 
-try:
-    import cairo  # noqa: F401
-
-    gi.require_foreign("cairo")
-except ImportError:  # pragma: no cover
-    cairo = None
-
-try:
-    gi.require_version("PangoCairo", "1.0")
-    from gi.repository import PangoCairo  # noqa: F401
-except (ImportError, ValueError):  # pragma: no cover
-    PangoCairo = None
-
 try:
     gi.require_version("PangoFc", "1.0")
     from gi.repository import PangoFc  # noqa: F401
 except (ImportError, ValueError):  # pragma: no cover
     PangoFc = None
 
-try:
-    gi.require_version("XApp", "1.0")
-    from gi.repository import XApp  # noqa: F401
-except (ImportError, ValueError):  # pragma: no cover
-    XApp = None
+
+# Libraries that are only needed by some widgets and features are imported when
+# they are first used, rather than when the backend is imported. As with the
+# imports above, a library that can't be imported is None.
+def _import_webkit2():
+    try:
+        try:
+            gi.require_version("WebKit2", "4.1")
+        except ValueError:  # pragma: no cover
+            gi.require_version("WebKit2", "4.0")
+        from gi.repository import WebKit2
+
+        return WebKit2
+    except (ImportError, ValueError):  # pragma: no cover
+        return None
+
+
+def _import_cairo():
+    try:
+        import cairo
+
+        gi.require_foreign("cairo")
+        return cairo
+    except ImportError:  # pragma: no cover
+        return None
+
+
+def _import_pangocairo():
+    # PangoCairo's API uses cairo types, so the cairo foreign struct support must be
+    # registered before it is imported.
+    _import_cairo()
+    try:
+        gi.require_version("PangoCairo", "1.0")
+        from gi.repository import PangoCairo
+
+        return PangoCairo
+    except (ImportError, ValueError):  # pragma: no cover
+        return None
+
+
+def _import_xapp():
+    try:
+        gi.require_version("XApp", "1.0")
+        from gi.repository import XApp
+
+        return XApp
+    except (ImportError, ValueError):  # pragma: no cover
+        return None
+
+
+_lazy_imports = {
+    "WebKit2": _import_webkit2,
+    "cairo": _import_cairo,
+    "PangoCairo": _import_pangocairo,
+    "XApp": _import_xapp,
+}
+
+
+def __getattr__(name):
+    try:
+        importer = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    else:
+        value = importer()
+        globals()[name] = value
+        return value
@@ -1,6 +1,10 @@
+import itertools
+
 from toga.colors import TRANSPARENT
 from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE
 
+from .gtk import Gdk, GLib, Gtk
+
 TOGA_DEFAULT_STYLES = b"""
 .toga-detailed-list-floating-buttons {
     min-width: 24px;
@@ -50,3 +54,121 @@ def get_font_css(value):
         style["font-size"] = f"{value.size}pt"
 
     return style
+
+
+class _CssClass:
+    def __init__(self, key, name):
+        """A CSS class that applies a style declaration.
+
+        :param key: The nodes and style declaration that the class applies.
+        :param name: The name of the class.
+        """
+        self.key = key
+        self.name = name
+        selectors = [f".toga.{name}"] + [f".toga.{name} {node}" for node in key[0]]
+        # The rule that defines the class in the app's stylesheet.
+        self.rule = f"{', '.join(selectors)} {{{key[1]}}}"
+        # The number of times the class has been obtained, but not released.
+        self.users = 0
+
+
+# The CSS classes that are defined, indexed by their nodes and declaration, and by
+# name, and the classes that are defined but unused, oldest first. Unused classes are
+# retained so that a style that changes back and forth doesn't need to be parsed
+# again, up to a maximum number of classes.
+_css_classes = {}
+_css_class_names = {}
+_unused_css_classes = {}
+MAX_UNUSED_CSS_CLASSES = 100
+_css_class_ids = itertools.count()
+
+# The provider that defines every CSS class for the whole app, and whether its
+# stylesheet is missing any of the classes that are defined. Every change to the
+# stylesheet restyles every widget on the screen, so new classes are added to the
+# stylesheet in batches.
+_css_provider = None
+_css_stylesheet_stale = False
+
+
+def update_css_stylesheet():
+    """Load any CSS classes that have been defined since the app's stylesheet was
+    last loaded.
+
+    This is invoked when the event loop is next idle after a class has been defined,
+    but can be invoked sooner (e.g., before widgets are measured) to make sure that
+    every class is in effect.
+    """
+    global _css_stylesheet_stale
+
+    if _css_stylesheet_stale:
+        _css_stylesheet_stale = False
+        # Classes that have been discarded since the stylesheet was last loaded are
+        # also removed from the stylesheet.
+        _css_provider.load_from_data(
+            "\n".join(css_class.rule for css_class in _css_classes.values()).encode()
+        )
+
+    # Don't invoke this again from the idle handler.
+    return GLib.SOURCE_REMOVE
+
+
+def get_css_class(css, nodes=()):
+    """Obtain a CSS class that applies a style declaration.
+
+    Each distinct declaration is defined once, in a stylesheet for the whole app;
+    applying a style to a widget only requires adding the class to the widget's style
+    context. A class that is new will be in effect once the stylesheet has been
+    updated (see :func:`update_css_stylesheet`). When the class is no longer applied
+    to the widget, it should be released with :func:`release_css_class`.
+
+    :param css: A dictionary of string key-value pairs, describing the CSS.
+    :param nodes: The names of the CSS nodes inside the widget that the style should
+        also be applied to (e.g., ``text``).
+    :returns: The name of the CSS class.
+    """
+    global _css_provider, _css_stylesheet_stale
+
+    key = (tuple(nodes), " ".join(f"{key}: {value};" for key, value in css.items()))
+    try:
+        css_class = _css_classes[key]
+    except KeyError:
+        css_class = _css_classes[key] = _CssClass(
+            key, f"toga-css-{next(_css_class_ids)}"
+        )
+        _css_class_names[css_class.name] = css_class
+
+        if _css_provider is None:
+            _css_provider = Gtk.CssProvider()
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                _css_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+            )
+
+        if not _css_stylesheet_stale:
+            _css_stylesheet_stale = True
+            GLib.idle_add(update_css_stylesheet)
+    else:
+        _unused_css_classes.pop(css_class.name, None)
+
+    css_class.users += 1
+    return css_class.name
+
+
+def release_css_class(name):
+    """Release a CSS class that was obtained with :func:`get_css_class`.
+
+    :param name: The name of the CSS class.
+    """
+    css_class = _css_class_names[name]
+    css_class.users -= 1
+    if css_class.users:
+        return
+
+    _unused_css_classes[name] = css_class
+    if len(_unused_css_classes) > MAX_UNUSED_CSS_CLASSES:
+        # The class isn't used by any widget, so it can remain in the stylesheet
+        # until the stylesheet is next updated.
+        oldest = _unused_css_classes.pop(next(iter(_unused_css_classes)))
+        del _css_classes[oldest.key]
+        del _css_class_names[oldest.name]
@@ -1,8 +1,25 @@
+import weakref
 from abc import abstractmethod
 
 from travertino.size import at_least
 
-from ..libs import Gtk, get_background_color_css, get_color_css, get_font_css
+from ..libs import (
+    get_background_color_css,
+    get_color_css,
+    get_css_class,
+    get_font_css,
+    release_css_class,
+)
+
+# The preferred sizes of native widgets, shared between widgets with the same
+# measurement key, and the maximum number of sizes that will be retained.
+_MEASUREMENTS = {}
+MAX_MEASUREMENTS = 1000
+
+
+def _release_css_classes(style_classes):
+    for css_class in style_classes.values():
+        release_css_class(css_class)
 
 
 class Widget:
@@ -12,12 +29,19 @@ class Widget:
         self.interface._impl = self
         self._container = None
         self.native = None
-        self.style_providers = {}
+        self.style_classes = {}
+        # The CSS classes used by the widget are released when it is deleted.
+        weakref.finalize(self, _release_css_classes, self.style_classes).atexit = False
+        # The measurement key and preferred size from the last rehint, and whether
+        # GTK has restyled the native widget since it was last measured.
+        self._measured = None
+        self._restyled = True
         self.create()
 
         # Ensure the native widget has links to the interface and impl
         self.native.interface = self.interface
         self.native._impl = self
+        self.native.connect("style-updated", self.gtk_style_updated)
 
         # Ensure the native widget has GTK CSS style attributes; create() should
         # ensure any other widgets are also styled appropriately.
@@ -88,16 +112,15 @@ class Widget:
     # CSS tools
     ######################################################################
 
-    def apply_css(self, property, css, native=None, selector=".toga"):
+    def apply_css(self, property, css, native=None, nodes=()):
         """Apply a CSS style controlling a specific property type.
 
-        GTK controls appearance with CSS; each GTK widget can have an
-        independent style sheet, composed out of multiple providers.
-
-        Toga uses a separate provider for each property that needs to be
+        GTK controls appearance with CSS. Toga defines a CSS class for each
+        distinct style declaration, using a provider for the whole app; each GTK
+        widget uses a separate class for each property that needs to be
         controlled (e.g., color, font, ...). When that property is modified, the
-        old provider for that property is removed; if new CSS has been provided,
-        a new provider is constructed and added to the widget.
+        old class for that property is removed from the widget and released; if
+        new CSS has been provided, the class for that CSS is added.
 
         It is assumed that every Toga widget will have the class ``toga``.
 
@@ -107,35 +130,31 @@ class Widget:
             property will be reset
         :param native: The native widget to which the style should be applied.
             Defaults to ``self.native``.
-        :param selector: The CSS selector used to target the style. Defaults to
-            ``.toga``.
+        :param nodes: The names of the CSS nodes inside the native widget that the
+            style should also be applied to (e.g., ``text``).
         """
         if native is None:
             native = self.native
 
+        css_class = None if css is None else get_css_class(css, nodes)
+        old_class = self.style_classes.get((property, id(native)))
+        if css_class == old_class:
+            if css_class:
+                # The widget is already using the class.
+                release_css_class(css_class)
+            return
+
+        # If there was a previous class for the given property, remove it from
+        # the GTK widget, and add the new class.
         style_context = native.get_style_context()
-        style_provider = self.style_providers.pop((property, id(native)), None)
-
-        # If there was a previous style provider for the given property, remove
-        # it from the GTK widget
-        if style_provider:
-            style_context.remove_provider(style_provider)
-
-        # If there's new CSS to apply, construct a new provider, and install it.
-        if css is not None:
-            # Create a new CSS StyleProvider
-            style_provider = Gtk.CssProvider()
-            styles = " ".join(f"{key}: {value};" for key, value in css.items())
-            declaration = selector + " {" + styles + "}"
-            style_provider.load_from_data(declaration.encode())
-
-            # Add the provider to the widget
-            style_context.add_provider(
-                style_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-            # Store the provider so it can be removed later
-            self.style_providers[(property, id(native))] = style_provider
+        if old_class:
+            style_context.remove_class(old_class)
+            del self.style_classes[(property, id(native))]
+            release_css_class(old_class)
+
+        if css_class:
+            style_context.add_class(css_class)
+            self.style_classes[(property, id(native))] = css_class
 
     ######################################################################
     # APPLICATOR
@@ -183,11 +202,83 @@ class Widget:
         if self.container:
             self.container.make_dirty(self)
 
+    def measurement_key(self):
+        """The inputs that determine the preferred size of the native widget.
+
+        Widgets whose size only depends on their content and font can return a
+        hashable key (e.g., the widget type, its text, and the CSS classes that
+        affect its font); their measurements will be cached, and shared with any
+        widget that has the same key. By default, widgets aren't cached.
+
+        :returns: A hashable key, or ``None`` if the size can't be cached.
+        """
+        return None
+
+    def font_css_classes(self):
+        """The CSS classes that control the fonts of the widget."""
+        return tuple(
+            css_class
+            for (property, _), css_class in sorted(self.style_classes.items())
+            if property == "font"
+        )
+
+    def gtk_style_updated(self, widget):
+        # A change of theme, system font, scale factor or CSS will be followed by a
+        # resize of the native widget, which must be measured again.
+        self._restyled = True
+
+    def preferred_size(self):
+        """The preferred width and height of the native widget.
+
+        If the widget has a :meth:`measurement_key`, the native widget will only be
+        measured if no widget with the same key has been measured for the same scale
+        factor, system font and theme, or if GTK has restyled the widget since it was
+        last measured.
+
+        :returns: A tuple of the (minimum, natural) widths, and the (minimum, natural)
+            heights.
+        """
+        key = self.measurement_key()
+        if key is None:
+            return self.native.get_preferred_width(), self.native.get_preferred_height()
+
+        settings = self.native.get_settings()
+        key = (
+            key,
+            self.native.get_scale_factor(),
+            settings.props.gtk_font_name,
+            settings.props.gtk_theme_name,
+            settings.props.gtk_application_prefer_dark_theme,
+        )
+
+        if self._restyled:
+            # GTK will resize the widget, so any cached size may be stale.
+            self._restyled = False
+            _MEASUREMENTS.pop(key, None)
+        elif self._measured is not None and self._measured[0] == key:
+            # If nothing has changed since the last measurement, there's nothing
+            # to do.
+            return self._measured[1]
+
+        try:
+            size = _MEASUREMENTS[key]
+        except KeyError:
+            size = (
+                tuple(self.native.get_preferred_width()),
+                tuple(self.native.get_preferred_height()),
+            )
+            if len(_MEASUREMENTS) >= MAX_MEASUREMENTS:
+                # Discard the oldest measurement.
+                del _MEASUREMENTS[next(iter(_MEASUREMENTS))]
+            _MEASUREMENTS[key] = size
+
+        self._measured = (key, size)
+        return size
+
     def rehint(self):
         # Perform the actual GTK rehint.
         # print("REHINT", self, self.native.get_preferred_width(), self.native.get_preferred_height())
-        width = self.native.get_preferred_width()
-        height = self.native.get_preferred_height()
+        width, height = self.preferred_size()
 
         self.interface.intrinsic.width = at_least(width[0])
         self.interface.intrinsic.height = at_least(height[0])
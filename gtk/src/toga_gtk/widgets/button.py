@@ -40,10 +40,15 @@ class Button(Widget):
             color = None
         super().set_background_color(color)
 
+    def measurement_key(self):
+        # An icon changes the size of the button; its image isn't cached.
+        if self._icon:
+            return None
+        return (type(self), self.native.get_label(), self.font_css_classes())
+
     def rehint(self):
         # print("REHINT", self, self.native.get_preferred_width(), self.native.get_preferred_height())
-        width = self.native.get_preferred_width()
-        height = self.native.get_preferred_height()
+        width, height = self.preferred_size()
 
         self.interface.intrinsic.width = at_least(width[0])
         self.interface.intrinsic.height = height[1]
@@ -125,6 +125,7 @@ class DetailedList(Widget):
 
         self.native_vadj = scrolled_window.get_vadjustment()
         self.native_vadj.connect("value-changed", self.gtk_on_value_changed)
+        self.native_vadj.connect("changed", self.gtk_on_visible_rows_changed)
 
         # Define a revealer widget that can be used to show/hide with a crossfade.
         self.native_revealer = Gtk.Revealer()
@@ -281,6 +282,19 @@ class DetailedList(Widget):
         # Update the refresh button; hide the buttons on the active row (if they're active)
         self.update_refresh_button()
         self.hide_actions()
+        self.gtk_on_visible_rows_changed(adj)
+
+    def gtk_on_visible_rows_changed(self, adj):
+        # Find the row at the bottom of the visible area. If the rows don't fill the
+        # visible area, the last row is visible.
+        item_impl = self.native_detailedlist.get_row_at_y(
+            int(adj.get_value() + adj.get_page_size()) - 1
+        )
+        if item_impl is None:
+            last_row = len(self.store) - 1
+        else:
+            last_row = item_impl.get_index()
+        self.interface._visible_rows_changed(last_row)
 
     def gtk_on_refresh_clicked(self, widget):
         self.interface.on_refresh()
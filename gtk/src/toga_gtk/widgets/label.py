@@ -23,13 +23,15 @@ class Label(Widget):
     def set_text(self, value):
         self.native.set_text(value)
 
+    def measurement_key(self):
+        return (type(self), self.native.get_text(), self.font_css_classes())
+
     def rehint(self):
         # print("REHINT", self,
         #     self.native.get_preferred_width(), self.native.get_preferred_height(),
         #     getattr(self, '_fixed_height', False), getattr(self, '_fixed_width', False)
         # )
-        width = self.native.get_preferred_width()
-        height = self.native.get_preferred_height()
+        width, height = self.preferred_size()
 
         self.interface.intrinsic.width = at_least(width[0])
         self.interface.intrinsic.height = height[1]
@@ -19,6 +19,10 @@ class MultilineTextInput(Widget):
 
         self.buffer = Gtk.TextBuffer()
         self.buffer.connect("changed", self.gtk_on_changed)
+        # A mark that stays at the end of the buffer as text is appended.
+        self.end_mark = self.buffer.create_mark(
+            "end", self.buffer.get_end_iter(), False
+        )
 
         # The GTK TextView doesn't have an implementation of placeholder. We
         # fake it by using a different buffer that contains placeholder text.
@@ -49,7 +53,7 @@ class MultilineTextInput(Widget):
             "color",
             get_color_css(color),
             native=self.native_textview,
-            selector=".toga, .toga text",
+            nodes=["text"],
         )
 
     def set_background_color(self, color):
@@ -57,7 +61,7 @@ class MultilineTextInput(Widget):
             "background_color",
             get_background_color_css(color),
             native=self.native_textview,
-            selector=".toga, .toga text",
+            nodes=["text"],
         )
 
     def set_font(self, font):
@@ -87,6 +91,26 @@ class MultilineTextInput(Widget):
             else:
                 self.native_textview.set_buffer(self.buffer)
 
+    def append(self, value):
+        # Only follow the new text if the view is already scrolled to the bottom.
+        vadjustment = self.native.get_vadjustment()
+        at_bottom = (
+            vadjustment.get_value() + vadjustment.get_page_size()
+            >= vadjustment.get_upper() - 1
+        )
+
+        self.buffer.insert(self.buffer.get_end_iter(), value)
+        if self.buffer.get_char_count():
+            self.native_textview.set_buffer(self.buffer)
+
+        if at_bottom:
+            self.native_textview.scroll_to_mark(self.end_mark, 0.0, False, 0.0, 0.0)
+
+    def remove_lines(self, count):
+        self.buffer.delete(
+            self.buffer.get_start_iter(), self.buffer.get_iter_at_line(count)
+        )
+
     def get_readonly(self):
         return not self.native_textview.get_property("editable")
 
@@ -126,8 +150,9 @@ class MultilineTextInput(Widget):
         # signal. To ensure that we also get a signal when the value is
         # deliberately cleared, we add an explicit signal handler to set_value()
         # for the empty value case.
-        if self.get_value():
-            self.interface.on_change()
+        # Checking the character count avoids copying the contents of the buffer.
+        if self.buffer.get_char_count():
+            self.interface._value_changed()
 
     def gtk_on_focus_in(self, *args):
         # When focus is gained, make sure the content buffer is active.
@@ -23,7 +23,7 @@ class ScrollContainer(Widget):
         self.native.add(self.document_container)
 
     def gtk_on_changed(self, *args):
-        self.interface.on_scroll()
+        self.interface._scrolled()
 
     def set_content(self, widget):
         self.document_container.content = widget
@@ -37,6 +37,10 @@ class ScrollContainer(Widget):
     def set_window(self, window):
         self.interface.content.window = window
 
+    def set_bounds(self, x, y, width, height):
+        super().set_bounds(x, y, width, height)
+        self.interface._resized()
+
     def rehint(self):
         self.interface.intrinsic.width = at_least(self.interface._MIN_WIDTH)
         self.interface.intrinsic.height = at_least(self.interface._MIN_HEIGHT)
@@ -56,7 +60,7 @@ class ScrollContainer(Widget):
         # Disabling scrolling implies a position reset; that's a scroll event.
         if not value:
             self.native.get_hadjustment().set_value(0)
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def get_vertical(self):
         return self.native.get_policy()[1] == Gtk.PolicyType.AUTOMATIC
@@ -73,7 +77,7 @@ class ScrollContainer(Widget):
         # Disabling scrolling implies a position reset; that's a scroll event.
         if not value:
             self.native.get_vadjustment().set_value(0)
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def get_max_vertical_position(self):
         return max(
@@ -102,4 +106,4 @@ class ScrollContainer(Widget):
     def set_position(self, horizontal_position, vertical_position):
         self.native.get_hadjustment().set_value(horizontal_position)
         self.native.get_vadjustment().set_value(vertical_position)
-        self.interface.on_scroll()
+        self.interface._scrolled()
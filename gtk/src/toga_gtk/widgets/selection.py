@@ -32,14 +32,14 @@ class Selection(Widget):
     #     self.apply_css(
     #         "color",
     #         get_color_css(color),
-    #         selector=".toga, .toga button",
+    #         nodes=["button"],
     #     )
 
     # def set_background_color(self, color):
     #     self.apply_css(
     #         "background_color",
     #         get_background_color_css(color),
-    #         selector=".toga, .toga button",
+    #         nodes=["button"],
     #     )
 
     def change(self, item):
@@ -63,6 +63,10 @@ class Table(Widget):
         self.native.set_min_content_width(200)
         self.native.set_min_content_height(200)
 
+        vadjustment = self.native.get_vadjustment()
+        vadjustment.connect("value-changed", self.gtk_on_visible_rows_changed)
+        vadjustment.connect("changed", self.gtk_on_visible_rows_changed)
+
     def _create_columns(self):
         if self.interface.headings:
             headings = self.interface.headings
@@ -95,6 +99,15 @@ class Table(Widget):
     def gtk_on_select(self, selection):
         self.interface.on_select()
 
+    def gtk_on_visible_rows_changed(self, adjustment):
+        visible_range = self.native_table.get_visible_range()
+        if visible_range is None:
+            # There are no rows to display.
+            last_row = len(self.interface.data) - 1
+        else:
+            last_row = visible_range[1].get_indices()[0]
+        self.interface._visible_rows_changed(last_row)
+
     def change_source(self, source):
         # Temporarily disconnecting the TreeStore improves performance for large
         # updates by deferring row rendering until the update is complete.
@@ -1,6 +1,6 @@
 import pytest
 
-from toga_gtk.libs import Gtk
+from toga_gtk.libs import Gtk, styles
 
 from .base import SimpleProbe
 from .properties import toga_alignment_from_justification, toga_color
@@ -44,18 +44,18 @@ class MultilineTextInputProbe(SimpleProbe):
         # on the child ``text`` node, but Gtk doesn't expose that style
         # as something that can be inspected. As a workaround, we check
         # that the style property has been set on the base widget, and
-        # that there is a CSS style provider targeting both the base node
+        # that the CSS class applied to the widget targets both the base node
         # and the ``text`` child node
         try:
-            css_provider = self.impl.style_providers[
-                ("color", id(self.native_textview))
-            ]
+            css_class = self.impl.style_classes[("color", id(self.native_textview))]
         except KeyError:
-            # No style provider exists yet, so defaults will be in effect
+            # No style class has been applied yet, so defaults will be in effect
             pass
         else:
-            assert ".toga {\n" in css_provider.to_string()
-            assert ".toga text {\n" in css_provider.to_string()
+            styles.update_css_stylesheet()
+            css = styles._css_provider.to_string()
+            assert f".toga.{css_class} {{\n" in css
+            assert f".toga.{css_class} text {{\n" in css
 
         sc = self.native_textview.get_style_context()
         return toga_color(sc.get_property("color", sc.get_state()))
@@ -66,18 +66,20 @@ class MultilineTextInputProbe(SimpleProbe):
         # on the child ``text`` node, but Gtk doesn't expose that style
         # as something that can be inspected. As a workaround, we check
         # that the style property has been set on the base widget, and
-        # that there is a CSS style provider targeting both the base node
+        # that the CSS class applied to the widget targets both the base node
         # and the ``text`` child node
         try:
-            css_provider = self.impl.style_providers[
+            css_class = self.impl.style_classes[
                 ("background_color", id(self.native_textview))
             ]
         except KeyError:
-            # No style provider exists yet, so defaults will be in effect
+            # No style class has been applied yet, so defaults will be in effect
             pass
         else:
-            assert ".toga {\n" in css_provider.to_string()
-            assert ".toga text {\n" in css_provider.to_string()
+            styles.update_css_stylesheet()
+            css = styles._css_provider.to_string()
+            assert f".toga.{css_class} {{\n" in css
+            assert f".toga.{css_class} text {{\n" in css
 
         sc = self.native_textview.get_style_context()
         return toga_color(sc.get_property("background-color", sc.get_state()))
@@ -1,3 +1,7 @@
 import toga
 
-__version__ = toga._package_version(__file__, __name__)
+
+def __getattr__(name):
+    if name == "__version__":
+        return toga._version(__file__, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -47,6 +47,9 @@ class BaseContainer:
         if widget:
             widget.container = self
 
+    def refreshing(self):
+        pass
+
     def refreshed(self):
         self.on_refresh(self)
 
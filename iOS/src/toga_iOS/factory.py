@@ -1,3 +1,5 @@
+import importlib
+
 from toga import NotImplementedWarning
 
 from . import dialogs
@@ -5,48 +7,54 @@ from .app import App
 from .colors import native_color
 from .command import Command
 from .fonts import Font
-from .hardware.camera import Camera
-from .hardware.location import Location
 from .icons import Icon
 from .images import Image
 from .paths import Paths
-from .statusicons import MenuStatusIcon, SimpleStatusIcon, StatusIconSet
-
-# Widgets
-from .widgets.activityindicator import ActivityIndicator
-from .widgets.box import Box
-from .widgets.button import Button
-from .widgets.canvas import Canvas
-from .widgets.detailedlist import DetailedList
-from .widgets.divider import Divider
-from .widgets.imageview import ImageView
-from .widgets.label import Label
-from .widgets.mapview import MapView
-from .widgets.multilinetextinput import MultilineTextInput
-from .widgets.numberinput import NumberInput
-from .widgets.optioncontainer import OptionContainer
-from .widgets.passwordinput import PasswordInput
-from .widgets.progressbar import ProgressBar
-from .widgets.scrollcontainer import ScrollContainer
-from .widgets.selection import Selection
-from .widgets.slider import Slider
-
-# from .widgets.splitcontainer import SplitContainer
-from .widgets.switch import Switch
-
-# from .widgets.table import Table
-from .widgets.textinput import TextInput
-
-# from .widgets.tree import Tree
-from .widgets.webview import WebView
 from .window import MainWindow, Window
 
+# Implementations that an app may not use are imported when they are first used,
+# so that an app only imports the implementations (and native libraries) it needs.
+toga_iOS_imports = {
+    # Hardware
+    "Camera": ".hardware.camera",
+    "Location": ".hardware.location",
+    # Status icons
+    "MenuStatusIcon": ".statusicons",
+    "SimpleStatusIcon": ".statusicons",
+    "StatusIconSet": ".statusicons",
+    # Widgets
+    "ActivityIndicator": ".widgets.activityindicator",
+    "Box": ".widgets.box",
+    "Button": ".widgets.button",
+    "Canvas": ".widgets.canvas",
+    "DetailedList": ".widgets.detailedlist",
+    "Divider": ".widgets.divider",
+    "ImageView": ".widgets.imageview",
+    "Label": ".widgets.label",
+    "MapView": ".widgets.mapview",
+    "MultilineTextInput": ".widgets.multilinetextinput",
+    "NumberInput": ".widgets.numberinput",
+    "OptionContainer": ".widgets.optioncontainer",
+    "PasswordInput": ".widgets.passwordinput",
+    "ProgressBar": ".widgets.progressbar",
+    "ScrollContainer": ".widgets.scrollcontainer",
+    "Selection": ".widgets.selection",
+    "Slider": ".widgets.slider",
+    # "SplitContainer": ".widgets.splitcontainer",
+    "Switch": ".widgets.switch",
+    # "Table": ".widgets.table",
+    "TextInput": ".widgets.textinput",
+    # "Tree": ".widgets.tree",
+    "WebView": ".widgets.webview",
+}
+
 
 def not_implemented(feature):
     NotImplementedWarning.warn("iOS", feature)
 
 
-__all__ = [
+# Names that are imported on first use are included.
+__all__ = [  # noqa: F822
     "not_implemented",
     "ActivityIndicator",
     "App",
@@ -94,5 +102,15 @@ __all__ = [
 ]
 
 
-def __getattr__(name):  # pragma: no cover
-    raise NotImplementedError(f"Toga's iOS backend doesn't implement {name}")
+def __getattr__(name):
+    try:
+        module_name = toga_iOS_imports[name]
+    except KeyError:  # pragma: no cover
+        raise NotImplementedError(
+            f"Toga's iOS backend doesn't implement {name}"
+        ) from None
+    else:
+        module = importlib.import_module(module_name, __package__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
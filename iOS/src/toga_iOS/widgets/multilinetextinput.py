@@ -51,7 +51,7 @@ class TogaMultilineTextView(UITextView, protocols=[UIKeyInput]):
 
     @objc_method
     def textViewDidChange_(self, text_view):
-        self.interface.on_change()
+        self.interface._value_changed()
 
 
 class MultilineTextInput(Widget):
@@ -136,6 +136,31 @@ class MultilineTextInput(Widget):
         self.placeholder_label.setHidden(self.has_focus or len(self.native.text) > 0)
         self.interface.on_change()
 
+    def append(self, value):
+        # Only follow the new text if the view is already scrolled to the bottom.
+        at_bottom = (
+            self.native.contentOffset.y + self.native.bounds.size.height
+            >= self.native.contentSize.height - 1
+        )
+
+        self.native.textStorage.replaceCharactersInRange(
+            NSRange(self.native.textStorage.length, 0), withString=value
+        )
+        self.placeholder_label.setHidden(self.has_focus or len(self.native.text) > 0)
+        self.interface.on_change()
+
+        if at_bottom:
+            self.scroll_to_bottom()
+
+    def remove_lines(self, count):
+        value = self.get_value()
+        removed = value[: len(value) - len(value.split("\n", count)[-1])]
+        # Ranges are measured in UTF-16 code units.
+        self.native.textStorage.replaceCharactersInRange(
+            NSRange(0, len(removed.encode("utf-16-le")) // 2), withString=""
+        )
+        self.interface.on_change()
+
     def set_color(self, value):
         color = native_color(value)
         self.native.textColor = color
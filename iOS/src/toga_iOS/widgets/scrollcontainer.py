@@ -12,7 +12,7 @@ class TogaScrollView(UIScrollView):
 
     @objc_method
     def scrollViewDidScroll_(self, scrollView) -> None:
-        self.interface.on_scroll()
+        self.interface._scrolled()
 
     @objc_method
     def refreshContent(self):
@@ -55,6 +55,7 @@ class ScrollContainer(Widget):
         self.native.performSelector(
             SEL("refreshContent"), withObject=None, afterDelay=0
         )
+        self.interface._resized()
 
     def content_refreshed(self, container):
         width = self.native.frame.size.width
@@ -87,7 +88,7 @@ class ScrollContainer(Widget):
 
         # Disabling scrolling implies a position reset; that's a scroll event.
         if not value:
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def get_horizontal(self):
         return self._allow_horizontal
@@ -101,7 +102,7 @@ class ScrollContainer(Widget):
 
         # Disabling scrolling implies a position reset; that's a scroll event.
         if not value:
-            self.interface.on_scroll()
+            self.interface._scrolled()
 
     def get_horizontal_position(self):
         if not self.get_horizontal():
@@ -132,7 +133,7 @@ class ScrollContainer(Widget):
         ):
             # iOS doesn't generate a scroll event unless the position actually changes.
             # Treat all scroll position assignments as a change.
-            self.interface.on_scroll()
+            self.interface._scrolled()
         else:
             self.native.setContentOffset(
                 NSMakePoint(horizontal_position, vertical_position), animated=True
@@ -594,6 +594,36 @@ else:
                 second_window.position[1] - screen.origin[1],
             )
 
+    @pytest.mark.parametrize(
+        "second_window_class, second_window_kwargs",
+        [(toga.Window, dict(title="Secondary Window", size=(400, 300)))],
+    )
+    async def test_single_layout_per_frame(second_window, second_window_probe):
+        """A change to the content is laid out once, and only the widgets whose
+        geometry has changed are allocated a new geometry."""
+        if toga.platform.current_platform != "linux":
+            pytest.xfail("This test is GTK backend specific")
+
+        label = toga.Label("Hello")
+        second_window.content = toga.Box(
+            style=Pack(direction=COLUMN),
+            children=[toga.Label("Unchanged"), label],
+        )
+        await second_window_probe.wait_for_window("Content has been assigned")
+
+        container = second_window._impl.container
+        layout_count = container.layout_count
+        allocation_count = container.allocation_count
+
+        label.text = "Hello, world"
+        await second_window_probe.wait_for_window("Label text has changed")
+
+        # The label is rehinted before the interface lays out the change, so the
+        # container doesn't need to lay it out again.
+        assert container.layout_count - layout_count == 1
+        # Only the label's geometry has changed.
+        assert container.allocation_count - allocation_count == 1
+
 
 async def test_as_image(main_window, main_window_probe):
     """The window can be captured as a screenshot"""
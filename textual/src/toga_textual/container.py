@@ -29,6 +29,9 @@ class Container(Scalable):
         # Subtract 1 to remove the height of the header
         return self.scale_out_vertical(self.native_parent.size[1] - 1)
 
+    def refreshing(self):
+        pass
+
     def refreshed(self):
         if self.on_refresh:
             self.on_refresh()
@@ -0,0 +1,196 @@
+import warnings
+
+from travertino.size import at_least
+
+import toga
+from textual.widgets import DataTable as TextualDataTable
+
+from .base import Widget
+
+
+def row_key(item):
+    # Textual row keys must be strings; the identity of the source row is a stable
+    # key for as long as the row is in the table.
+    return str(id(item))
+
+
+def cell_text(item, accessor, missing_value):
+    data = getattr(item, accessor, None)
+    if isinstance(data, toga.Widget):
+        warnings.warn("Textual does not support the use of widgets in cells")
+        text = None
+    elif isinstance(data, tuple):
+        # Icons aren't supported on Textual; only use the text.
+        text = data[1]
+    else:
+        text = data
+
+    if text is None:
+        return missing_value
+    return str(text)
+
+
+class TogaDataTable(TextualDataTable):
+    def __init__(self, impl):
+        super().__init__(cursor_type="row")
+        self.interface = impl.interface
+        self.impl = impl
+
+    def on_mount(self) -> None:
+        # Any updates received before the table was mounted can now be applied.
+        self.impl._flush()
+
+    def on_data_table_row_highlighted(
+        self, event: TextualDataTable.RowHighlighted
+    ) -> None:
+        self.interface.on_select()
+
+    def on_data_table_row_selected(self, event: TextualDataTable.RowSelected) -> None:
+        self.interface.on_activate(row=self.impl._rows[event.row_key.value])
+
+
+class Table(Widget):
+    def create(self):
+        self.native = TogaDataTable(self)
+
+        # A map of row key to the source row displayed with that key.
+        self._rows = {}
+
+        # Data source notifications are recorded, and applied in a single batch
+        # after the next screen refresh. DataTable only renders the rows that are
+        # visible, so the cost of an update is proportional to the size of the
+        # update, not the size of the data.
+        self._pending = []
+        self._changed = {}
+        self._rebuild = False
+        self._flush_scheduled = False
+
+    def _schedule_flush(self):
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            # If the table isn't mounted yet, the flush will occur on mount.
+            if self.native.is_attached:
+                self.native.call_after_refresh(self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        changed, self._changed = self._changed, {}
+
+        if not self._rebuild:
+            # DataTable can only append rows; an insertion anywhere else requires
+            # the rows to be reloaded in source order.
+            count = self.native.row_count
+            for notification, index, item in pending:
+                if notification == "insert":
+                    if index == count:
+                        self._add_row(item)
+                        count += 1
+                    else:
+                        self._rebuild = True
+                        break
+                elif notification == "remove":
+                    key = row_key(item)
+                    del self._rows[key]
+                    self.native.remove_row(key)
+                    count -= 1
+                else:  # clear
+                    self._rows = {}
+                    self.native.clear()
+                    count = 0
+
+        if self._rebuild:
+            self._rebuild = False
+            self._rows = {}
+            self.native.clear(columns=True)
+            if self.interface.headings:
+                headings = self.interface.headings
+                self.native.show_header = True
+            else:
+                headings = self.interface.accessors
+                self.native.show_header = False
+
+            for heading, accessor in zip(headings, self.interface.accessors):
+                self.native.add_column(heading, key=accessor)
+
+            for item in self.interface.data:
+                self._add_row(item)
+        else:
+            # Any row that was added in this batch already has current values.
+            for key, item in changed.items():
+                if key in self._rows:
+                    for accessor in self.interface.accessors:
+                        self.native.update_cell(
+                            key,
+                            accessor,
+                            cell_text(item, accessor, self.interface.missing_value),
+                        )
+
+    def _add_row(self, item):
+        key = row_key(item)
+        self._rows[key] = item
+        self.native.add_row(
+            *(
+                cell_text(item, accessor, self.interface.missing_value)
+                for accessor in self.interface.accessors
+            ),
+            key=key,
+        )
+
+    def change_source(self, source):
+        self._pending = []
+        self._changed = {}
+        self._rebuild = True
+        self._schedule_flush()
+
+    def insert(self, index, item):
+        self._pending.append(("insert", index, item))
+        self._schedule_flush()
+
+    def change(self, item):
+        self._changed[row_key(item)] = item
+        self._schedule_flush()
+
+    def remove(self, index, item):
+        self._changed.pop(row_key(item), None)
+        self._pending.append(("remove", index, item))
+        self._schedule_flush()
+
+    def clear(self):
+        self._changed = {}
+        self._pending.append(("clear", None, None))
+        self._schedule_flush()
+
+    def get_selection(self):
+        # Make sure the cursor refers to the current content of the data source.
+        if self._flush_scheduled and self.native.is_attached:
+            self._flush()
+
+        if self.native.row_count == 0:
+            selection = None
+        else:
+            selection = self.native.cursor_row
+
+        if self.interface.multiple_select:
+            # DataTable only supports a single cursor.
+            return [] if selection is None else [selection]
+        return selection
+
+    def scroll_to_row(self, row):
+        # Every row is a single line high.
+        self.native.scroll_to(y=row, animate=False)
+
+    def insert_column(self, index, heading, accessor):
+        # Adding/removing a column means completely rebuilding the table
+        self.change_source(self.interface.data)
+
+    def remove_column(self, index):
+        self.change_source(self.interface.data)
+
+    def rehint(self):
+        self.interface.intrinsic.width = at_least(
+            self.scale_in_horizontal(self.interface._MIN_WIDTH)
+        )
+        self.interface.intrinsic.height = at_least(
+            self.scale_in_vertical(self.interface._MIN_HEIGHT)
+        )
@@ -0,0 +1,195 @@
+from travertino.size import at_least
+
+from textual.widgets import Tree as TextualTree
+
+from .base import Widget
+from .table import cell_text
+
+
+class TogaTree(TextualTree):
+    def __init__(self, impl):
+        super().__init__("")
+        self.show_root = False
+        self.interface = impl.interface
+        self.impl = impl
+
+    def on_tree_node_expanded(self, event: TextualTree.NodeExpanded) -> None:
+        self.impl._load_children(event.node)
+
+    def on_tree_node_highlighted(self, event: TextualTree.NodeHighlighted) -> None:
+        self.interface.on_select()
+
+    def on_tree_node_selected(self, event: TextualTree.NodeSelected) -> None:
+        self.interface.on_activate(node=event.node.data)
+
+
+class Tree(Widget):
+    def create(self):
+        self.native = TogaTree(self)
+
+        # A map of the id of a source node to the tree node displaying it. Tree nodes
+        # are only created for the children of nodes that have been expanded.
+        self._tree_nodes = {}
+        # The ids of source nodes whose children have been added to the tree.
+        self._loaded = set()
+
+    def _label(self, item):
+        # Textual's tree only has a single column; show the columns side by side.
+        return "  ".join(
+            cell_text(item, accessor, self.interface.missing_value)
+            for accessor in self.interface.accessors
+        )
+
+    def _add_node(self, tree_node, item, before=None):
+        child = tree_node.add(
+            self._label(item),
+            data=item,
+            before=before,
+            allow_expand=item.can_have_children(),
+        )
+        self._tree_nodes[id(item)] = child
+        return child
+
+    def _load_children(self, tree_node):
+        item = tree_node.data
+        if item is not None and id(item) not in self._loaded:
+            self._loaded.add(id(item))
+            for child in item:
+                self._add_node(tree_node, child)
+
+    def _forget(self, tree_node):
+        # Remove a tree node, and all its materialized descendants, from the index.
+        for child in tree_node.children:
+            self._forget(child)
+        self._tree_nodes.pop(id(tree_node.data), None)
+        self._loaded.discard(id(tree_node.data))
+
+    def _materialize(self, item):
+        """Return the tree node for a source node, creating the tree nodes for that
+        node and its ancestors if required."""
+        if item is None:
+            return self.native.root
+
+        try:
+            return self._tree_nodes[id(item)]
+        except KeyError:
+            self._load_children(self._materialize(item._parent))
+            return self._tree_nodes[id(item)]
+
+    def change_source(self, source):
+        self.clear()
+        self.interface.on_select()
+
+    def insert(self, parent, index, item):
+        if parent is None:
+            tree_node = self.native.root
+        else:
+            try:
+                tree_node = self._tree_nodes[id(parent)]
+            except KeyError:
+                # The parent hasn't been displayed; the new node will be added when
+                # the parent is expanded.
+                return
+
+            tree_node.allow_expand = parent.can_have_children()
+            if id(parent) not in self._loaded:
+                return
+
+        if index < len(tree_node.children):
+            self._add_node(tree_node, item, before=index)
+        else:
+            self._add_node(tree_node, item)
+
+    def change(self, item):
+        try:
+            tree_node = self._tree_nodes[id(item)]
+        except KeyError:
+            # The item may be a new node that has replaced a node in the source.
+            parent = item._parent
+            if parent is None:
+                parent_node = self.native.root
+                index = self.interface.data.index(item)
+            elif id(parent) in self._loaded:
+                parent_node = self._tree_nodes[id(parent)]
+                index = parent.index(item)
+            else:
+                # The parent hasn't been displayed.
+                return
+
+            tree_node = parent_node.children[index]
+            self._forget(tree_node)
+            tree_node.remove_children()
+            tree_node.data = item
+            self._tree_nodes[id(item)] = tree_node
+
+        tree_node.set_label(self._label(item))
+        tree_node.allow_expand = item.can_have_children()
+
+    def remove(self, parent, index, item):
+        try:
+            tree_node = self._tree_nodes[id(item)]
+        except KeyError:
+            pass
+        else:
+            self._forget(tree_node)
+            tree_node.remove()
+
+    def clear(self):
+        self.native.clear()
+        self._tree_nodes = {}
+        self._loaded = set()
+        for item in self.interface.data:
+            self._add_node(self.native.root, item)
+
+    def get_selection(self):
+        tree_node = self.native.cursor_node
+        selection = None if tree_node is None else tree_node.data
+
+        if self.interface.multiple_select:
+            # Textual's tree only supports a single cursor.
+            return [] if selection is None else [selection]
+        return selection
+
+    def expand_node(self, node):
+        tree_node = self._materialize(node)
+        self._load_children(tree_node)
+        tree_node.expand()
+
+    def expand_all(self):
+        def expand(tree_node):
+            self._load_children(tree_node)
+            for child in tree_node.children:
+                if child.allow_expand:
+                    expand(child)
+
+        expand(self.native.root)
+        self.native.root.expand_all()
+
+    def collapse_node(self, node):
+        try:
+            self._tree_nodes[id(node)].collapse()
+        except KeyError:
+            # A node that has never been displayed can't be expanded.
+            pass
+
+    def collapse_all(self):
+        for tree_node in self.native.root.children:
+            tree_node.collapse_all()
+
+    def insert_column(self, index, heading, accessor):
+        self._refresh_labels()
+
+    def remove_column(self, index):
+        self._refresh_labels()
+
+    def _refresh_labels(self):
+        for tree_node in self._tree_nodes.values():
+            tree_node.set_label(self._label(tree_node.data))
+
+    def rehint(self):
+        self.interface.intrinsic.width = at_least(
+            self.scale_in_horizontal(self.interface._MIN_WIDTH)
+        )
+        self.interface.intrinsic.height = at_least(
+            self.scale_in_vertical(self.interface._MIN_HEIGHT)
+        )
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from textual.app import App as TextualApp
+
+# The widgets under test are created with the Textual backend, and mounted in a
+# minimal Textual app that is driven by Textual's pilot.
+os.environ["TOGA_BACKEND"] = "toga_textual"
+
+
+class HostApp(TextualApp):
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+
+    def compose(self):
+        yield self.widget._impl.native
+
+
+@pytest.fixture
+def host():
+    """Mount a Toga widget in a Textual app, returning a Textual pilot."""
+
+    def host(widget):
+        return HostApp(widget).run_test()
+
+    return host
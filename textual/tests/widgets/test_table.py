@@ -0,0 +1,137 @@
+import toga
+from toga.sources import ListSource
+
+
+def rows(table):
+    native = table._impl.native
+    return [native.get_row_at(index) for index in range(native.row_count)]
+
+
+def build_table():
+    return toga.Table(
+        headings=["Name", "Value"],
+        data=[("first", 1), ("second", 2), ("third", 3)],
+        missing_value="-",
+    )
+
+
+async def test_initial_rows(host):
+    """The rows of the source are displayed once the table is mounted."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+        assert rows(table) == [["first", "1"], ["second", "2"], ["third", "3"]]
+        assert table._impl.native.show_header
+
+
+async def test_append(host):
+    """Rows appended to the source are added without rebuilding the table."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+        table._impl.native.cursor_coordinate = (1, 0)
+
+        table.data.append(("fourth", 4))
+        table.data.append(("fifth", None))
+        await pilot.pause()
+
+        assert rows(table)[3:] == [["fourth", "4"], ["fifth", "-"]]
+        # The table wasn't rebuilt, so the cursor hasn't moved.
+        assert table.selection == table.data[1]
+
+
+async def test_insert(host):
+    """Rows inserted into the middle of the source are displayed in order."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+
+        table.data.insert(1, ("inserted", 0))
+        await pilot.pause()
+
+        assert rows(table) == [
+            ["first", "1"],
+            ["inserted", "0"],
+            ["second", "2"],
+            ["third", "3"],
+        ]
+
+
+async def test_change(host):
+    """Changing a row updates its cells."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+
+        table.data[1].value = 42
+        await pilot.pause()
+
+        assert rows(table)[1] == ["second", "42"]
+
+
+async def test_remove(host):
+    """Removing a row removes it from the table."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+
+        # A row that is changed and then removed in the same batch is removed.
+        table.data[1].value = 42
+        table.data.remove(table.data[1])
+        await pilot.pause()
+
+        assert rows(table) == [["first", "1"], ["third", "3"]]
+
+
+async def test_clear(host):
+    """Clearing the source removes all rows; rows can then be added again."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+
+        table.data.clear()
+        await pilot.pause()
+        assert rows(table) == []
+        assert table.selection is None
+
+        table.data.append(("new", 1))
+        await pilot.pause()
+        assert rows(table) == [["new", "1"]]
+
+
+async def test_batched_updates(host):
+    """Several updates made before a refresh are applied together."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+
+        table.data.clear()
+        table.data.append(("new", 1))
+        table.data.append(("newer", 2))
+        table.data[0].value = 10
+        await pilot.pause()
+
+        assert rows(table) == [["new", "10"], ["newer", "2"]]
+
+
+async def test_change_source(host):
+    """Replacing the data source rebuilds the table."""
+    table = build_table()
+    async with host(table) as pilot:
+        await pilot.pause()
+
+        table.data = ListSource(accessors=["name", "value"], data=[("other", 9)])
+        await pilot.pause()
+
+        assert rows(table) == [["other", "9"]]
+
+
+async def test_updates_before_mount(host):
+    """Updates made before the table is mounted are applied on mount."""
+    table = build_table()
+    table.data.append(("fourth", 4))
+    table.data.remove(table.data[0])
+
+    async with host(table) as pilot:
+        await pilot.pause()
+        assert rows(table) == [["second", "2"], ["third", "3"], ["fourth", "4"]]
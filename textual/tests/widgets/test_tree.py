@@ -0,0 +1,159 @@
+import toga
+
+
+def labels(tree_node):
+    """The labels of the materialized descendants of a Textual tree node."""
+    return {
+        str(child.label): labels(child) if child.children else None
+        for child in tree_node.children
+    }
+
+
+def build_tree():
+    return toga.Tree(
+        headings=["Name"],
+        data={
+            ("first",): [(("first.a",), None), (("first.b",), None)],
+            ("second",): [(("second.a",), None)],
+            ("leaf",): None,
+        },
+    )
+
+
+async def test_lazy_children(host):
+    """The children of a node are only materialized when it is expanded."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+        root = tree._impl.native.root
+
+        assert labels(root) == {"first": None, "second": None, "leaf": None}
+        assert root.children[0].allow_expand
+        assert not root.children[2].allow_expand
+
+        root.children[0].expand()
+        await pilot.pause()
+        assert labels(root) == {
+            "first": {"first.a": None, "first.b": None},
+            "second": None,
+            "leaf": None,
+        }
+
+        # Expanding a node that has never been displayed materializes its ancestors.
+        tree.collapse()
+        tree.expand(tree.data[1][0])
+        await pilot.pause()
+        assert labels(root)["second"] == {"second.a": None}
+
+
+async def test_expand_all(host):
+    """Expanding all nodes materializes the whole tree."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+
+        tree.expand()
+        await pilot.pause()
+        assert labels(tree._impl.native.root) == {
+            "first": {"first.a": None, "first.b": None},
+            "second": {"second.a": None},
+            "leaf": None,
+        }
+
+
+async def test_insert(host):
+    """Nodes inserted into the source are added at the right position."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+        root = tree._impl.native.root
+        tree.expand(tree.data[0])
+
+        tree.data.insert(1, {"name": "inserted"})
+        tree.data[0].insert(0, {"name": "first.0"})
+        # The children of an unexpanded node are only added when it is expanded.
+        tree.data[2].append({"name": "second.b"})
+        await pilot.pause()
+
+        assert list(labels(root)) == ["first", "inserted", "second", "leaf"]
+        assert list(labels(root)["first"]) == ["first.0", "first.a", "first.b"]
+        assert labels(root)["second"] is None
+
+        tree.expand(tree.data[2])
+        await pilot.pause()
+        assert list(labels(root)["second"]) == ["second.a", "second.b"]
+
+
+async def test_append(host):
+    """Nodes appended to the source are added at the end."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+        root = tree._impl.native.root
+
+        tree.data.append({"name": "last"})
+        # A leaf that gains a child can be expanded.
+        tree.data[2].append({"name": "leaf.a"})
+        await pilot.pause()
+
+        assert list(labels(root)) == ["first", "second", "leaf", "last"]
+        assert root.children[2].allow_expand
+
+
+async def test_change(host):
+    """Changing a node updates its label."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+        root = tree._impl.native.root
+
+        tree.data[0].name = "changed"
+        await pilot.pause()
+
+        assert str(root.children[0].label) == "changed"
+
+
+async def test_replace(host):
+    """Replacing a node in the source replaces its materialized children."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+        root = tree._impl.native.root
+        tree.expand(tree.data[0])
+
+        tree.data[0] = {"name": "replaced"}
+        await pilot.pause()
+
+        assert labels(root) == {"replaced": None, "second": None, "leaf": None}
+        assert not root.children[0].allow_expand
+
+
+async def test_remove(host):
+    """Removing a node removes it, and its materialized children."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+        root = tree._impl.native.root
+        tree.expand(tree.data[0])
+
+        tree.data[0].remove(tree.data[0][0])
+        tree.data.remove(tree.data[1])
+        await pilot.pause()
+
+        assert labels(root) == {"first": {"first.b": None}, "leaf": None}
+
+
+async def test_clear(host):
+    """Clearing the source removes all nodes."""
+    tree = build_tree()
+    async with host(tree) as pilot:
+        await pilot.pause()
+
+        tree.data.clear()
+        await pilot.pause()
+        assert labels(tree._impl.native.root) == {}
+        assert tree.selection is None
+
+        tree.data.append({"name": "new"})
+        await pilot.pause()
+        assert labels(tree._impl.native.root) == {"new": None}
@@ -44,6 +44,9 @@ class Widget:
             children=children,
             **properties,
         )
+        # The CSS declarations that have been applied to the element, so that later
+        # changes can be applied incrementally.
+        self._applied_css = self.interface.style._css_declarations()
 
         return native
 
@@ -89,13 +92,25 @@ class Widget:
     ######################################################################
     # APPLICATOR
     #
-    # Web style is a little different to other platforms; we if there's
-    # any change, we can just re-set the CSS styles and the browser
-    # will reflect those changes as needed.
+    # Web style is a little different to other platforms; if there's
+    # any change, we can just re-set the CSS declarations that changed,
+    # and the browser will reflect those changes as needed.
     ######################################################################
 
     def _reapply_style(self):
-        self.native.style = self.interface.style.__css__()
+        declarations = self.interface.style._css_declarations()
+        if declarations is self._applied_css:
+            # The style hasn't changed since it was applied.
+            return
+
+        # Only apply the declarations that differ from those applied to the element.
+        for name, value in declarations.items():
+            if self._applied_css.get(name) != value:
+                self.native.style.setProperty(name, value)
+        for name in self._applied_css:
+            if name not in declarations:
+                self.native.style.removeProperty(name)
+        self._applied_css = declarations
 
     def set_bounds(self, x, y, width, height):
         self._reapply_style()
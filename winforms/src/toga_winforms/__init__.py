@@ -35,4 +35,8 @@ if SetProcessDpiAwarenessContext is not None:
     ):  # pragma: no cover
         print("WARNING: Failed to set the DPI Awareness mode for the app.")
 
-__version__ = toga._package_version(__file__, __name__)
+
+def __getattr__(name):
+    if name == "__version__":
+        return toga._version(__file__, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -51,6 +51,9 @@ class Container(Scalable):
         if force_refresh and self.content:
             self.content.interface.refresh()
 
+    def refreshing(self):
+        pass
+
     def refreshed(self):
         layout = self.content.interface.layout
         self.apply_layout(layout.width, layout.height)
@@ -61,6 +61,40 @@ class MultilineTextInput(TextInput):
             self._set_placeholder_visible(False)
             self.native.Text = value
 
+    def append(self, value):
+        if self._placeholder_visible:
+            self.set_value(value)
+            return
+
+        # Only follow the new text if the view is already scrolled to the bottom;
+        # i.e., the end of the text is visible.
+        at_bottom = (
+            self.native.GetPositionFromCharIndex(self.native.TextLength).Y
+            <= self.native.ClientSize.Height
+        )
+        self.native.AppendText(value)
+        if at_bottom:
+            self.scroll_to_bottom()
+
+    def remove_lines(self, count):
+        # Lines are separated by a single newline character in a RichTextBox.
+        lines = self.native.Lines
+        length = sum(len(lines[i]) + 1 for i in range(count))
+
+        # Replacing the selection only passes the change to the native widget, rather
+        # than replacing the whole value. A read-only RichTextBox ignores changes to
+        # the selected text, so the widget is made editable while the lines are
+        # removed.
+        selection = (self.native.SelectionStart, self.native.SelectionLength)
+        readonly = self.native.ReadOnly
+        self.native.ReadOnly = False
+        self.native.Select(0, length)
+        self.native.SelectedText = ""
+        self.native.ReadOnly = readonly
+
+        # Keep the selection on the same text, if it wasn't removed.
+        self.native.Select(max(selection[0] - length, 0), selection[1])
+
     # This method is necessary to override the TextInput base class.
     def rehint(self):
         self.interface.intrinsic.width = at_least(self.interface._MIN_WIDTH)
@@ -69,7 +103,7 @@ class MultilineTextInput(TextInput):
     def winforms_text_changed(self, sender, event):
         # Showing and hiding the placeholder should not cause an interface event.
         if not self._placeholder_visible:
-            self.interface.on_change()
+            self.interface._value_changed()
 
     def _set_placeholder_visible(self, visible):
         # Changing ForeColor causes a native TextChanged event, so the order of these
@@ -40,7 +40,7 @@ class ScrollContainer(Widget, Container):
         self.native.MouseWheel += WeakrefCallable(self.winforms_scroll)
 
     def winforms_scroll(self, sender, event):
-        self.interface.on_scroll()
+        self.interface._scrolled()
 
     def set_bounds(self, x, y, width, height):
         super().set_bounds(x, y, width, height)
@@ -48,6 +48,7 @@ class ScrollContainer(Widget, Container):
             self.scale_in(width, ROUND_DOWN),
             self.scale_in(height, ROUND_DOWN),
         )
+        self.interface._resized()
 
     def refreshed(self):
         full_width, full_height = (self.native_width, self.native_height)
@@ -96,7 +97,7 @@ class ScrollContainer(Widget, Container):
     def set_horizontal(self, value):
         self.horizontal = value
         if not value:
-            self.interface.on_scroll()
+            self.interface._scrolled()
         if self.interface.content:
             self.interface.content.refresh()
 
@@ -106,7 +107,7 @@ class ScrollContainer(Widget, Container):
     def set_vertical(self, value):
         self.vertical = value
         if not value:
-            self.interface.on_scroll()
+            self.interface._scrolled()
         if self.interface.content:
             self.interface.content.refresh()
 
@@ -131,4 +132,4 @@ class ScrollContainer(Widget, Container):
             self.scale_in(horizontal_position),
             self.scale_in(vertical_position),
         )
-        self.interface.on_scroll()
+        self.interface._scrolled()